@@ -1,6 +1,7 @@
 from importlib import metadata
 
-from .dataframe import DataFrame
+from .dataframe import DataFrame, DataFrameView
+from .mask import Mask
 from .series import Series, ViewSeries
 
 # if running in development there may not be a package
@@ -9,4 +10,4 @@ try:
 except metadata.PackageNotFoundError:
     __version__ = 'development'
 
-__all__ = ['DataFrame', 'Series', 'ViewSeries']
+__all__ = ['DataFrame', 'DataFrameView', 'Mask', 'Series', 'ViewSeries']
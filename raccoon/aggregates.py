@@ -0,0 +1,193 @@
+"""
+RunningAggregate class, the running count, sum, sum of squares, min and max kept for a DataFrame or Series column
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from heapq import heapify, heappop, heappush
+from math import sqrt
+from typing import Any, Iterable
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value != value  # NaN is the only value not equal to itself
+
+
+class RunningAggregate:
+    """
+    Running count, sum, sum of squares, min and max of a set of numeric values that is updated as values are added,
+    removed and replaced. The count, sum and sum of squares update in constant time. The min and max are kept in heaps
+    where removed values are discarded lazily when they reach the top, so reading any of the aggregates never needs
+    the original values. None and NaN values are treated as missing and are not included.
+
+    Use DataFrame.add_aggregate() or Series.add_aggregate() to attach one to a column so it is kept in sync with the
+    data.
+    """
+
+    __slots__ = ["_count", "_sum", "_sumsq", "_min_heap", "_max_heap", "_min_removed", "_max_removed"]
+
+    def __init__(self, values: Iterable[Any] = ()):
+        """
+        :param values: (optional) iterable of initial values
+        """
+        self._count = 0
+        self._sum: Any = 0
+        self._sumsq: Any = 0
+        self._min_heap: list[Any] = []
+        self._max_heap: list[Any] = []
+        self._min_removed: Counter[Any] = Counter()
+        self._max_removed: Counter[Any] = Counter()
+        self.extend(values)
+
+    def __repr__(self) -> str:
+        return "RunningAggregate(count=%s, sum=%s, min=%s, max=%s)" % (self._count, self._sum, self.min, self.max)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> Any:
+        return self._sum
+
+    @property
+    def sumsq(self) -> Any:
+        return self._sumsq
+
+    @property
+    def mean(self) -> float | None:
+        return self._sum / self._count if self._count else None
+
+    @property
+    def variance(self) -> float | None:
+        """
+        Sample variance, or None if there are fewer than two values
+        """
+        if self._count < 2:
+            return None
+        return max((self._sumsq - self._sum * self._sum / self._count) / (self._count - 1), 0.0)
+
+    @property
+    def std(self) -> float | None:
+        """
+        Sample standard deviation, or None if there are fewer than two values
+        """
+        variance = self.variance
+        return None if variance is None else sqrt(variance)
+
+    @property
+    def min(self) -> Any:
+        heap, removed = self._min_heap, self._min_removed
+        while heap and removed[heap[0]]:
+            removed[heappop(heap)] -= 1
+        return heap[0] if heap else None
+
+    @property
+    def max(self) -> Any:
+        heap, removed = self._max_heap, self._max_removed
+        while heap and removed[-heap[0]]:
+            removed[-heappop(heap)] -= 1
+        return -heap[0] if heap else None
+
+    def add(self, value: Any) -> None:
+        """
+        Add a value.
+
+        :param value: value to add
+        :return: nothing
+        """
+        if _is_missing(value):
+            return
+        total = self._sum + value  # a value that cannot be added raises before anything changes
+        sumsq = self._sumsq + value * value
+        self._count += 1
+        self._sum = total
+        self._sumsq = sumsq
+        heappush(self._min_heap, value)
+        heappush(self._max_heap, -value)
+
+    def check(self, values: Iterable[Any]) -> None:
+        """
+        Check the values can be added without adding them, so the owner of the data can reject a value that is not
+        numeric before it changes anything. Raises TypeError for a value that cannot be added.
+
+        :param values: iterable of values
+        :return: nothing
+        """
+        for value in values:
+            if not _is_missing(value):
+                _ = self._sum + value, value * value, value < value  # value < value checks it can go in the heaps
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """
+        Add all the values.
+
+        :param values: iterable of values
+        :return: nothing
+        """
+        for value in values:
+            self.add(value)
+
+    def remove(self, value: Any) -> None:
+        """
+        Remove a value that was previously added.
+
+        :param value: value to remove
+        :return: nothing
+        """
+        if _is_missing(value):
+            return
+        total = self._sum - value
+        sumsq = self._sumsq - value * value
+        self._count -= 1
+        self._sum = total
+        self._sumsq = sumsq
+        self._min_removed[value] += 1
+        self._max_removed[value] += 1
+        if len(self._min_heap) > 2 * self._count + 16:
+            self._compact()
+
+    def replace(self, old: Any, new: Any) -> None:
+        """
+        Replace a value that was previously added with a new value.
+
+        :param old: value to remove
+        :param new: value to add
+        :return: nothing
+        """
+        self.add(new)  # first, so a new value that cannot be added leaves the aggregate unchanged
+        self.remove(old)
+
+    def clear(self) -> None:
+        """
+        Remove all values.
+
+        :return: nothing
+        """
+        self._count = 0
+        self._sum = 0
+        self._sumsq = 0
+        self._min_heap = []
+        self._max_heap = []
+        self._min_removed = Counter()
+        self._max_removed = Counter()
+
+    def _compact(self) -> None:
+        """
+        Rebuild the heaps without the removed values so they do not grow without bound when many values that are not
+        the min or max are removed.
+        """
+        removed = self._min_removed
+        live = []
+        for value in self._min_heap:
+            if removed[value]:
+                removed[value] -= 1
+            else:
+                live.append(value)
+        heapify(live)
+        self._min_heap = live
+        self._max_heap = [-x for x in live]
+        heapify(self._max_heap)
+        self._min_removed = Counter()
+        self._max_removed = Counter()
@@ -0,0 +1,211 @@
+"""
+Conversion of DataFrames to and from Apache Arrow tables, used by DataFrame.to_arrow() and from_arrow(). This requires
+the optional pyarrow package. Typed array columns are wrapped as Arrow arrays over the same memory without a copy,
+list columns are converted by pyarrow in a single pass.
+
+The meta data is kept in the schema metadata as JSON, so reading a table from an untrusted source never runs code. The
+column and index names must be str, int, float, bool, None or tuples of those to be kept.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array, typecodes
+from math import nan
+from typing import Any, Sequence
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional
+    pa = None
+
+# key in the schema metadata of the raccoon meta data needed to rebuild the DataFrame
+METADATA_KEY = b"raccoon"
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("pyarrow is required for Arrow conversion, install it with: pip install raccoon[arrow]")
+
+
+def _arrow_type(values: array) -> Any:
+    """
+    Return the Arrow type of the items of an array.
+    """
+    bits = values.itemsize * 8
+    if values.typecode in "fd":
+        return pa.float32() if bits == 32 else pa.float64()
+    return getattr(pa, ("int%s" if values.typecode in "bhilq" else "uint%s") % bits)()
+
+
+def _encode_name(name: Any) -> Any:
+    """
+    Return a column or index name as a JSON value, a tuple is a dict with the list of its items.
+    """
+    if isinstance(name, tuple):
+        return {"tuple": [_encode_name(x) for x in name]}
+    if name is None or isinstance(name, (str, int, float, bool)):
+        return name
+    raise TypeError("cannot keep a name of type %s in the Arrow metadata" % type(name).__name__)
+
+
+def _decode_name(value: Any) -> Any:
+    """
+    Return the column or index name of a JSON value made by _encode_name().
+    """
+    if isinstance(value, dict):
+        return tuple(_decode_name(x) for x in value["tuple"])
+    if isinstance(value, list):
+        raise ValueError("a name cannot be a list")
+    return value
+
+
+def encode_metadata(meta_data: dict[str, Any], index: bool) -> bytes:
+    """
+    Return the meta data as JSON bytes for the schema metadata.
+
+    :param meta_data: dict of the DataFrame meta data
+    :param index: True if the first column of the table is the index
+    :return: bytes
+    """
+    saved = {
+        "index": index,
+        "index_name": _encode_name(meta_data["index_name"]),
+        "columns": [_encode_name(x) for x in meta_data["columns"]],
+        "sort": meta_data["sort"],
+        "storage": meta_data["storage"],
+        "dtypes": [[_encode_name(k), v] for k, v in meta_data["dtypes"].items()],
+    }
+    return json.dumps(saved).encode()
+
+
+def decode_metadata(metadata: bytes, count: int) -> tuple[dict[str, Any], bool]:
+    """
+    Return the meta data from the JSON bytes made by encode_metadata(). Raises ValueError if the metadata cannot be
+    read or does not match the table.
+
+    :param metadata: bytes
+    :param count: number of columns of the table
+    :return: tuple of (meta data dict, True if the first column of the table is the index)
+    """
+    try:
+        saved = json.loads(metadata)
+        columns = [_decode_name(x) for x in saved["columns"]]
+        meta_data = {
+            "index_name": _decode_name(saved["index_name"]),
+            "columns": columns,
+            "sort": saved["sort"],
+            "storage": saved["storage"],
+            "dtypes": {_decode_name(k): v for k, v in saved["dtypes"]},
+        }
+        index = saved["index"]
+        valid = (
+            isinstance(index, bool)
+            and isinstance(meta_data["sort"], bool)
+            and meta_data["storage"] in ("list", "blocked")
+            and len(columns) + index == count
+            and len(set(columns)) == len(columns)
+            and all(
+                k in columns and isinstance(v, str) and len(v) == 1 and v in typecodes
+                for k, v in meta_data["dtypes"].items()
+            )
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("cannot read the raccoon metadata of the Arrow table") from e
+    if not valid:
+        raise ValueError("the raccoon metadata of the Arrow table does not match the table")
+    return meta_data, index
+
+
+def to_arrow_array(values: Sequence[Any]) -> Any:
+    """
+    Return an Arrow array of the values. An array.array is wrapped without a copy, the Arrow array holds a reference to
+    it so the memory stays valid.
+
+    :param values: list, BlockedList or array
+    :return: pyarrow Array
+    """
+    if isinstance(values, array):
+        return pa.Array.from_buffers(_arrow_type(values), len(values), [None, pa.py_buffer(values)])
+    return pa.array(values if isinstance(values, list) else list(values))
+
+
+def to_table(meta_data: dict[str, Any], index: Sequence[Any] | None, columns: list[Any], data: list[Any]) -> Any:
+    """
+    Return an Arrow table of the columns. The Arrow column names are the string of the column names, the original names
+    and the meta data are kept in the schema metadata so from_table() can rebuild the DataFrame exactly.
+
+    :param meta_data: dict of the DataFrame meta data
+    :param index: index values, or None to not include the index
+    :param columns: list of column names
+    :param data: list of the column values
+    :return: pyarrow Table
+    """
+    _require_pyarrow()
+    names = [str(x) for x in columns]
+    arrays = [to_arrow_array(x) for x in data]
+    if index is not None:
+        index_name = str(meta_data["index_name"])
+        while index_name in names:  # do not clash with a column name
+            index_name = "_" + index_name
+        names.insert(0, index_name)
+        arrays.insert(0, to_arrow_array(index))
+    metadata = {METADATA_KEY: encode_metadata(meta_data, index is not None)}
+    return pa.Table.from_arrays(arrays, names=names, metadata=metadata)
+
+
+def from_arrow_array(values: Any, typecode: str | None = None) -> list[Any] | array:
+    """
+    Return the values of an Arrow array or chunked array as a list, or as an array of the typecode. Numeric chunks
+    without nulls are copied into the array straight from the Arrow buffer. Nulls are NaN for float typecodes and
+    raise an error for integer typecodes.
+
+    :param values: pyarrow Array or ChunkedArray
+    :param typecode: (optional) array typecode
+    :return: list or array
+    """
+    if typecode is None:
+        return values.to_pylist()
+    result = array(typecode)
+    chunks = values.chunks if isinstance(values, pa.ChunkedArray) else [values]
+    for chunk in chunks:
+        if chunk.null_count == 0 and chunk.type == _arrow_type(result):
+            start = chunk.offset * result.itemsize
+            result.frombytes(memoryview(chunk.buffers()[1])[start : start + len(chunk) * result.itemsize])
+        elif typecode in "fd":
+            result.extend([nan if x is None else x for x in chunk.to_pylist()])
+        elif chunk.null_count:
+            raise ValueError("integer typecode %r column cannot have missing values" % typecode)
+        else:
+            result.extend(chunk.to_pylist())
+    return result
+
+
+def from_table(table: Any, index_col: str | None = None) -> tuple[dict[str, Any], list[Any] | None, dict[Any, Any]]:
+    """
+    Read the meta data, index and columns from an Arrow table. If the table was made by to_table() then the original
+    column names and meta data are restored from the schema metadata. Raises ValueError if that metadata cannot be
+    read, as it may come from any Arrow, Parquet or IPC producer.
+
+    :param table: pyarrow Table
+    :param index_col: (optional) name of the Arrow column to use as the index. If None then the index and meta data
+        saved by to_table() are used if there are any
+    :return: tuple of (meta data dict, index list or None, dict of column name to values)
+    """
+    _require_pyarrow()
+    metadata = table.schema.metadata or {}
+    names = table.column_names
+    if METADATA_KEY in metadata and index_col is None:
+        meta_data, has_index = decode_metadata(metadata[METADATA_KEY], len(names))
+        columns = meta_data["columns"]
+        data_names = names[1:] if has_index else names
+        index = from_arrow_array(table.column(0)) if has_index else None
+    else:
+        columns = data_names = [x for x in names if x != index_col]
+        meta_data = {"index_name": "index" if index_col is None else index_col, "columns": columns}
+        index = None if index_col is None else from_arrow_array(table.column(index_col))
+    dtypes = meta_data.get("dtypes", {})
+    data = {
+        column: from_arrow_array(table.column(name), dtypes.get(column)) for column, name in zip(columns, data_names)
+    }
+    return meta_data, index, data
@@ -0,0 +1,16 @@
+"""
+Benchmark suite of the raccoon DataFrame. Run it with:
+
+    python -m raccoon.bench --output results.json
+
+The scenarios cover the speed test of the examples/speed_test.ipynb notebook, which are initialize, add rows by set,
+append, get, set, sort, iterators, insert in the middle and time series append, and also lookups, deletes, slicing and
+serialization. The results are written as JSON. Saving the results of one run and passing them as the baseline of a
+later run with --baseline compares the two, and any scenario that is slower than the baseline by more than the
+threshold fails the run with a non zero exit code.
+"""
+
+from raccoon.bench.runner import compare, load_results, main, run
+from raccoon.bench.scenarios import SCENARIOS
+
+__all__ = ["SCENARIOS", "compare", "load_results", "main", "run"]
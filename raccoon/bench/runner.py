@@ -0,0 +1,130 @@
+"""
+Run the benchmark scenarios, write the results and compare them to a baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime, timezone
+
+from tabulate import tabulate
+
+from raccoon.bench.scenarios import SCENARIOS
+
+
+def run(names: list[str] | None = None, scale: float = 1.0, repeat: int = 5) -> dict[str, float]:
+    """
+    Run the scenarios and return the best time in seconds of each.
+
+    :param names: (optional) list of scenario names, if None then all of them
+    :param scale: multiplier of the sizes of the scenarios, less than 1 for a quick run
+    :param repeat: number of times to time each scenario, the best time is kept
+    :return: dict of scenario name to seconds
+    """
+    names = list(SCENARIOS) if names is None else names
+    for name in names:
+        if name not in SCENARIOS:
+            raise ValueError("%r is not a scenario, the scenarios are %s" % (name, list(SCENARIOS)))
+    results = {}
+    for name in names:
+        function = SCENARIOS[name](scale)
+        results[name] = min(timeit.repeat(function, repeat=repeat, number=1))
+    return results
+
+
+def environment() -> dict[str, str]:
+    """
+    Return a dict of the details of the machine and versions the results are from.
+
+    :return: dict
+    """
+    from raccoon import __version__
+
+    return {
+        "raccoon": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def load_results(path: str) -> dict[str, float]:
+    """
+    Return the results of a JSON file written by the benchmark run.
+
+    :param path: path of the file
+    :return: dict of scenario name to seconds
+    """
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float = 1.5
+) -> list[tuple[str, float, float, float, bool]]:
+    """
+    Compare the results to the baseline for the scenarios in both.
+
+    :param results: dict of scenario name to seconds
+    :param baseline: dict of scenario name to seconds of the baseline
+    :param threshold: ratio of the time to the baseline time above which a scenario is a regression
+    :return: list of (name, seconds, baseline seconds, ratio, is regression) tuples
+    """
+    rows = []
+    for name, seconds in results.items():
+        if name in baseline:
+            ratio = seconds / baseline[name] if baseline[name] else float("inf")
+            rows.append((name, seconds, baseline[name], ratio, ratio > threshold))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point of python -m raccoon.bench
+
+    :param argv: (optional) list of the arguments, if None then sys.argv
+    :return: exit code, 1 if there are regressions against the baseline, otherwise 0
+    """
+    parser = argparse.ArgumentParser(prog="python -m raccoon.bench", description="raccoon benchmark suite")
+    parser.add_argument("scenarios", nargs="*", help="names of the scenarios to run, all if none")
+    parser.add_argument("-o", "--output", help="path of the JSON file to write the results to")
+    parser.add_argument("-b", "--baseline", help="path of a JSON results file to compare against")
+    parser.add_argument("-t", "--threshold", type=float, default=1.5, help="slowdown ratio that fails, default 1.5")
+    parser.add_argument("-s", "--scale", type=float, default=1.0, help="multiplier of the scenario sizes")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="times to run each scenario, best is kept")
+    parser.add_argument("-l", "--list", action="store_true", help="list the scenarios and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(SCENARIOS))
+        return 0
+
+    results = run(args.scenarios or None, args.scale, args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "scale": args.scale, "results": results}, file, indent=2)
+
+    if not args.baseline:
+        print(tabulate([(name, "%.6f" % x) for name, x in results.items()], headers=["scenario", "seconds"]))
+        return 0
+
+    rows = compare(results, load_results(args.baseline), args.threshold)
+    table = [
+        (name, "%.6f" % x, "%.6f" % y, "%.2f" % ratio, "REGRESSION" if slow else "") for name, x, y, ratio, slow in rows
+    ]
+    print(tabulate(table, headers=["scenario", "seconds", "baseline", "ratio", ""]))
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(
+            "\n%s scenarios slower than %sx the baseline: %s"
+            % (len(regressions), args.threshold, ", ".join(regressions)),
+            file=sys.stderr,
+        )
+        return 1
+    return 0
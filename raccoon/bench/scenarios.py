@@ -0,0 +1,417 @@
+"""
+Benchmark scenarios. Each scenario is a setup function that takes the scale of the sizes and returns the function to
+time. The setup builds the data that is only read, the timed function does all the work that changes it so the timed
+function can be run again and again.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from raccoon.dataframe import DataFrame
+
+Setup = Callable[[float], Callable[[], Any]]
+
+# scenarios by name in the order they are run
+SCENARIOS: dict[str, Setup] = {}
+
+
+def scenario(name: str) -> Callable[[Setup], Setup]:
+    """
+    Decorator that adds a setup function to SCENARIOS.
+
+    :param name: name of the scenario in the results
+    :return: decorator
+    """
+
+    def register(setup: Setup) -> Setup:
+        SCENARIOS[name] = setup
+        return setup
+
+    return register
+
+
+def _size(count: int, scale: float) -> int:
+    return max(int(count * scale), 1)
+
+
+def _grid(rows: int, columns: int, start: int = 0, step: int = 1) -> dict[str, list[int]]:
+    values = list(range(start, start + rows * step, step))
+    return {"a" + str(x): values.copy() for x in range(columns)}
+
+
+def _frame(rows: int, columns: int, **kwargs: Any) -> DataFrame:
+    grid = _grid(rows, columns)
+    return DataFrame(data=grid, columns=sorted(grid), **kwargs)
+
+
+# speed test notebook scenarios
+
+
+@scenario("initialize_empty")
+def initialize_empty(scale: float) -> Callable[[], Any]:
+    count = _size(10000, scale)
+
+    def run() -> None:
+        for _ in range(count):
+            DataFrame()
+
+    return run
+
+
+@scenario("initialize_matrix")
+def initialize_matrix(scale: float) -> Callable[[], Any]:
+    grid = _grid(_size(100, scale), 100)
+    return lambda: DataFrame(data=grid, sort=False)
+
+
+@scenario("add_rows_one_column")
+def add_rows_one_column(scale: float) -> Callable[[], Any]:
+    count = _size(10000, scale)
+
+    def run() -> None:
+        df = DataFrame()
+        for x in range(count):
+            df.set(x, "a", x)
+
+    return run
+
+
+@scenario("add_matrix")
+def add_matrix(scale: float) -> Callable[[], Any]:
+    count = _size(100, scale)
+    row = {"a" + str(x): x for x in range(100)}
+    columns = list(row)
+
+    def run() -> None:
+        df = DataFrame(columns=columns)
+        for x in range(count):
+            df.set(indexes=x, values=row)
+
+    return run
+
+
+@scenario("append")
+def append(scale: float) -> Callable[[], Any]:
+    count = _size(100, scale)
+    grid = _grid(10, 10)
+    columns = list(grid)
+
+    def run() -> None:
+        df = DataFrame(data={k: v.copy() for k, v in grid.items()}, columns=columns)
+        for x in range(count):
+            index = [(y + 1) + (x + 1) * 10 for y in range(10)]
+            df.append(DataFrame(data={k: v.copy() for k, v in grid.items()}, columns=columns, index=index))
+
+    return run
+
+
+@scenario("get_cell")
+def get_cell(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+
+    def run() -> None:
+        for c in df.columns:
+            for r in df.index:
+                df.get(r, c)
+
+    return run
+
+
+@scenario("get_column")
+def get_column(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+
+    def run() -> None:
+        for c in df.columns:
+            df.get(columns=c)
+
+    return run
+
+
+@scenario("get_column_subset")
+def get_column_subset(scale: float) -> Callable[[], Any]:
+    rows = _size(1000, scale)
+    df = _frame(rows, 100)
+    subsets = [list(range(r, min(r + 10, rows))) for r in range(0, rows, 10)]
+
+    def run() -> None:
+        for c in df.columns:
+            for subset in subsets:
+                df.get(indexes=subset, columns=c)
+
+    return run
+
+
+@scenario("get_row")
+def get_row(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+
+    def run() -> None:
+        for i in df.index:
+            df.get(indexes=i)
+
+    return run
+
+
+@scenario("set_cell")
+def set_cell(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+
+    def run() -> None:
+        for c in df.columns:
+            for r in df.index:
+                df.set(r, c, 99)
+
+    return run
+
+
+@scenario("set_column")
+def set_column(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+
+    def run() -> None:
+        for c in df.columns:
+            df.set(columns=c, values=99)
+
+    return run
+
+
+@scenario("set_column_subset")
+def set_column_subset(scale: float) -> Callable[[], Any]:
+    rows = _size(1000, scale)
+    df = _frame(rows, 100)
+    subsets = [list(range(r, min(r + 10, rows))) for r in range(0, rows, 10)]
+
+    def run() -> None:
+        for c in df.columns:
+            for subset in subsets:
+                df.set(indexes=subset, columns=c, values=list(range(len(subset))))
+
+    return run
+
+
+@scenario("set_row")
+def set_row(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+    row = {x: x for x in df.columns}
+
+    def run() -> None:
+        for i in df.index:
+            df.set(indexes=i, values=row)
+
+    return run
+
+
+@scenario("sort_index")
+def sort_index(scale: float) -> Callable[[], Any]:
+    rows = _size(1000, scale)
+    grid = _grid(rows, 100)
+    index = list(reversed(range(rows)))
+
+    def run() -> None:
+        df = DataFrame.from_columns([x.copy() for x in grid.values()], list(grid), index.copy(), validate=False)
+        df.sort_index()
+
+    return run
+
+
+@scenario("iterrows")
+def iterrows(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+    return lambda: list(df.iterrows())
+
+
+@scenario("itertuples")
+def itertuples(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 100)
+    return lambda: list(df.itertuples())
+
+
+@scenario("insert_middle")
+def insert_middle(scale: float) -> Callable[[], Any]:
+    rows = _size(500, scale)
+    grid = _grid(rows, 100, start=1, step=2)
+    row = {x: x for x in grid}
+
+    def run() -> None:
+        df = DataFrame(data={k: v.copy() for k, v in grid.items()}, columns=sorted(grid), sort=True)
+        for i in range(0, rows * 2, 2):
+            df.set(indexes=i, values=row)
+
+    return run
+
+
+@scenario("time_series_append")
+def time_series_append(scale: float) -> Callable[[], Any]:
+    start = datetime(2010, 1, 1, 9, 30)
+    dates = [start + timedelta(minutes=x) for x in range(_size(10000, scale))]
+    row = {"open": 100, "high": 101, "low": 99, "close": 100.5, "volume": 999}
+
+    def run() -> None:
+        df = DataFrame(columns=["open", "high", "low", "close", "volume"], index_name="datetime", sort=True)
+        for date in dates:
+            df.set_row(date, row)
+
+    return run
+
+
+# lookups
+
+
+@scenario("get_location")
+def get_location(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(1000, scale), 10)
+
+    def run() -> None:
+        for x in range(len(df)):
+            df.get_location(x)
+
+    return run
+
+
+@scenario("lookup_unsorted_index")
+def lookup_unsorted_index(scale: float) -> Callable[[], Any]:
+    rows = _size(10000, scale)
+    df = DataFrame({"a": list(range(rows))}, index=list(reversed(range(rows))), sort=False)
+
+    def run() -> None:
+        for x in range(rows):
+            df.get_cell(x, "a")
+
+    return run
+
+
+@scenario("lookup_sorted_index")
+def lookup_sorted_index(scale: float) -> Callable[[], Any]:
+    rows = _size(10000, scale)
+    df = DataFrame({"a": list(range(rows))}, index=list(range(rows)), sort=True)
+
+    def run() -> None:
+        for x in range(rows):
+            df.get_cell(x, "a")
+
+    return run
+
+
+@scenario("equality_scan")
+def equality_scan(scale: float) -> Callable[[], Any]:
+    rows = _size(100000, scale)
+    df = DataFrame({"a": [x % 100 for x in range(rows)]})
+
+    def run() -> None:
+        for x in range(10):
+            df.where("a", x)
+
+    return run
+
+
+@scenario("equality_indexed")
+def equality_indexed(scale: float) -> Callable[[], Any]:
+    rows = _size(100000, scale)
+    df = DataFrame({"a": [x % 100 for x in range(rows)]})
+    df.create_index("a")
+
+    def run() -> None:
+        for x in range(10):
+            df.where("a", x)
+
+    return run
+
+
+# deletes
+
+
+@scenario("delete_rows")
+def delete_rows(scale: float) -> Callable[[], Any]:
+    rows = _size(10000, scale)
+    grid = _grid(rows, 10)
+
+    def run() -> None:
+        df = DataFrame.from_columns([x.copy() for x in grid.values()], list(grid), list(range(rows)), sort=True)
+        df.delete_rows(list(range(0, rows, 3)))
+
+    return run
+
+
+@scenario("delete_rows_one_at_a_time")
+def delete_rows_one_at_a_time(scale: float) -> Callable[[], Any]:
+    rows = _size(1000, scale)
+    grid = _grid(rows, 10)
+
+    def run() -> None:
+        df = DataFrame.from_columns([x.copy() for x in grid.values()], list(grid), list(range(rows)), sort=True)
+        for x in range(0, rows, 2):
+            df.delete_rows(x)
+
+    return run
+
+
+# slicing
+
+
+@scenario("get_slice")
+def get_slice(scale: float) -> Callable[[], Any]:
+    rows = _size(10000, scale)
+    df = _frame(rows, 10, sort=True)
+
+    def run() -> None:
+        for x in range(0, rows, 100):
+            df.get_slice(x, x + 1000)
+
+    return run
+
+
+@scenario("get_slice_view")
+def get_slice_view(scale: float) -> Callable[[], Any]:
+    rows = _size(10000, scale)
+    df = _frame(rows, 10, sort=True)
+
+    def run() -> None:
+        for x in range(0, rows, 100):
+            df.get_slice(x, x + 1000, as_view=True)
+
+    return run
+
+
+@scenario("head_tail")
+def head_tail(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(10000, scale), 10, sort=True)
+
+    def run() -> None:
+        for _ in range(100):
+            df.head(10)
+            df.tail(10)
+
+    return run
+
+
+# serialization
+
+
+@scenario("json")
+def serialize_json(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(10000, scale), 10)
+    return lambda: DataFrame.from_json(df.to_json())
+
+
+@scenario("bytes")
+def serialize_bytes(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(10000, scale), 10, dtypes={"a0": "q", "a1": "q"})
+    return lambda: DataFrame.from_bytes(df.to_bytes())
+
+
+@scenario("csv")
+def serialize_csv(scale: float) -> Callable[[], Any]:
+    df = _frame(_size(10000, scale), 10)
+
+    def run() -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bench.csv")
+            df.to_csv(path)
+            DataFrame.read_csv(path, index_col="index")
+
+    return run
@@ -0,0 +1,316 @@
+"""
+BlockedList class, the list-like container used for storage="blocked" DataFrames and Series
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, MutableSequence
+from itertools import accumulate, chain
+from math import isqrt
+from typing import Any, overload
+
+# smallest block size when the block size is from the length of the list
+MIN_BLOCK_SIZE = 64
+
+
+class BlockedList[T](MutableSequence[T]):
+    """
+    List-like container that stores the values in a list of bounded blocks instead of one contiguous list. Inserting or
+    deleting in the middle of a python list moves every item after that location, so on large lists the cost grows
+    with the size of the list. In a BlockedList only the items in one block are moved, and a block is split in two
+    when it grows past twice the block size. Unless a fixed block size is given the block size is the square root of
+    the length of the list, so a list of n items has about sqrt(n) blocks of about sqrt(n) items.
+
+    The block lengths are kept in a Fenwick tree, so finding the block of a location and updating the lengths after
+    an insert or delete are both O(log blocks). Only a split or join of blocks rebuilds the tree, which happens once
+    every block size inserts or deletes at most. So an insert or delete is O(sqrt(n)) to move the items in the block,
+    and appends to the end, slices and iteration remain fast. When there are more reads than blocks since the last
+    insert or delete the start of each block is saved so reads are a single bisection until the next insert or delete.
+
+    It supports the full MutableSequence API and compares equal to a list or other sequence with the same items.
+    """
+
+    __slots__ = ["_blocks", "_block_size", "_tree", "_offsets", "_reads", "_len"]
+
+    def __init__(self, values: Iterable[T] | None = None, block_size: int | None = None):
+        """
+        :param values: (optional) iterable of initial values
+        :param block_size: (optional) target number of items in each block, if None then the square root of the length
+        """
+        if block_size is not None and block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self._blocks: list[list[T]] = []
+        self._block_size = block_size
+        self._tree: list[int] | None = [0]  # Fenwick tree of the block lengths, None when it needs rebuild
+        self._offsets: list[int] | None = []  # location of the first item of each block, None after insert or delete
+        self._reads = 0  # reads using the tree since the offsets were last valid
+        self._len = 0
+        if values is not None:
+            self.extend(values)
+
+    @property
+    def block_size(self) -> int | None:
+        return self._block_size
+
+    def _size(self, length: int) -> int:
+        """
+        Return the target number of items in each block for a list of the length.
+        """
+        return self._block_size or max(isqrt(length), MIN_BLOCK_SIZE)
+
+    @property
+    def blocks(self) -> list[list[T]]:
+        """
+        Return a view of the underlying blocks. Because this is a view any change to the return list will corrupt the
+        BlockedList.
+
+        :return: list of lists
+        """
+        return self._blocks
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return "BlockedList(%s)" % list(self)
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[T]:
+        return chain.from_iterable(reversed(block) for block in reversed(self._blocks))
+
+    def __contains__(self, value: object) -> bool:
+        return any(value in block for block in self._blocks)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BlockedList):
+            return self._len == other._len and all(a == b for a, b in zip(self, other))
+        if isinstance(other, (list, tuple)):
+            return self._len == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def _locate(self, i: int) -> tuple[int, int]:
+        """
+        For a location in the list return the block number and the location inside that block.
+
+        :param i: location, can be negative
+        :return: (block, location in block) tuple
+        """
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("list index out of range")
+        offsets = self._offsets
+        if offsets is not None:
+            b = bisect_right(offsets, i) - 1
+            return b, i - offsets[b]
+        tree = self._tree
+        if tree is None:
+            tree = self._tree = self._build_tree()
+        self._reads += 1
+        if self._reads > len(tree):  # many reads since the last insert or delete, so save the offsets
+            self._offsets = list(accumulate(map(len, self._blocks), initial=0))[:-1]
+            return self._locate(i)
+        # descend the tree for the last block that starts at or before i
+        count = len(tree) - 1
+        b = 0
+        step = 1 << (count.bit_length() - 1)
+        while step:
+            k = b + step
+            if k <= count and tree[k] <= i:
+                b = k
+                i -= tree[k]
+            step >>= 1
+        return b, i
+
+    def _build_tree(self) -> list[int]:
+        """
+        Return the Fenwick tree of the block lengths, where tree[k] is the sum of the lengths of the blocks from
+        k - (k & -k) to k - 1.
+        """
+        tree = [0] + [len(x) for x in self._blocks]
+        count = len(tree) - 1
+        for k in range(1, count + 1):
+            parent = k + (k & -k)
+            if parent <= count:
+                tree[parent] += tree[k]
+        return tree
+
+    def _tree_add(self, b: int, delta: int) -> None:
+        """
+        Add delta to the length of block b in the Fenwick tree. For the last block this only changes one entry.
+        """
+        tree = self._tree
+        if tree is None:
+            return
+        count = len(tree) - 1
+        k = b + 1
+        while k <= count:
+            tree[k] += delta
+            k += k & -k
+
+    def _tree_append(self, length: int) -> None:
+        """
+        Add a new last block of the length to the Fenwick tree.
+        """
+        tree = self._tree
+        if tree is None:
+            return
+        k = len(tree)
+        total = length
+        j = k - 1
+        while j > k - (k & -k):  # the entries that make up the blocks covered by the new entry
+            total += tree[j]
+            j -= j & -j
+        tree.append(total)
+
+    def _slice_items(self, start: int, stop: int) -> list[T]:
+        """
+        Return a list of the items from start to stop, where both are valid non-negative locations and start < stop.
+        """
+        b, j = self._locate(start)
+        items = []
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self._blocks[b][j : j + remaining]
+            items.extend(chunk)
+            remaining -= len(chunk)
+            b += 1
+            j = 0
+        return items
+
+    @overload
+    def __getitem__(self, i: int) -> T: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[T]: ...
+
+    def __getitem__(self, i: int | slice) -> T | list[T]:
+        """
+        Return the item at the location, or for a slice return a list of the items. Slices return a python list and
+        not a BlockedList.
+        """
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._len)
+            if step != 1:
+                return list(self)[i]
+            if start >= stop:
+                return []
+            return self._slice_items(start, stop)
+        b, j = self._locate(i)
+        return self._blocks[b][j]
+
+    def __setitem__(self, i: int | slice, value: Any) -> None:
+        if isinstance(i, slice):
+            items = list(self)
+            items[i] = value
+            self._reset(items)
+            return
+        b, j = self._locate(i)
+        self._blocks[b][j] = value
+
+    def __delitem__(self, i: int | slice) -> None:
+        if isinstance(i, slice):
+            if i == slice(None):
+                self.clear()
+                return
+            items = list(self)
+            del items[i]
+            self._reset(items)
+            return
+        b, j = self._locate(i)
+        block = self._blocks[b]
+        del block[j]
+        self._len -= 1
+        self._offsets = None
+        self._reads = 0
+        if not block:
+            del self._blocks[b]
+            self._tree = None
+        elif b + 1 < len(self._blocks) and len(block) + len(self._blocks[b + 1]) <= self._size(self._len):
+            # join small neighbouring blocks so deletes do not leave many tiny blocks
+            block.extend(self._blocks[b + 1])
+            del self._blocks[b + 1]
+            self._tree = None
+        else:
+            self._tree_add(b, -1)
+
+    def _reset(self, items: list[T]) -> None:
+        """
+        Replace all the contents with the items.
+        """
+        self.clear()
+        self.extend(items)
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._tree = [0]
+        self._offsets = []
+        self._len = 0
+
+    def insert(self, i: int, value: T) -> None:
+        if i < 0:
+            i = max(0, i + self._len)
+        if i >= self._len:
+            self.append(value)
+            return
+        b, j = self._locate(i)
+        block = self._blocks[b]
+        block.insert(j, value)
+        self._len += 1
+        self._offsets = None
+        self._reads = 0
+        if len(block) > 2 * self._size(self._len):
+            half = len(block) // 2
+            self._blocks[b : b + 1] = [block[:half], block[half:]]
+            self._tree = None
+        else:
+            self._tree_add(b, 1)
+
+    def append(self, value: T) -> None:
+        blocks = self._blocks
+        self._len += 1
+        if blocks and len(blocks[-1]) < (self._block_size or max(isqrt(self._len), MIN_BLOCK_SIZE)):
+            blocks[-1].append(value)
+            if self._tree is not None:
+                self._tree[-1] += 1  # the last entry of the tree is the only one that includes the last block
+        else:
+            blocks.append([value])
+            self._tree_append(1)
+            if self._offsets is not None:
+                self._offsets.append(self._len - 1)
+
+    def extend(self, values: Iterable[T]) -> None:
+        items = list(values)
+        if not items:
+            return
+        self._len += len(items)
+        size = self._size(self._len)
+        start = 0
+        if self._blocks and len(self._blocks[-1]) < size:
+            start = size - len(self._blocks[-1])
+            self._blocks[-1].extend(items[:start])
+        for k in range(start, len(items), size):
+            self._blocks.append(items[k : k + size])
+        self._tree = None
+        self._offsets = None
+        self._reads = 0
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        if start != 0 or stop is not None:
+            return list(self).index(value, start, self._len if stop is None else stop)
+        offset = 0
+        for block in self._blocks:
+            try:
+                return offset + block.index(value)
+            except ValueError:
+                offset += len(block)
+        raise ValueError(f"{value!r} is not in list")
+
+    def count(self, value: Any) -> int:
+        return sum(block.count(value) for block in self._blocks)
+
+    def copy(self) -> BlockedList[T]:
+        return BlockedList(self, self._block_size)
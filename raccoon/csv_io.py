@@ -0,0 +1,91 @@
+"""
+CSV reading and writing functions used by DataFrame.read_csv() and to_csv(). Rows are read with the csv module in
+chunks and turned into columns with zip(), so each column is converted with a single call over all of its values
+instead of row by row.
+"""
+
+from __future__ import annotations
+
+import csv
+from array import array
+from itertools import islice, zip_longest
+from math import nan
+from typing import IO, Any, Callable, Iterable, Iterator, Sequence
+
+# number of rows read at a time when reading an entire CSV file
+CHUNKSIZE = 100_000
+
+
+def read_chunks(
+    file: IO[str], chunksize: int, delimiter: str = ","
+) -> Iterator[tuple[list[str], list[tuple[str, ...]]]]:
+    """
+    Read a CSV file with a header row in chunks of rows. Blank lines are skipped and the names in the header must be
+    unique.
+
+    :param file: text file object opened with newline=""
+    :param chunksize: maximum number of rows in each chunk
+    :param delimiter: field delimiter
+    :return: iterator of tuples of (header, list of the columns of the chunk, each a tuple of strings)
+    """
+    reader = filter(None, csv.reader(file, delimiter=delimiter))  # a blank line is an empty row
+    header = next(reader, None)
+    if header is None:
+        return
+    if len(set(header)) != len(header):
+        raise ValueError("header has duplicate column names: %s" % sorted({x for x in header if header.count(x) > 1}))
+    width = len(header)
+    first = True
+    while True:
+        rows = list(islice(reader, chunksize))
+        if not rows:
+            if first:  # header only, so a chunk of empty columns
+                yield header, [()] * width
+            return
+        first = False
+        columns = list(zip_longest(*rows, fillvalue=""))
+        if len(columns) > width:
+            raise ValueError("row has more fields than the header")
+        columns.extend([("",) * len(rows)] * (width - len(columns)))
+        yield header, columns
+
+
+def convert(values: Sequence[str], typecode: str | None = None, converter: Callable[[str], Any] | None = None) -> Any:
+    """
+    Convert a column of strings read from a CSV. With a typecode the result is an array of that typecode where empty
+    strings are NaN for float typecodes, an integer typecode cannot have missing values so empty strings raise an
+    error. With a converter function the result is a list of the function applied to each string where empty strings
+    are None. Otherwise the result is a list of the strings.
+
+    :param values: sequence of strings
+    :param typecode: (optional) array typecode
+    :param converter: (optional) function of one string argument
+    :return: list or array
+    """
+    if typecode is not None:
+        function: Callable[[str], Any] = float if typecode in "fd" else int
+        if "" in values:
+            if typecode not in "fd":
+                raise ValueError("integer typecode %r column cannot have missing values" % typecode)
+            return array(typecode, [nan if x == "" else function(x) for x in values])
+        return array(typecode, map(function, values))
+    if converter is not None:
+        if "" in values:
+            return [None if x == "" else converter(x) for x in values]
+        return list(map(converter, values))
+    return list(values)
+
+
+def write(file: IO[str], header: list[Any], rows: Iterable[Iterable[Any]], delimiter: str = ",") -> None:
+    """
+    Write a header and rows to a CSV file. None values are written as empty fields.
+
+    :param file: text file object opened with newline=""
+    :param header: list of the column names
+    :param rows: iterable of rows, each an iterable of values
+    :param delimiter: field delimiter
+    :return: nothing
+    """
+    writer = csv.writer(file, delimiter=delimiter)
+    writer.writerow(header)
+    writer.writerows(rows)
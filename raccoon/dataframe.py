@@ -4,17 +4,96 @@ DataFrame class
 
 from __future__ import annotations
 
+import io
 import json
 import keyword
+import mmap
+import operator
+from array import array
 from bisect import bisect_left, bisect_right
 from collections import OrderedDict, namedtuple
 from collections.abc import Sequence
 from itertools import compress
-from typing import Any, Callable, Iterator, Literal, Never, Self, cast, overload
+from math import nan
+from typing import Any, Callable, Iterable, Iterator, Literal, Never, Self, cast, overload
 
 from tabulate import tabulate
 
-from raccoon.sort_utils import sorted_exists, sorted_index, sorted_list_indexes
+from raccoon import arrow, csv_io, serialize
+from raccoon.aggregates import RunningAggregate
+from raccoon.blocked_list import BlockedList
+from raccoon.groupby import GroupBy
+from raccoon.interchange import InterchangeFrame
+from raccoon.join import DIRECTIONS, HOWS, Direction, How, Locations, asof_join, hash_join, merge_join
+from raccoon.journal import Journal
+from raccoon.mask import Mask, is_mask
+from raccoon.math_utils import between, binary_op, scalar_op
+from raccoon.resample import Resampler
+from raccoon.secondary_index import KINDS, SecondaryIndex, SortedIndex
+from raccoon.sort_utils import (
+    apply_permutation,
+    is_sorted,
+    merge_insert,
+    permutation_cycles,
+    sorted_columns_indexes,
+    sorted_exists,
+    sorted_index,
+    sorted_insert_locations,
+    sorted_list_indexes,
+)
+
+# array typecodes allowed for typed columns
+TYPECODES = "bBhHiIlLqQfd"
+
+
+def _missing_value(values: Sequence[Any]) -> Any:
+    """
+    Return the value used to fill a missing entry in a column: NaN for float arrays and None for list columns. An
+    integer array has no value that can mean missing, so this raises an error rather than fill with a made up value.
+
+    :param values: column data
+    :return: fill value
+    """
+    if isinstance(values, array):
+        if values.typecode in "fd":
+            return nan
+        raise ValueError(
+            "integer typecode %r column cannot have missing values, use a float typecode or no dtype" % values.typecode
+        )
+    return None
+
+
+def _take_locations(values: Sequence[Any], locations: Locations) -> Sequence[Any]:
+    """
+    Return the values at the locations, in a list or in an array of the same typecode for an array. A location of None
+    is a missing entry and is filled with the missing value of the column, NaN for a float array. An integer array has
+    no missing value, so with a missing entry the values are returned in a list with None.
+
+    :param values: column data
+    :param locations: list of locations or a range of step 1
+    :return: list or array
+    """
+    if isinstance(locations, range):
+        return values[locations.start : locations.stop]
+    if None in locations:
+        if isinstance(values, array) and values.typecode not in "fd":
+            return [None if i is None else values[i] for i in locations]
+        missing = _missing_value(values)
+        taken = [missing if i is None else values[i] for i in locations]
+    else:
+        taken = [values[i] for i in locations]  # type: ignore[index]
+    return array(values.typecode, taken) if isinstance(values, array) else taken
+
+
+def _typecodes(columns: list[Any], data: list[Sequence[Any]]) -> dict[Any, str]:
+    """
+    Return the dtypes of the columns from their data, the typecode of the columns that are arrays.
+
+    :param columns: list of column names
+    :param data: list of column data in the same order
+    :return: dict of column name to array typecode
+    """
+    return {column: x.typecode for column, x in zip(columns, data) if isinstance(x, array)}
 
 
 class DataFrame[IndexT, ColumnT]:
@@ -24,11 +103,30 @@ class DataFrame[IndexT, ColumnT]:
     expanding frequently. This is known to be slow with Pandas due to the use of numpy as the underlying data structure.
     Raccoon uses native lists as the underlying data structure which is quick to expand and grow the size. The
     DataFrame can be designated as sort, in which case the rows will be sort by index on construction, and then any
-    addition of a new row will insert it into the DataFrame so that the index remains sort.
+    addition of a new row will insert it into the DataFrame so that the index remains sort. For large sorted DataFrames
+    where rows are frequently inserted in the middle use storage="blocked" to store the index and columns in
+    BlockedLists, which makes those inserts and deletes much faster than with a single python list. Numeric columns
+    can be declared with dtypes, in which case they are stored in an array.array of that typecode which uses a
+    fraction of the memory of a list and supports the buffer protocol.
     """
 
     # Define slots to make object faster
-    __slots__ = ["_data", "_index", "_index_name", "_columns", "_sort"]
+    __slots__ = [
+        "_data",
+        "_index",
+        "_index_name",
+        "_columns",
+        "_sort",
+        "_storage",
+        "_dtypes",
+        "_index_map",
+        "_column_map",
+        "_aggregates",
+        "_secondary_indexes",
+        "_journal",
+        "_in_order",
+        "_mmap",
+    ]
 
     def __init__(
         self,
@@ -37,6 +135,8 @@ class DataFrame[IndexT, ColumnT]:
         index: Sequence[IndexT] | None = None,
         index_name: str | tuple | None = "index",
         sort: bool | None = None,
+        storage: Literal["list", "blocked"] = "list",
+        dtypes: dict[Any, str] | None = None,
     ):
         """
         :param data: (optional) dictionary of lists. The keys of the dictionary will be used for the column names and\
@@ -46,6 +146,12 @@ class DataFrame[IndexT, ColumnT]:
         :param index_name: (optional) name for the index. Default is "index"
         :param sort: if True then DataFrame will keep the index sort. If True all index values must be of same type.
             If None then will default to True if no index is provided.
+        :param storage: "list" to store the index and columns in python lists, or "blocked" to store them in
+            BlockedLists for fast inserts and deletes in the middle of large DataFrames
+        :param dtypes: (optional) dict of column name to array typecode, for example {"px": "d", "qty": "q"}. Those
+            columns are stored in an array.array of that typecode. Missing values in a typed column are NaN for float
+            typecodes, integer typecodes have no missing value so every row must have a value. All other columns are
+            lists.
         """
         # standard variable setup
         self._data: list[list[Any]] = []
@@ -53,9 +159,22 @@ class DataFrame[IndexT, ColumnT]:
         self._index_name = index_name
         self._columns: list[Any] = []
         self._sort: bool = False
+        self._storage = storage
+        self._dtypes: dict[Any, str] = dict(dtypes) if dtypes else {}
+        self._index_map: dict[Any, int] | None = None
+        self._column_map: dict[Any, int] = {}
+        self._aggregates: dict[Any, RunningAggregate] = {}
+        self._secondary_indexes: dict[Any, SecondaryIndex] = {}
+        self._journal: Journal | None = None
+        self._in_order = True
+        self._mmap: mmap.mmap | None = None
 
         # quality checks
-        if (index is not None) and not isinstance(index, list):
+        if storage not in ("list", "blocked"):
+            raise ValueError("storage must be list or blocked")
+        if any(x not in TYPECODES for x in self._dtypes.values()):
+            raise ValueError("dtypes must be array typecodes in %s" % TYPECODES)
+        if (index is not None) and not isinstance(index, (list, BlockedList)):
             raise TypeError("index must be a list")
         if (columns is not None) and not isinstance(columns, list):
             raise TypeError("columns must be a list")
@@ -65,7 +184,7 @@ class DataFrame[IndexT, ColumnT]:
             self._data = list()
             if columns:
                 # expand to the number of columns
-                self._data = [[] for _ in range(len(columns))]
+                self._data = [self._new_column(x) for x in columns]
                 self.columns = columns
             else:
                 self.columns = list()
@@ -79,7 +198,10 @@ class DataFrame[IndexT, ColumnT]:
                 self.index = list()
         elif isinstance(data, dict):
             # set data from dict values. If dict value is not a list, wrap it to make a single element list
-            self._data = [x if isinstance(x, list) else [x] for x in data.values()]
+            self._data = [
+                self._to_column(column, x if isinstance(x, (list, BlockedList, array)) else [x])
+                for column, x in data.items()
+            ]
             # setup columns from directory keys
             self.columns = list(data.keys())
             # pad the data
@@ -97,13 +219,12 @@ class DataFrame[IndexT, ColumnT]:
             self._sort_columns(columns)
 
         # setup sort
-        if sort is not None:
-            self.sort = sort
-        else:
-            if index:
-                self.sort = False
-            else:
-                self.sort = True
+        if sort is None:
+            sort = not index
+        if sort and data is not None:
+            # sorted DataFrames do not share the lists of the input data, the same as when the sort reorders them
+            self._data = [self._new_column(c, x) for c, x in zip(self._columns, self._data)]
+        self.sort = sort
 
     def __repr__(self) -> str:
         return "object id: %s\ncolumns:\n%s\ndata:\n%s\nindex:\n%s\n" % (
@@ -116,6 +237,40 @@ class DataFrame[IndexT, ColumnT]:
     def __str__(self) -> str:
         return self._make_table()
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the memory mapped file of a DataFrame from open_mmap(). The DataFrame has no rows after it is closed and
+        stays read only. Does nothing for other DataFrames. The DataFrame can also be used as a context manager that
+        closes it on exit. Columns of the DataFrame from data or index that are still referenced elsewhere keep the
+        file mapped and close() raises a BufferError.
+
+        :return: nothing
+        """
+        if self._mmap is None:
+            return
+        self._index = []
+        self._data = [[] for _ in self._columns]
+        self._index_map = None
+        for index in self._secondary_indexes.values():
+            index.clear()
+        self._mmap.close()
+
+    def _check_writable(self) -> None:
+        """
+        Raise a TypeError if the DataFrame is read only, which is a DataFrame from open_mmap(). Called at the start of
+        every method that changes the DataFrame so nothing is changed.
+
+        :return: nothing
+        """
+        if self._mmap is not None:
+            raise TypeError("memory mapped DataFrame is read only")
+
     def _make_table(self, index: bool = True, **kwargs: Any) -> str:
         kwargs["headers"] = "keys" if "headers" not in kwargs.keys() else kwargs["headers"]
         return tabulate(self.to_dict(ordered=True, index=index), **kwargs)
@@ -142,21 +297,141 @@ class DataFrame[IndexT, ColumnT]:
             raise ValueError(
                 "columns_list must be all in current columns, and all current columns must be in columns_list"
             )
-        new_sort = [self._columns.index(x) for x in columns_list]
+        new_sort = [self._column_map[x] for x in columns_list]
         self._data = [self._data[x] for x in new_sort]
         self._columns = [self._columns[x] for x in new_sort]
+        self._column_map = {column: i for i, column in enumerate(self._columns)}
 
     def _pad_data(self, max_len: int | None = None) -> None:
         """
-        Pad the data in DataFrame with [None] to ensure that all columns have the same length.
+        Pad the data in DataFrame with missing values to ensure that all columns have the same length.
 
         :param max_len: If provided will extend all columns to this length, if not then will use the longest column
         :return: nothing
         """
         if not max_len:
             max_len = max([len(x) for x in self._data])
-        for _, col in enumerate(self._data):
-            col.extend([None] * (max_len - len(col)))
+        for col in self._data:
+            if len(col) < max_len:
+                col.extend([_missing_value(col)] * (max_len - len(col)))
+
+    def _new_list(self, values: Iterable[Any] = ()) -> list[Any]:
+        """
+        Return a new list of the values using the container for the storage type of the DataFrame.
+
+        :param values: iterable of values
+        :return: list or BlockedList
+        """
+        return cast(list[Any], BlockedList(values)) if self._storage == "blocked" else list(values)
+
+    def _new_column(self, column: ColumnT, values: Iterable[Any] = ()) -> list[Any]:
+        """
+        Return a new container of the values for the column. Columns in dtypes use an array of that typecode, all
+        others use the container for the storage type of the DataFrame.
+
+        :param column: column name
+        :param values: iterable of values
+        :return: list, BlockedList or array
+        """
+        if column in self._dtypes:
+            return cast(list[Any], array(self._dtypes[column], values))
+        return self._new_list(values)
+
+    def _column_dtypes(self, columns: Iterable[Any]) -> dict[Any, str]:
+        """
+        Return the dtypes of only the columns, for a new DataFrame of a selection of the columns. A dtype of a column
+        not in the new DataFrame would otherwise type a column of that name added to it later.
+
+        :param columns: column names
+        :return: dict of column name to array typecode
+        """
+        return {column: self._dtypes[column] for column in columns if column in self._dtypes}
+
+    def _to_column(self, column: ColumnT, values: Sequence[Any]) -> list[Any]:
+        """
+        Return the values in the container for the column. If the values are already in that container then they are
+        returned as is and not copied.
+
+        :param column: column name
+        :param values: list, BlockedList or array
+        :return: list, BlockedList or array
+        """
+        if column in self._dtypes:
+            if isinstance(values, array) and values.typecode == self._dtypes[column]:
+                return cast(list[Any], values)
+        elif isinstance(values, BlockedList if self._storage == "blocked" else list):
+            return cast(list[Any], values)
+        return self._new_column(column, values)
+
+    def _to_index(self, values: list[Any]) -> list[Any]:
+        """
+        Return the index values in the container for the storage type of the DataFrame. A list for list storage is
+        returned as is and not copied.
+
+        :param values: list of index values
+        :return: list or BlockedList
+        """
+        return self._new_list(values) if self._storage == "blocked" else values
+
+    def _index_location(self, index: IndexT) -> int:
+        """
+        Return the location of an index value. Sorted DataFrames use a binary search. Unsorted DataFrames use a
+        dictionary of index value to location that is built on the first lookup and then kept in sync as rows are
+        added and deleted, so repeated lookups are constant time instead of a scan of the index.
+
+        :param index: index value
+        :return: location of the index value
+        """
+        if self._sort:
+            return sorted_index(self._index, index)
+        if self._index_map is None:
+            self._index_map = {x: i for i, x in enumerate(self._index)}
+        try:
+            return self._index_map[index]
+        except KeyError:
+            raise ValueError(f"{index!r} is not in list")
+
+    def _index_exists(self, index: IndexT) -> bool:
+        """
+        Return True if the index value is already in the DataFrame. For sorted DataFrames a value greater than the last
+        index is known to be new without a search, otherwise a binary search is used. Unsorted DataFrames, and sorted
+        DataFrames where append_row() or append_rows() put the index out of order, use the index value to location
+        dictionary, so the check does not grow with the size of the DataFrame.
+
+        :param index: index value
+        :return: True if the index value exists
+        """
+        if self._sort and self._in_order:
+            if not self._index or index > self._index[-1]:
+                return False
+            return sorted_exists(self._index, index)[0]
+        if self._index_map is None:
+            self._index_map = {x: i for i, x in enumerate(self._index)}
+        return index in self._index_map
+
+    def _check_order(self, indexes: list[Any]) -> None:
+        """
+        For a sorted DataFrame note if the index values about to be appended put the index out of order, after which
+        _index_exists() cannot use a binary search until the index is sorted again.
+
+        :param indexes: list of the index values to append
+        :return: nothing
+        """
+        if self._sort and self._in_order and indexes:
+            if (self._index and not indexes[0] > self._index[-1]) or not is_sorted(indexes):
+                self._in_order = False
+
+    def _column_location(self, column: ColumnT) -> int:
+        """
+        Return the location of a column name in the columns list using the column name to location dictionary.
+
+        :param column: column name
+        :return: location of the column
+        """
+        try:
+            return self._column_map[column]
+        except KeyError:
+            raise ValueError(f"{column!r} is not in list")
 
     def __len__(self) -> int:
         return len(self._index)
@@ -171,8 +446,21 @@ class DataFrame[IndexT, ColumnT]:
 
     @columns.setter
     def columns(self, columns_list: list[ColumnT]) -> None:
+        self._check_writable()
         self._validate_columns(columns_list)
+        if self._dtypes and self._columns:  # the columns are being renamed so move the dtypes to the new names
+            renames = dict(zip(self._columns, columns_list))
+            self._dtypes = {renames.get(k, k): v for k, v in self._dtypes.items()}
+        if self._aggregates and self._columns:
+            renames = dict(zip(self._columns, columns_list))
+            self._aggregates = {renames[k]: v for k, v in self._aggregates.items()}
+        if self._secondary_indexes and self._columns:
+            renames = dict(zip(self._columns, columns_list))
+            self._secondary_indexes = {renames[k]: v for k, v in self._secondary_indexes.items()}
         self._columns = list(columns_list)
+        self._column_map = {column: i for i, column in enumerate(self._columns)}
+        if self._journal is not None:
+            self._journal.checkpoint()
 
     @property
     def index(self) -> list[IndexT]:
@@ -186,8 +474,13 @@ class DataFrame[IndexT, ColumnT]:
 
     @index.setter
     def index(self, index_list: list[Any]) -> None:
+        self._check_writable()
         self._validate_index(index_list)
-        self._index = list(index_list)
+        self._index = self._new_list(index_list)
+        self._index_map = None
+        self._in_order = not self._sort or is_sorted(self._index)
+        if self._journal is not None:
+            self._journal.checkpoint()
 
     @property
     def index_name(self) -> str | tuple | None:
@@ -195,7 +488,10 @@ class DataFrame[IndexT, ColumnT]:
 
     @index_name.setter
     def index_name(self, name: str | tuple | None) -> None:
+        self._check_writable()
         self._index_name = name
+        if self._journal is not None:
+            self._journal.checkpoint()
 
     @property
     def sort(self) -> bool:
@@ -203,12 +499,198 @@ class DataFrame[IndexT, ColumnT]:
 
     @sort.setter
     def sort(self, boolean: bool) -> None:
+        self._check_writable()
         self._sort = boolean
         if self._sort:
             self.sort_index()
+        elif self._journal is not None:
+            self._journal.checkpoint()
+
+    @property
+    def storage(self) -> str:
+        return self._storage
+
+    @property
+    def dtypes(self) -> dict[Any, str]:
+        return self._dtypes.copy()
+
+    @property
+    def aggregates(self) -> dict[Any, RunningAggregate]:
+        """
+        Return a dict of the column names to the RunningAggregate for each column that has one. See add_aggregate().
+
+        :return: dict
+        """
+        return self._aggregates.copy()
+
+    def add_aggregate(self, column: ColumnT) -> RunningAggregate:
+        """
+        Start keeping running aggregates of count, sum, sum of squares, min and max for a column. The aggregates are
+        updated as values in the column are set, appended and deleted, so reading them does not touch the data. This
+        adds a small cost to every change of the column, so only add aggregates for columns where they are needed.
+
+        :param column: column name
+        :return: RunningAggregate
+        """
+        aggregate = RunningAggregate(self._data[self._column_location(column)])
+        self._aggregates[column] = aggregate
+        return aggregate
+
+    def remove_aggregate(self, column: ColumnT) -> None:
+        """
+        Stop keeping the running aggregates for a column.
+
+        :param column: column name
+        :return: nothing
+        """
+        if column not in self._aggregates:
+            raise ValueError("%s does not have an aggregate" % column)
+        del self._aggregates[column]
+
+    @property
+    def secondary_indexes(self) -> dict[Any, str]:
+        """
+        Return a dict of the column names to the kind of the secondary index for each column that has one. See
+        create_index().
+
+        :return: dict
+        """
+        return {column: index.kind for column, index in self._secondary_indexes.items()}
+
+    def create_index(self, column: ColumnT, kind: Literal["hash", "sorted"] = "hash") -> None:
+        """
+        Create a secondary index on a column, so equality(), isin() and where() on the whole column find the rows
+        without a scan of the column. A "hash" index is a dict of each value to its row locations and needs hashable
+        values. A "sorted" index keeps the values in sorted order and is also used by between(), it needs values that
+        are all comparable with each other.
+
+        The index is kept in sync as cells are set and rows are appended, inserted or deleted. Inserting rows in the
+        middle of a sorted DataFrame or deleting rows shifts the locations of the rows after them in the index, which
+        for a "hash" index costs one step for each of those rows and for a "sorted" index one step for every row.
+        Sorting the DataFrame clears the index and it is built again on the next lookup. Each index adds a small cost
+        to every change of its column.
+
+        :param column: column name
+        :param kind: "hash" or "sorted"
+        :return: nothing
+        """
+        if kind not in KINDS:
+            raise ValueError("kind must be one of %s" % list(KINDS))
+        index = KINDS[kind]()
+        index.build(self._data[self._column_location(column)])
+        self._secondary_indexes[column] = index
+
+    def drop_index(self, column: ColumnT) -> None:
+        """
+        Remove the secondary index of a column.
+
+        :param column: column name
+        :return: nothing
+        """
+        if column not in self._secondary_indexes:
+            raise ValueError("%s does not have a secondary index" % column)
+        del self._secondary_indexes[column]
+
+    def _secondary_index(self, column: ColumnT) -> SecondaryIndex | None:
+        """
+        Return the secondary index of a column built and ready for lookups, or None if the column does not have one.
+
+        :param column: column name
+        :return: SecondaryIndex or None
+        """
+        index = self._secondary_indexes.get(column)
+        if index is not None and not index.built:
+            index.build(self._data[self._column_location(column)])
+        return index
+
+    def _secondary_clear(self) -> None:
+        """
+        Clear all the secondary indexes after rows have been reordered, they are built again on the next lookup.
+
+        :return: nothing
+        """
+        for index in self._secondary_indexes.values():
+            index.clear()
+
+    def _secondary_new_rows(self, count: int) -> None:
+        """
+        Add the last count rows to the secondary indexes.
+
+        :param count: number of new rows
+        :return: nothing
+        """
+        start = len(self._index) - count
+        for column, index in self._secondary_indexes.items():
+            data = self._data[self._column_map[column]]
+            for i in range(start, len(self._index)):
+                index.add(i, data[i])
+
+    def _secondary_insert_rows(self, locations: list[int]) -> None:
+        """
+        Add rows inserted before the rows at the locations to the secondary indexes and shift the rows after them.
+
+        :param locations: ascending list of the locations before the insert where each new row went
+        :return: nothing
+        """
+        for column, index in self._secondary_indexes.items():
+            if index.built:
+                data = self._data[self._column_map[column]]
+                index.insert(locations, [data[x + k] for k, x in enumerate(locations)])
+
+    def _locations_mask(self, locations: Iterable[int]) -> Mask:
+        """
+        Return a Mask that is True at the row locations.
+
+        :param locations: iterable of row locations
+        :return: Mask
+        """
+        mask = [False] * len(self._index)
+        for i in locations:
+            mask[i] = True
+        return Mask(mask)
+
+    @property
+    def journal(self) -> Journal | None:
+        """
+        Return the Journal attached to the DataFrame, or None if there is not one. See attach_journal().
+
+        :return: Journal or None
+        """
+        return self._journal
+
+    def attach_journal(self, path: str, sync_every: int = 100, checkpoint_bytes: int | None = None) -> Journal:
+        """
+        Start recording every change to the DataFrame in an append-only journal file, so the DataFrame can be
+        recovered after a crash with DataFrame.replay(path). This takes a checkpoint of the entire DataFrame to
+        start, after which each change adds a small record to the log, so recovery time depends on the changes since
+        the last checkpoint and not on the size of the DataFrame. Changes made directly to the lists returned by
+        data or index are not recorded.
+
+        :param path: file path of the log, the checkpoint is saved to the same path with ".checkpoint" added
+        :param sync_every: number of records between each sync of the log to disk
+        :param checkpoint_bytes: (optional) if not None take a checkpoint when the log is larger than this size
+        :return: Journal
+        """
+        if self._journal is not None:
+            raise ValueError("DataFrame already has a journal")
+        journal = Journal(self, path, sync_every, checkpoint_bytes)
+        journal.checkpoint()
+        self._journal = journal
+        return journal
+
+    def detach_journal(self) -> None:
+        """
+        Sync and close the journal and stop recording changes.
+
+        :return: nothing
+        """
+        if self._journal is None:
+            raise ValueError("DataFrame does not have a journal")
+        self._journal.close()
+        self._journal = None
 
     @overload
-    def select_index(self, compare: Any | tuple, result: Literal["boolean"] = "boolean") -> list[bool]: ...
+    def select_index(self, compare: Any | tuple, result: Literal["boolean"] = "boolean") -> Mask: ...
 
     @overload
     def select_index(self, compare: IndexT | tuple[Any, ...], result: Literal["value"]) -> list[IndexT]: ...
@@ -228,16 +710,15 @@ class DataFrame[IndexT, ColumnT]:
         """
         if isinstance(compare, tuple):
             # this crazy list comprehension will match all the tuples in the list with None being an * wildcard
-            booleans = [
-                all([(compare[i] == w if compare[i] is not None else True) for i, w in enumerate(v)])
-                for x, v in enumerate(self._index)
-            ]
+            booleans = Mask(
+                [
+                    all([(compare[i] == w if compare[i] is not None else True) for i, w in enumerate(v)])
+                    for x, v in enumerate(self._index)
+                ]
+            )
         else:
-            booleans = [False] * len(self._index)
-            if self._sort:
-                booleans[sorted_index(self._index, compare)] = True
-            else:
-                booleans[self._index.index(compare)] = True
+            booleans = Mask([False] * len(self._index))
+            booleans[self._index_location(compare)] = True
         if result == "boolean":
             return booleans
         elif result == "value":
@@ -340,6 +821,8 @@ class DataFrame[IndexT, ColumnT]:
             if the get is for a single row
         :return: either DataFrame, list, dict or single value. The return is a shallow copy
         """
+        if isinstance(indexes, BlockedList):  # the index of a blocked storage DataFrame
+            indexes = list(indexes)
         if (indexes is None) and (columns is not None) and (not isinstance(columns, list)):
             return self.get_entire_column(columns, as_list=True) if as_list else self.get_entire_column(columns)
 
@@ -367,51 +850,71 @@ class DataFrame[IndexT, ColumnT]:
         :param column: column name
         :return: value
         """
-        i = sorted_index(self._index, index) if self._sort else self._index.index(index)
-        c = self._columns.index(column)
+        i = self._index_location(index)
+        c = self._column_location(column)
         return self._data[c][i]
 
     @overload
     def get_rows(self, indexes: list[IndexT] | list[bool], column: ColumnT, as_list: Literal[True]) -> list[Any]: ...
 
+    @overload
+    def get_rows(
+        self,
+        indexes: list[IndexT] | list[bool],
+        column: ColumnT,
+        as_list: Literal[False] = False,
+        *,
+        as_view: Literal[True],
+    ) -> DataFrameView[IndexT, ColumnT]: ...
+
     @overload
     def get_rows(
         self, indexes: list[IndexT] | list[bool], column: ColumnT, as_list: Literal[False] = False
     ) -> DataFrame[IndexT, ColumnT]: ...
 
     def get_rows(
-        self, indexes: list[Any] | list[bool], column: ColumnT, as_list: bool = False
-    ) -> DataFrame[IndexT, ColumnT] | list[Any]:
+        self, indexes: list[Any] | list[bool], column: ColumnT, as_list: bool = False, as_view: bool = False
+    ) -> DataFrame[IndexT, ColumnT] | DataFrameView[IndexT, ColumnT] | list[Any]:
         """
         For a list of indexes and a single column name return the values of the indexes in that column.
 
         :param indexes: either a list of index values or a list of booleans with same length as all indexes
         :param column: single column name
         :param as_list: if True return a list, if False return DataFrame
+        :param as_view: if True return a DataFrameView of the rows that does not copy the data
         :return: DataFrame is as_list if False, a list if as_list is True
         """
-        c = self._columns.index(column)
-        if indexes and isinstance(indexes[0], bool) and all(isinstance(i, bool) for i in indexes):  # boolean list
+        c = self._column_location(column)
+        if as_view:
+            return DataFrameView(self, self._row_locations(indexes), [column])
+        if is_mask(indexes):  # boolean list
             if len(indexes) != len(self._index):
                 raise ValueError("boolean index list must be same size of existing index")
             if all(indexes):  # the entire column
-                data = self._data[c]
-                index = self._index
+                if as_list:
+                    return self._data[c]
+                data = self._data[c][:]
+                index = self._index[:]
             else:
                 data = list(compress(self._data[c], indexes))
                 index = list(compress(self._index, indexes))
         else:  # index values list
-            locations = (
-                [sorted_index(self._index, x) for x in indexes]
-                if self._sort
-                else [self._index.index(x) for x in indexes]
-            )
+            locations = [self._index_location(x) for x in indexes]
+            if as_list:
+                return [self._data[c][i] for i in locations]
+            locations = self._row_locations(indexes, locations)
             data = [self._data[c][i] for i in locations]
             index = [self._index[i] for i in locations]
-        return (
-            data
-            if as_list
-            else DataFrame(data={column: data}, index=index, index_name=self._index_name, sort=self._sort)
+        if as_list:
+            return data
+        return self._trusted(
+            [self._to_column(column, data)],
+            self._to_index(index),
+            [column],
+            self._index_name,
+            self._sort,
+            self._storage,
+            self._column_dtypes([column]),
         )
 
     @overload
@@ -484,7 +987,7 @@ class DataFrame[IndexT, ColumnT]:
         :return: DataFrame, dictionary, or tuple-like namedtuple instance
         """
         assert not (as_dict and as_namedtuple), "can only provide as_dict or as_namedtuple as True, not both"
-        i = sorted_index(self._index, index) if self._sort else self._index.index(index)
+        i = self._index_location(index)
         if as_namedtuple:
             dict_row = self.get_location(location=i, columns=columns, as_dict=True, index=include_index)
             return namedtuple(name, dict_row.keys())(**dict_row)
@@ -505,29 +1008,52 @@ class DataFrame[IndexT, ColumnT]:
         :param as_list: if True return a list, if False return DataFrame
         :return: DataFrame is as_list if False, a list if as_list is True
         """
-        c = self._columns.index(column)
+        c = self._column_location(column)
         data = self._data[c]
-        return (
-            data
-            if as_list
-            else DataFrame(data={column: data}, index=self._index, index_name=self._index_name, sort=self._sort)
+        if as_list:
+            return list(data) if self._mmap is not None else data  # a list of the values, not the MappedColumn
+        return self._trusted(
+            [self._new_column(column, data)],
+            self._new_list(self._index),
+            [column],
+            self._index_name,
+            self._sort,
+            self._storage,
+            self._column_dtypes([column]),
         )
 
+    @overload
     def get_matrix(
-        self, indexes: list[Any] | list[bool], columns: list[Any] | list[bool]
-    ) -> DataFrame[IndexT, ColumnT]:
+        self, indexes: list[Any] | list[bool], columns: list[Any] | list[bool], as_view: Literal[True]
+    ) -> DataFrameView[IndexT, ColumnT]: ...
+
+    @overload
+    def get_matrix(
+        self, indexes: list[Any] | list[bool], columns: list[Any] | list[bool], as_view: Literal[False] = False
+    ) -> DataFrame[IndexT, ColumnT]: ...
+
+    def get_matrix(
+        self, indexes: list[Any] | list[bool], columns: list[Any] | list[bool], as_view: bool = False
+    ) -> DataFrame[IndexT, ColumnT] | DataFrameView[IndexT, ColumnT]:
         """
         For a list of indexes and list of columns return a DataFrame of the values.
 
         :param indexes: either a list of index values or a list of booleans with same length as all indexes
         :param columns: list of column names
-        :return: DataFrame
-        """
+        :param as_view: if True return a DataFrameView of the rows and columns that does not copy the data
+        :return: DataFrame or DataFrameView
+        """
+        if as_view:
+            if is_mask(columns):
+                if len(columns) != len(self._columns):
+                    raise ValueError("boolean column list must be same size of existing columns")
+                columns = list(compress(self._columns, columns))
+            return DataFrameView(self, self._row_locations(indexes), list(columns))
         current_index = self.index
-        current_columns = self.columns
+        current_columns = self._columns
         bool_indexes = []
         locations = []
-        if indexes and isinstance(indexes[0], bool) and all(isinstance(i, bool) for i in indexes):  # boolean list
+        if is_mask(indexes):  # boolean list
             is_bool_indexes = True
             if len(indexes) != len(self._index):
                 raise ValueError("boolean index list must be same size of existing index")
@@ -535,36 +1061,35 @@ class DataFrame[IndexT, ColumnT]:
             row_indexes = list(compress(current_index, indexes))
         else:
             is_bool_indexes = False
-            locations = (
-                [sorted_index(self._index, x) for x in indexes]
-                if self._sort
-                else [self._index.index(x) for x in indexes]
-            )
+            locations = self._row_locations(indexes)
             row_indexes = [current_index[i] for i in locations]
 
-        if columns and isinstance(columns[0], bool) and all(isinstance(i, bool) for i in columns):  # boolean list
+        if is_mask(columns):  # boolean list
             if len(columns) != len(self._columns):
                 raise ValueError("boolean column list must be same size of existing columns")
             selected_columns = list(compress(current_columns, columns))
         else:
             selected_columns = cast(list[ColumnT], list(columns))
 
-        col_locations = [current_columns.index(x) for x in selected_columns]
-        data_dict = dict()
-
-        for c in col_locations:
-            data_dict[self._columns[c]] = (
+        col_locations = [self._column_location(x) for x in selected_columns]
+        data = [
+            self._to_column(
+                self._columns[c],
                 list(compress(self._data[c], bool_indexes))
                 if is_bool_indexes
-                else [self._data[c][i] for i in locations]
+                else [self._data[c][i] for i in locations],
             )
-
-        return DataFrame(
-            data=data_dict,
-            index=row_indexes,
-            columns=selected_columns,
-            index_name=self._index_name,
-            sort=self._sort,
+            for c in col_locations
+        ]
+
+        return self._trusted(
+            data,
+            self._to_index(row_indexes),
+            selected_columns,
+            self._index_name,
+            self._sort,
+            self._storage,
+            self._column_dtypes(selected_columns),
         )
 
     @overload
@@ -651,22 +1176,21 @@ class DataFrame[IndexT, ColumnT]:
         :return: DataFrame, dictionary, tuple-like namedtuple instance, or a single cell value
         """
         assert not (as_dict and as_namedtuple), "can only provide as_dict or as_namedtuple as True, not both"
-        current_columns = self.columns
+        current_columns = self._columns
         if columns is None:
             selected_columns = current_columns
         elif not isinstance(columns, list):  # single value for columns
-            c = self._columns.index(columns)
+            c = self._column_location(columns)
             return self._data[c][location]
-        elif columns and isinstance(columns[0], bool) and all(isinstance(i, bool) for i in columns):
+        elif is_mask(columns):
             if len(columns) != len(self._columns):
                 raise ValueError("boolean column list must be same size of existing columns")
             selected_columns = list(compress(current_columns, columns))
         else:
             selected_columns = cast(list[ColumnT], list(columns))
-        col_to_idx = {col: i for i, col in enumerate(current_columns)}
         data: dict[Any, Any] = {}
         for column in selected_columns:
-            data[column] = self._data[col_to_idx[column]][location]
+            data[column] = self._data[self._column_map[column]][location]
         index_value = self._index[location]
         if as_dict:
             if index:
@@ -677,13 +1201,14 @@ class DataFrame[IndexT, ColumnT]:
                 data[self._index_name] = index_value
             return namedtuple(name, data.keys())(**data)
         else:
-            data = {k: [data[k]] for k in data}  # this makes the dict items lists
-            return DataFrame(
-                data=data,
-                index=[index_value],
-                columns=selected_columns,
-                index_name=self._index_name,
-                sort=self._sort,
+            return self._trusted(
+                [self._to_column(k, [data[k]]) for k in data],
+                self._to_index([index_value]),
+                list(data),
+                self._index_name,
+                self._sort,
+                self._storage,
+                self._column_dtypes(data),
             )
 
     def get_locations(
@@ -701,6 +1226,41 @@ class DataFrame[IndexT, ColumnT]:
         indexes = [self._index[x] for x in locations]
         return self.get(indexes, columns, **kwargs)
 
+    def view(
+        self, start_location: int | None = None, stop_location: int | None = None, columns: list[ColumnT] | None = None
+    ) -> DataFrameView[IndexT, ColumnT]:
+        """
+        Return a read only DataFrameView of a range of row locations, in standard python slice form of positive or
+        negative numbers, and a list of columns. The view references the data of this DataFrame so no data is copied.
+
+        :param start_location: first location to include, or None to start from the first row
+        :param stop_location: location to stop before, or None to end at the last row
+        :param columns: list of column names, or None to include all columns
+        :return: DataFrameView
+        """
+        return DataFrameView(self, range(len(self._index))[start_location:stop_location], columns)
+
+    def _row_locations(self, indexes: list[Any] | list[bool], locations: list[int] | None = None) -> list[int]:
+        """
+        Return the locations of a list of index values or a list of booleans. For sorted DataFrames the locations are
+        sorted so they are in the order of the index.
+
+        :param indexes: either a list of index values or a list of booleans with same length as all indexes
+        :param locations: (optional) locations of the index values if they are already known
+        :return: list of locations
+        """
+        if is_mask(indexes):
+            if len(indexes) != len(self._index):
+                raise ValueError("boolean index list must be same size of existing index")
+            return list(compress(range(len(indexes)), indexes))
+        if locations is None:
+            locations = [self._index_location(x) for x in indexes]
+        if len(set(locations)) != len(locations):
+            raise ValueError("index contains duplicates")
+        if self._sort:
+            locations = sorted(locations)
+        return locations
+
     @overload
     def get_slice(
         self,
@@ -711,6 +1271,16 @@ class DataFrame[IndexT, ColumnT]:
         as_dict: Literal[True],
     ) -> tuple[list[IndexT], dict[ColumnT, list[Any]]]: ...
 
+    @overload
+    def get_slice(
+        self,
+        start_index: Any = None,
+        stop_index: Any = None,
+        columns: list[ColumnT] | list[bool] | None = None,
+        *,
+        as_view: Literal[True],
+    ) -> DataFrameView[IndexT, ColumnT]: ...
+
     @overload
     def get_slice(
         self,
@@ -727,7 +1297,8 @@ class DataFrame[IndexT, ColumnT]:
         stop_index: Any = None,
         columns: Any | list[Any] | list[bool] | None = None,
         as_dict: bool = False,
-    ) -> DataFrame[IndexT, ColumnT] | tuple[list[IndexT], dict[ColumnT, list[Any]]]:
+        as_view: bool = False,
+    ) -> DataFrame[IndexT, ColumnT] | DataFrameView[IndexT, ColumnT] | tuple[list[IndexT], dict[ColumnT, list[Any]]]:
         """
         For sorted DataFrames will return either a DataFrame or dict of all the rows where the index is greater than
         or equal to the start_index if provided and less than or equal to the stop_index if provided. If either the
@@ -738,15 +1309,18 @@ class DataFrame[IndexT, ColumnT]:
         :param stop_index: highest index value to include, or None to end at the last row
         :param columns: list of column names to include, or None for all columns
         :param as_dict: if True then return a tuple of (list of index, dict of column names: list data values)
-        :return: DataFrame or tuple
+        :param as_view: if True then return a DataFrameView of the rows that does not copy the data, so it takes the
+            same time no matter how many rows are in the slice
+        :return: DataFrame, DataFrameView or tuple
         """
+        assert not (as_dict and as_view), "can only provide as_dict or as_view as True, not both"
         if not self._sort:
             raise RuntimeError("Can only use get_slice on sorted DataFrames")
 
-        current_columns = self.columns
+        current_columns = self._columns
         if columns is None:
             selected_columns = current_columns
-        elif columns and isinstance(columns[0], bool) and all(isinstance(i, bool) for i in columns):
+        elif is_mask(columns):
             if len(columns) != len(self._columns):
                 raise ValueError("boolean column list must be same size of existing columns")
             selected_columns = list(compress(current_columns, columns))
@@ -756,85 +1330,226 @@ class DataFrame[IndexT, ColumnT]:
         start_location = bisect_left(self._index, start_index) if start_index is not None else None
         stop_location = bisect_right(self._index, stop_index) if stop_index is not None else None
 
+        if as_view:
+            return DataFrameView(self, range(len(self._index))[start_location:stop_location], list(selected_columns))
+
         index = self.index[start_location:stop_location]
-        col_to_idx = {col: i for i, col in enumerate(current_columns)}
         data = dict()
         for column in selected_columns:
-            data[column] = self._data[col_to_idx[column]][start_location:stop_location]
+            data[column] = self._data[self._column_map[column]][start_location:stop_location]
 
         if as_dict:
             return index, data
         else:
-            data = data if data else None  # if the dict is empty, convert to None
-            return DataFrame(
-                data=data,
-                index=index,
-                columns=selected_columns,
-                index_name=self._index_name,
-                sort=self._sort,
+            return self._trusted(
+                [self._to_column(k, v) for k, v in data.items()],
+                self._to_index(index),
+                list(selected_columns),
+                self._index_name,
+                self._sort,
+                self._storage,
+                self._column_dtypes(selected_columns),
             )
 
-    def _insert_row(self, i: int, index: IndexT) -> None:
+    def _new_row(self, values: dict[Any, Any] | None = None) -> list[Any]:
+        """
+        Return the values of a new row in the order of the columns, the value in values for the columns in it and the
+        missing value for the others. The values of typed and aggregated columns are checked here, so a value the array
+        or aggregate cannot hold raises an error before the DataFrame is changed.
+
+        :param values: (optional) dict of column name to value
+        :return: list of values
+        """
+        if values and self._aggregates:
+            for column, aggregate in self._aggregates.items():
+                if column in values:
+                    aggregate.check((values[column],))
+        if not self._dtypes:  # all list columns where the missing value is None
+            return [values.get(x) for x in self._columns] if values else [None] * len(self._columns)
+        if not values:
+            return [_missing_value(x) for x in self._data]
+        row = [values[c] if c in values else _missing_value(x) for c, x in zip(self._columns, self._data)]
+        for column, value in values.items():
+            data = self._data[self._column_map[column]] if column in self._column_map else None
+            if isinstance(data, array):
+                array(data.typecode, (value,))
+        return row
+
+    def _new_rows(
+        self, new_indexes: list[Any], indexes: list[Any], values: dict[Any, Sequence[Any]] | None = None
+    ) -> list[Sequence[Any]]:
+        """
+        Return the values of new rows for each column in the order of the columns. The columns in values take the value
+        at the location of the new index in indexes, the others the missing value. The values of typed columns are
+        put in an array and the values of aggregated columns are checked here, so a value the array or aggregate cannot
+        hold raises an error before the DataFrame is changed.
+
+        :param new_indexes: list of the index values of the new rows
+        :param indexes: list of index values, the values are in the same order
+        :param values: (optional) dict of column name to list of values
+        :return: list of the values of each column
+        """
+        positions = {x: k for k, x in enumerate(indexes)} if values else {}
+        result: list[Sequence[Any]] = []
+        for column, data in zip(self._columns, self._data):
+            if values and column in values:
+                column_values = values[column]
+                new_values: Sequence[Any] = [column_values[positions[x]] for x in new_indexes]
+                if isinstance(data, array):
+                    new_values = array(data.typecode, new_values)
+                if column in self._aggregates:
+                    self._aggregates[column].check(new_values)
+            else:
+                new_values = [_missing_value(data)] * len(new_indexes)
+            result.append(new_values)
+        return result
+
+    def _insert_row(self, i: int, index: IndexT, values: dict[Any, Any] | None = None) -> None:
         """
         Insert a new row in the DataFrame.
 
         :param i: index location to insert
         :param index: index value to insert into the index list
+        :param values: (optional) dict of column name to the value of the new row, other columns are missing
         :return: nothing
         """
         if i == len(self._index):
-            self._add_row(index)
+            self._add_row(index, values)
         else:
+            row = self._new_row(values)
             self._index.insert(i, index)
-            for c in range(len(self._columns)):
-                self._data[c].insert(i, None)
+            for data, value in zip(self._data, row):
+                data.insert(i, value)
+            self._index_map = None
+            if self._aggregates:
+                self._aggregate_new_rows([(x,) for x in row])
+            if self._secondary_indexes:
+                self._secondary_insert_rows([i])
 
-    def _insert_missing_rows(self, indexes: list[Any]) -> None:
+    def _insert_missing_rows(self, indexes: list[Any], values: dict[Any, Sequence[Any]] | None = None) -> None:
         """
         Given a list of indexes, find all the indexes that are not currently in the DataFrame and make a new row for
-        that index, inserting into the index. This requires the DataFrame to be sort=True
+        that index, inserting into the index. This requires the DataFrame to be sort=True. When there is more than one
+        new index they are sorted and merged into the index and every column in a single pass.
 
         :param indexes: list of indexes
+        :param values: (optional) dict of column name to list of values, one for each of the indexes, for the new rows.
+            Other columns are missing
         :return: nothing
         """
-        existing = set(self._index)
-        new_indexes = [x for x in indexes if x not in existing]
-        for x in new_indexes:
-            self._insert_row(bisect_left(self._index, x), x)
-
-    def _add_row(self, index: IndexT) -> None:
+        new_indexes = sorted({x for x in indexes if not self._index_exists(x)})
+        if not new_indexes:
+            return
+        new_values = self._new_rows(new_indexes, indexes, values)
+        if len(new_indexes) == 1:
+            location = bisect_left(self._index, new_indexes[0])
+            self._insert_row(location, new_indexes[0], dict(zip(self._columns, (x[0] for x in new_values))))
+            return
+        locations = sorted_insert_locations(self._index, new_indexes)
+        merge_insert(self._index, locations, new_indexes)
+        for data, column_values in zip(self._data, new_values):
+            merge_insert(data, locations, column_values)
+        self._index_map = None
+        if self._aggregates:
+            self._aggregate_new_rows(new_values)
+        if self._secondary_indexes:
+            self._secondary_insert_rows(locations)
+
+    def _add_row(self, index: IndexT, values: dict[Any, Any] | None = None) -> None:
         """
         Add a new row to the DataFrame
 
         :param index: index of the new row
+        :param values: (optional) dict of column name to the value of the new row, other columns are missing
         :return: nothing
         """
+        row = self._new_row(values)
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
         self._index.append(index)
-        for c, _ in enumerate(self._columns):
-            self._data[c].append(None)
+        for data, value in zip(self._data, row):
+            data.append(value)
+        if self._aggregates:
+            self._aggregate_new_rows([(x,) for x in row])
+        if self._secondary_indexes:
+            self._secondary_new_rows(1)
+
+    def _aggregate_new_rows(self, new_values: list[Sequence[Any]]) -> None:
+        """
+        Add the values of new rows to the aggregates.
+
+        :param new_values: list of the values of the new rows for each column, in the order of the columns
+        :return: nothing
+        """
+        for column, aggregate in self._aggregates.items():
+            aggregate.extend(new_values[self._column_map[column]])
 
-    def _add_missing_rows(self, indexes: list[Any]) -> None:
+    def _add_missing_rows(self, indexes: list[Any], values: dict[Any, Sequence[Any]] | None = None) -> None:
         """
         Given a list of indexes, find all the indexes that are not currently in the DataFrame and make a new row for
         that index by appending to the DataFrame. This does not maintain sort order for the index.
 
         :param indexes: list of indexes
+        :param values: (optional) dict of column name to list of values, one for each of the indexes, for the new rows.
+            Other columns are missing
         :return: nothing
         """
-        existing = set(self._index)
-        new_indexes = [x for x in indexes if x not in existing]
-        for x in new_indexes:
-            self._add_row(x)
-
-    def _add_column(self, column: ColumnT) -> None:
+        new_indexes = [x for x in dict.fromkeys(indexes) if not self._index_exists(x)]
+        if not new_indexes:
+            return
+        new_values = self._new_rows(new_indexes, indexes, values)
+        start = len(self._index)
+        if self._index_map is not None:
+            self._index_map.update(zip(new_indexes, range(start, start + len(new_indexes))))
+        self._index.extend(new_indexes)
+        for data, column_values in zip(self._data, new_values):
+            data.extend(column_values)
+        if self._aggregates:
+            self._aggregate_new_rows(new_values)
+        if self._secondary_indexes:
+            self._secondary_new_rows(len(new_indexes))
+
+    def _add_column(self, column: ColumnT, values: Sequence[Any] | None = None) -> None:
         """
         Add a new column to the DataFrame
 
         :param column: column name
+        :param values: (optional) list of the values of the column, one for each row. If None then the values are
+            missing
+        :return: nothing
+        """
+        if values is None:
+            data = self._missing_column(column)
+        else:
+            if len(values) != len(self._index):
+                raise ValueError("values list must be at same length as current index length.")
+            data = self._to_column(column, values)
+        self._attach_column(column, data)
+
+    def _missing_column(self, column: ColumnT) -> list[Any]:
+        """
+        Return a new container for the column with the missing value for each current row, without adding it to the
+        DataFrame.
+
+        :param column: column name
+        :return: list, BlockedList or array
+        """
+        data = self._new_column(column)
+        if self._index:
+            data.extend([_missing_value(data)] * len(self._index))
+        return data
+
+    def _attach_column(self, column: ColumnT, data: list[Any]) -> None:
+        """
+        Add a column container to the end of the columns of the DataFrame.
+
+        :param column: column name
+        :param data: list, BlockedList or array with a value for each row
         :return: nothing
         """
+        self._column_map[column] = len(self._columns)
         self._columns.append(column)
-        self._data.append([None] * len(self._index))
+        self._data.append(data)
 
     def set(
         self,
@@ -855,6 +1570,9 @@ class DataFrame[IndexT, ColumnT]:
             indexes=None, then must be the same and length of DataFrame
         :return: nothing
         """
+        self._check_writable()
+        if isinstance(indexes, BlockedList):  # the index of a blocked storage DataFrame
+            indexes = list(indexes)
         if (indexes is not None) and (columns is not None):
             if isinstance(indexes, list):
                 self.set_column(indexes, columns, values)
@@ -879,22 +1597,32 @@ class DataFrame[IndexT, ColumnT]:
         :param value: value to set
         :return: nothing
         """
+        self._check_writable()
+        try:
+            c = self._column_location(column)
+        except ValueError:
+            if not self._index_exists(index):  # check the new row can be made before the new column is added
+                self._new_row()
+            c = len(self._columns)
+            self._add_column(column)
         if self._sort:
             exists, i = sorted_exists(self._index, index)
             if not exists:
-                self._insert_row(i, index)
+                self._insert_row(i, index, {column: value})
         else:
             try:
-                i = self._index.index(index)
+                i = self._index_location(index)
+                exists = True
             except ValueError:
-                i = len(self._index)
-                self._add_row(index)
-        try:
-            c = self._columns.index(column)
-        except ValueError:
-            c = len(self._columns)
-            self._add_column(column)
-        self._data[c][i] = value
+                exists = False
+                self._add_row(index, {column: value})
+        if exists:
+            if column in self._aggregates or column in self._secondary_indexes:
+                self._set_values(column, c, [i], [value])
+            else:
+                self._data[c][i] = value
+        if self._journal is not None:
+            self._journal.record("set_cell", index, column, value)
 
     def set_row(self, index: IndexT, values: dict[ColumnT, Any] | Any) -> None:
         """
@@ -904,23 +1632,31 @@ class DataFrame[IndexT, ColumnT]:
         :param values: dict with the keys as the column names and the values what to set that column to
         :return: nothing
         """
+        self._check_writable()
+        if not isinstance(values, dict):
+            raise TypeError("cannot handle values of this type.")
+        if not (set(values.keys()).issubset(self._column_map)):
+            raise ValueError("keys of values are not all in existing columns")
         if self._sort:
             exists, i = sorted_exists(self._index, index)
             if not exists:
-                self._insert_row(i, index)
+                self._insert_row(i, index, values)
         else:
             try:
-                i = self._index.index(index)
+                i = self._index_location(index)
+                exists = True
             except ValueError:  # new row
-                i = len(self._index)
-                self._add_row(index)
-        if isinstance(values, dict):
-            if not (set(values.keys()).issubset(self._columns)):
-                raise ValueError("keys of values are not all in existing columns")
-            for c, column in enumerate(self._columns):
-                self._data[c][i] = values.get(column, self._data[c][i])
-        else:
-            raise TypeError("cannot handle values of this type.")
+                exists = False
+                self._add_row(index, values)
+        if exists:
+            for column, value in values.items():
+                c = self._column_map[column]
+                if column in self._aggregates or column in self._secondary_indexes:
+                    self._set_values(column, c, [i], [value])
+                else:
+                    self._data[c][i] = value
+        if self._journal is not None:
+            self._journal.record("set_row", index, values)
 
     def set_column(
         self, index: list[Any] | list[bool] | None = None, column: Any | None = None, values: Any | list[Any] = None
@@ -936,26 +1672,32 @@ class DataFrame[IndexT, ColumnT]:
         list is values, or the length of the True values in the index list if the index list is booleans
         :return: nothing
         """
+        self._check_writable()
         if column is None:
             raise ValueError("column must be provided")
         try:
-            c = self._columns.index(column)
+            c = self._column_location(column)
         except ValueError:  # new column
             c = len(self._columns)
+            if not index:  # the values are the whole column
+                if not isinstance(values, (list, BlockedList, array)):
+                    values = [values for _ in self._index]
+                self._add_column(column, values)
+                if self._journal is not None:
+                    self._journal.record("set_column", index, column, values)
+                return
             self._add_column(column)
         if index:  # index was provided
-            if index and isinstance(index[0], bool) and all(isinstance(i, bool) for i in index):  # boolean list
-                if not isinstance(values, list):  # single value provided, not a list, so turn values into list
+            if is_mask(index):  # boolean list
+                if not isinstance(values, (list, BlockedList, array)):  # single value provided, turn into list
                     values = [values for x in index if x]
                 if len(index) != len(self._index):
                     raise ValueError("boolean index list must be same size of existing index")
                 if len(values) != index.count(True):
                     raise ValueError("length of values list must equal number of True entries in index list")
-                indexes = [i for i, x in enumerate(index) if x]
-                for x, i in enumerate(indexes):
-                    self._data[c][i] = values[x]
+                self._set_values(column, c, [i for i, x in enumerate(index) if x], values)
             else:  # list of index
-                if not isinstance(values, list):  # single value provided, not a list, so turn values into list
+                if not isinstance(values, (list, BlockedList, array)):  # single value provided, turn into list
                     values = [values for _ in index]
                 if len(values) != len(index):
                     raise ValueError("length of values and index must be the same.")
@@ -968,23 +1710,60 @@ class DataFrame[IndexT, ColumnT]:
                         exists.append(e)
                         indexes.append(i)
                     if not all(exists):
-                        self._insert_missing_rows(index)
+                        self._insert_missing_rows(index, {column: values})
                         indexes = [sorted_index(self._index, x) for x in index]
                 else:
                     try:  # all index in current index
-                        indexes = [self._index.index(x) for x in index]
+                        indexes = [self._index_location(x) for x in index]
                     except ValueError:  # new rows need to be added
-                        self._add_missing_rows(index)
-                        indexes = [self._index.index(x) for x in index]
-                for x, i in enumerate(indexes):
-                    self._data[c][i] = values[x]
+                        self._add_missing_rows(index, {column: values})
+                        indexes = [self._index_location(x) for x in index]
+                self._set_values(column, c, indexes, values)
         else:  # no index, only values
-            if not isinstance(values, list):  # values not a list, turn into one of length same as index
+            if not isinstance(values, (list, BlockedList, array)):  # single value, turn into list the length of index
                 values = [values for _ in self._index]
             if len(values) != len(self._index):
                 raise ValueError("values list must be at same length as current index length.")
             else:
-                self._data[c] = values
+                if column in self._aggregates:
+                    self._aggregates[column].check(values)
+                self._data[c] = self._to_column(column, values)
+                if column in self._aggregates:
+                    self._aggregates[column].clear()
+                    self._aggregates[column].extend(self._data[c])
+                if column in self._secondary_indexes:
+                    self._secondary_indexes[column].clear()
+        if self._journal is not None:
+            self._journal.record("set_column", index, column, values)
+
+    def _set_values(self, column: ColumnT, c: int, locations: list[int], values: Sequence[Any]) -> None:
+        """
+        Set the values of a column at the locations. The values are checked against the aggregate of the column before
+        any is set, and the aggregate and secondary index are updated for each value only after it is set, so a value
+        the column or aggregate cannot hold leaves them matching the data.
+
+        :param column: column name
+        :param c: column location
+        :param locations: list of row locations
+        :param values: list of new values, one for each location
+        :return: nothing
+        """
+        data = self._data[c]
+        aggregate = self._aggregates.get(column)
+        index = self._secondary_indexes.get(column)
+        if aggregate is None and index is None:
+            for x, i in enumerate(locations):
+                data[i] = values[x]
+            return
+        if aggregate is not None:
+            aggregate.check(values)
+        for x, i in enumerate(locations):
+            old = data[i]
+            data[i] = values[x]
+            if aggregate is not None:
+                aggregate.replace(old, data[i])
+            if index is not None:
+                index.replace(i, old, data[i])
 
     def set_location(self, location, values, missing_to_none=False):
         """
@@ -997,15 +1776,18 @@ class DataFrame[IndexT, ColumnT]:
         :param missing_to_none: if True set any column missing in the values to None, otherwise leave unchanged
         :return: nothing
         """
+        self._check_writable()
         if missing_to_none:
             # populate the dict with None in any column missing
             for column in self._columns:
                 if column not in values:
                     values[column] = None
 
+        location = range(len(self._index))[location]
         for column in values:
-            i = self._columns.index(column)
-            self._data[i][location] = values[column]
+            self._set_values(column, self._column_location(column), [location], [values[column]])
+        if self._journal is not None:
+            self._journal.record("set_location", location, values)
 
     def set_locations(self, locations: list[int], column: ColumnT, values: list[Any] | Any) -> None:
         """
@@ -1016,6 +1798,7 @@ class DataFrame[IndexT, ColumnT]:
         :param values: list of values or a single value
         :return: nothing
         """
+        self._check_writable()
         indexes = [self._index[x] for x in locations]
         self.set(indexes, column, values)
 
@@ -1030,21 +1813,39 @@ class DataFrame[IndexT, ColumnT]:
         :param new_cols: if True add new columns in values, if False ignore
         :return: nothing
         """
+        self._check_writable()
 
-        if index in self._index:
+        if self._index_exists(index):
             raise IndexError("index already in DataFrame")
 
+        # values of the row, if not in values then use the missing value. The row and the new columns are made and
+        # checked before the DataFrame is changed, and the new columns are added only after that
+        row = self._new_row(values)
+        new_columns = []
         if new_cols:
             for col in values:
-                if col not in self._columns:
-                    self._add_column(col)
+                if col not in self._column_map:
+                    data = self._missing_column(col)
+                    data.append(values[col])
+                    new_columns.append((col, data))
 
         # append index value
+        self._check_order([index])
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
         self._index.append(index)
 
-        # add data values, if not in values then use None
-        for c, col in enumerate(self._columns):
-            self._data[c].append(values.get(col, None))
+        for data, value in zip(self._data, row):
+            data.append(value)
+        for col, data in new_columns:
+            self._attach_column(col, data)
+
+        for column, aggregate in self._aggregates.items():
+            aggregate.add(row[self._column_map[column]])
+        if self._secondary_indexes:
+            self._secondary_new_rows(1)
+        if self._journal is not None:
+            self._journal.record("append_row", index, values, new_cols)
 
     def append_rows(self, indexes: list[IndexT], values: dict[ColumnT, list[Any]], new_cols: bool = True) -> None:
         """
@@ -1057,6 +1858,7 @@ class DataFrame[IndexT, ColumnT]:
         :param new_cols: if True add new columns in values, if False ignore
         :return: nothing
         """
+        self._check_writable()
 
         # check that the values data is less than or equal to the length of the indexes
         for column in values:
@@ -1064,30 +1866,64 @@ class DataFrame[IndexT, ColumnT]:
                 raise ValueError("length of %s column in values is longer than indexes" % column)
 
         # check the indexes are not duplicates
-        combined_index = self._index + indexes
-        if len(set(combined_index)) != len(combined_index):
+        if len(set(indexes)) != len(indexes) or any(self._index_exists(x) for x in indexes):
             raise IndexError("duplicate indexes in DataFrames")
 
+        # containers of the new columns with the missing value for the current rows, added after the values are made
+        columns = list(zip(self._columns, self._data))
+        new_columns = []
         if new_cols:
             for col in values:
-                if col not in self._columns:
-                    self._add_column(col)
+                if col not in self._column_map:
+                    new_columns.append((col, self._missing_column(col)))
+
+        # values of each column, if not in values then use the missing value. These are all made and checked before the
+        # index or any column is extended so a value a typed or aggregated column cannot hold raises with the DataFrame
+        # unchanged
+        count = len(indexes)
+        new_values = []
+        for col, data in columns + new_columns:
+            column_values = values[col] if col in values else ()
+            if isinstance(data, array) and not (
+                isinstance(column_values, array) and column_values.typecode == data.typecode
+            ):
+                column_values = array(data.typecode, column_values)
+            if col in self._aggregates:
+                self._aggregates[col].check(column_values)
+            if len(column_values) < count:
+                padding = [_missing_value(data)] * (count - len(column_values))
+                if isinstance(column_values, array):
+                    column_values = column_values + array(column_values.typecode, padding)
+                else:
+                    column_values = list(column_values) + padding
+            new_values.append(column_values)
 
         # append index value
+        self._check_order(indexes)
+        if self._index_map is not None:
+            self._index_map.update(zip(indexes, range(len(self._index), len(self._index) + len(indexes))))
         self._index.extend(indexes)
 
-        # add data values, if not in values then use None
-        for c, col in enumerate(self._columns):
-            self._data[c].extend(values.get(col, [None] * len(indexes)))
-        self._pad_data()
+        for (_, data), column_values in zip(columns + new_columns, new_values):
+            data.extend(column_values)
+        for col, data in new_columns:
+            self._attach_column(col, data)
+
+        if indexes:
+            for column, aggregate in self._aggregates.items():
+                aggregate.extend(new_values[self._column_map[column]])
+            if self._secondary_indexes:
+                self._secondary_new_rows(len(indexes))
+        if self._journal is not None:
+            self._journal.record("append_rows", indexes, values, new_cols)
 
     def _slice_index(self, slicer: slice) -> list[bool]:
         try:
-            start_index = sorted_index(self._index, slicer.start) if self._sort else self._index.index(slicer.start)
+            start_index = self._index_location(slicer.start)
         except ValueError:
             raise IndexError("start of slice not in the index")
         try:
-            end_index = sorted_index(self._index, slicer.stop) if self._sort else self._index.index(slicer.stop)
+            end_index = self._index_location(slicer.stop)
         except ValueError:
             raise IndexError("end of slice not in the index")
         if end_index < start_index:
@@ -1221,48 +2057,155 @@ class DataFrame[IndexT, ColumnT]:
 
         :return: json string
         """
-        input_dict = {"data": self.to_dict(index=False), "index": list(self._index)}
+        data = {column: list(self._data[i]) for i, column in enumerate(self._columns)}
+        input_dict = {"data": data, "index": list(self._index)}
+
+        input_dict["meta_data"] = self._meta_data()
+        return json.dumps(input_dict, default=repr)
+
+    def _meta_data(self) -> dict[str, Any]:
+        """
+        Return a dict of the meta data, which are the constructor arguments other than the data and index.
 
+        :return: dict
+        """
         meta_data = dict()
         for key in self.__slots__:
-            if key not in ["_data", "_index"]:
+            if key not in [
+                "_data",
+                "_index",
+                "_index_map",
+                "_column_map",
+                "_aggregates",
+                "_secondary_indexes",
+                "_journal",
+                "_in_order",
+                "_mmap",
+            ]:
                 meta_data[key.lstrip("_")] = self.__getattribute__(key)
-        input_dict["meta_data"] = meta_data
-        return json.dumps(input_dict, default=repr)
+        return meta_data
 
-    def rename_columns(self, rename_dict: dict[ColumnT, ColumnT]) -> None:
+    def to_bytes(self) -> bytes:
         """
-        Renames the columns
+        Returns the entire DataFrame in a compact binary columnar format that can be reconstructed back with
+        DataFrame.from_bytes(input). Columns of ints, floats, bools, strings, datetimes, dates and tuples are stored in
+        typed encodings and typed array columns are stored as their raw bytes, so these are reconstructed exactly and
+        much faster than from JSON. Any other objects are pickled, so only load from trusted sources.
 
-        :param rename_dict: dict where the keys are the current column names and the values are the new names
+        :return: bytes
+        """
+        file = io.BytesIO()
+        serialize.write(file, self._meta_data(), self._index, self._data)
+        return file.getvalue()
+
+    def save(self, path: str) -> None:
+        """
+        Saves the entire DataFrame to a file in the binary columnar format of to_bytes(). Load it back with
+        DataFrame.load(path).
+
+        :param path: file path
+        :return: nothing
+        """
+        with open(path, "wb") as file:
+            serialize.write(file, self._meta_data(), self._index, self._data)
+
+    def to_csv(self, path: str, index: bool = True, delimiter: str = ",") -> None:
+        """
+        Writes the DataFrame to a CSV file with a header row of the column names. The rows are streamed straight from
+        the index and columns without building any intermediate structure. None values are written as empty fields.
+
+        :param path: file path
+        :param index: if True then the index is written as the first column with the index name as the header
+        :param delimiter: field delimiter
+        :return: nothing
+        """
+        header = [self._index_name] + self._columns if index else list(self._columns)
+        rows = zip(self._index, *self._data) if index else zip(*self._data)
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            csv_io.write(file, header, rows, delimiter)
+
+    def to_arrow(self, index: bool = True) -> Any:
+        """
+        Returns the DataFrame as an Apache Arrow Table, which requires the pyarrow package. Typed array columns are
+        wrapped as Arrow arrays over the same memory so they are not copied, list columns are converted in a single
+        pass. The DataFrame meta data and column names are kept in the schema metadata so DataFrame.from_arrow() can
+        reconstruct the DataFrame.
+
+        Because typed columns share memory with the Table, changing their values in the DataFrame also changes the
+        Table, and appending to them can move the memory, so do not change the DataFrame while the Table is in use.
+
+        :param index: if True then the index is the first column of the Table
+        :return: pyarrow Table
+        """
+        return arrow.to_table(self._meta_data(), self._index if index else None, self._columns, self._data)
+
+    def __dataframe__(self, nan_as_null: bool = False, allow_copy: bool = True) -> InterchangeFrame:
+        """
+        Returns the DataFrame interchange protocol object for the DataFrame, so other DataFrame libraries that support
+        the protocol can read it. Typed array columns are exported without a copy. List columns must contain only one
+        of int, float, bool, str or datetime values, and None, and are converted to buffers in a single pass.
+
+        :param nan_as_null: not used, NaN values are not treated as null
+        :param allow_copy: if False then raise a RuntimeError for list columns, which cannot be exported without a copy
+        :return: InterchangeFrame
+        """
+        return InterchangeFrame(self, nan_as_null, allow_copy)
+
+    def rename_columns(self, rename_dict: dict[ColumnT, ColumnT]) -> None:
+        """
+        Renames the columns
+
+        :param rename_dict: dict where the keys are the current column names and the values are the new names
         :return: nothing
         """
-        if not all([x in self._columns for x in rename_dict.keys()]):
+        self._check_writable()
+        if not all([x in self._column_map for x in rename_dict.keys()]):
             raise ValueError("all dictionary keys must be in current columns")
         for current in rename_dict.keys():
-            self._columns[self._columns.index(current)] = rename_dict[current]
+            self._columns[self._column_map[current]] = rename_dict[current]
+        if self._dtypes:
+            self._dtypes = {rename_dict.get(k, k): v for k, v in self._dtypes.items()}
+        if self._aggregates:
+            self._aggregates = {rename_dict.get(k, k): v for k, v in self._aggregates.items()}
+        if self._secondary_indexes:
+            self._secondary_indexes = {rename_dict.get(k, k): v for k, v in self._secondary_indexes.items()}
+        self._column_map = {column: i for i, column in enumerate(self._columns)}
+        if self._journal is not None:
+            self._journal.record("rename_columns", rename_dict)
 
-    def head(self, rows: int) -> Self:
+    @overload
+    def head(self, rows: int, as_view: Literal[True]) -> DataFrameView[IndexT, ColumnT]: ...
+
+    @overload
+    def head(self, rows: int, as_view: Literal[False] = False) -> Self: ...
+
+    def head(self, rows: int, as_view: bool = False) -> Self | DataFrameView[IndexT, ColumnT]:
         """
         Return a DataFrame of the first N rows
 
         :param rows: number of rows
-        :return: DataFrame
+        :param as_view: if True then return a DataFrameView of the rows that does not copy the data
+        :return: DataFrame or DataFrameView
         """
-        rows_bool = [True] * min(rows, len(self._index))
-        rows_bool.extend([False] * max(0, len(self._index) - rows))
-        return self.get(indexes=rows_bool)
+        view = self.view(0, max(0, rows))
+        return view if as_view else cast(Self, view.to_frame())
 
-    def tail(self, rows: int) -> Self:
+    @overload
+    def tail(self, rows: int, as_view: Literal[True]) -> DataFrameView[IndexT, ColumnT]: ...
+
+    @overload
+    def tail(self, rows: int, as_view: Literal[False] = False) -> Self: ...
+
+    def tail(self, rows: int, as_view: bool = False) -> Self | DataFrameView[IndexT, ColumnT]:
         """
         Return a DataFrame of the last N rows
 
         :param rows: number of rows
-        :return: DataFrame
+        :param as_view: if True then return a DataFrameView of the rows that does not copy the data
+        :return: DataFrame or DataFrameView
         """
-        rows_bool = [False] * max(0, len(self._index) - rows)
-        rows_bool.extend([True] * min(rows, len(self._index)))
-        return self.get(indexes=rows_bool)
+        view = self.view(max(0, len(self._index) - rows))
+        return view if as_view else cast(Self, view.to_frame())
 
     def delete_rows(self, indexes: Any | list[Any] | list[bool]) -> None:
         """
@@ -1271,22 +2214,37 @@ class DataFrame[IndexT, ColumnT]:
         :param indexes: either a list of values or list of booleans for the rows to delete
         :return: nothing
         """
+        self._check_writable()
+        if isinstance(indexes, BlockedList):  # the index of a blocked storage DataFrame
+            indexes = list(indexes)
         indexes = [indexes] if not isinstance(indexes, list) else indexes
-        if indexes and isinstance(indexes[0], bool) and all(isinstance(i, bool) for i in indexes):  # boolean list
+        if is_mask(indexes):  # boolean list
             if len(indexes) != len(self._index):
                 raise ValueError("boolean indexes list must be same size of existing indexes")
-            indexes = [i for i, x in enumerate(indexes) if x]
+            locations = [i for i, x in enumerate(indexes) if x]
         else:
-            indexes = (
-                [sorted_index(self._index, x) for x in indexes]
-                if self._sort
-                else [self._index.index(x) for x in indexes]
-            )
-        indexes = sorted(indexes, reverse=True)  # need to sort and reverse list so deleting works
-        for i in indexes:
+            locations = [self._index_location(x) for x in indexes]
+        locations = sorted(locations, reverse=True)  # need to sort and reverse list so deleting works
+        for column, aggregate in self._aggregates.items():
+            data = self._data[self._column_map[column]]
+            for i in locations:
+                aggregate.remove(data[i])
+        for i in locations:
             for c in range(len(self._columns)):
                 del self._data[c][i]
+            if self._index_map is not None:
+                del self._index_map[self._index[i]]
             del self._index[i]
+        if self._index_map is not None and locations:
+            # every row after the first deleted row has moved, so update their locations
+            for i in range(locations[-1], len(self._index)):
+                self._index_map[self._index[i]] = i
+        if self._secondary_indexes and locations:
+            deleted = sorted(set(locations))
+            for index in self._secondary_indexes.values():
+                index.delete(deleted)
+        if self._journal is not None:
+            self._journal.record("delete_rows", indexes)
 
     def delete_all_rows(self) -> None:
         """
@@ -1296,9 +2254,18 @@ class DataFrame[IndexT, ColumnT]:
 
         :return: nothing
         """
+        self._check_writable()
         del self._index[:]
         for c in range(len(self._columns)):
             del self._data[c][:]
+        if self._index_map is not None:
+            self._index_map.clear()
+        self._in_order = True
+        for aggregate in self._aggregates.values():
+            aggregate.clear()
+        self._secondary_clear()
+        if self._journal is not None:
+            self._journal.record("delete_all_rows")
 
     def delete_columns(self, columns: Any | list[Any]) -> None:
         """
@@ -1307,48 +2274,101 @@ class DataFrame[IndexT, ColumnT]:
         :param columns: list of columns to delete
         :return: nothing
         """
+        self._check_writable()
         columns = [columns] if not isinstance(columns, list) else columns
-        if not all([x in self._columns for x in columns]):
+        if not all([x in self._column_map for x in columns]):
             raise ValueError("all columns must be in current columns")
         for column in columns:
-            c = self._columns.index(column)
+            c = self._column_map[column]
             del self._data[c]
             del self._columns[c]
+            self._dtypes.pop(column, None)
+            self._aggregates.pop(column, None)
+            self._secondary_indexes.pop(column, None)
+            self._column_map = {column: i for i, column in enumerate(self._columns)}
         if not len(self._data):  # if all the columns have been deleted, remove index
-            self.index = list()
+            self._index = self._new_list()
+            self._index_map = None
+        if self._journal is not None:
+            self._journal.record("delete_columns", columns)
 
     def sort_index(self) -> None:
         """
-        Sort the DataFrame by the index. The sort modifies the DataFrame inplace
+        Sort the DataFrame by the index. The sort modifies the DataFrame inplace. If the index is already sorted then
+        nothing is changed.
+
+        :return: nothing
+        """
+        self._check_writable()
+        if not is_sorted(self._index):
+            self._permute(sorted_list_indexes(self._index))
+        self._in_order = True
 
+    def _permute(self, order: list[int]) -> None:
+        """
+        Reorder the index and every column in place so the row at location i is the row that was at location order[i].
+
+        :param order: list of locations
         :return: nothing
         """
-        sort = sorted_list_indexes(self._index)
-        # sort index
-        self._index = [self._index[x] for x in sort]
-        # each column
-        for c in range(len(self._data)):
-            self._data[c] = [self._data[c][i] for i in sort]
+        cycles = permutation_cycles(order)
+        apply_permutation(self._index, order, cycles)
+        self._index_map = None
+        for column in self._data:
+            apply_permutation(column, order, cycles)
+        self._secondary_clear()
+        if self._journal is not None:
+            self._journal.checkpoint()
+
+    def argsort(
+        self, columns: Any | list[Any], ascending: bool | list[bool] = True, key: Callable[[Any], Any] | None = None
+    ) -> list[int]:
+        """
+        Return the locations of the rows in the order that sorts the DataFrame by the columns, without moving any data.
+        The first column is the primary sort and each later column breaks the ties of the ones before it. The sort is
+        stable, so rows with equal values keep their current order. The result can be used with get_locations() or
+        to make a DataFrameView of the rows in sorted order.
+
+        :param columns: column name or list of column names to sort by
+        :param ascending: True or False for all the columns, or a list of booleans with one for each column. False
+            sorts that column in descending order
+        :param key: if not None then a function of one argument that is used to extract a comparison key from each
+            value of the columns
+        :return: list of locations
+        """
+        columns = columns if isinstance(columns, list) else [columns]
+        if isinstance(ascending, bool):
+            ascending = [ascending] * len(columns)
+        elif len(ascending) != len(columns):
+            raise ValueError("ascending must be a bool or a list of the same length as columns")
+        return sorted_columns_indexes([self._data[self._column_location(x)] for x in columns], ascending, key)
 
-    def sort_columns(self, column: Any, key: Callable[[Any], Any] | None = None, reverse: bool = False) -> None:
+    def sort_columns(
+        self,
+        column: Any | list[Any],
+        key: Callable[[Any], Any] | None = None,
+        reverse: bool = False,
+        ascending: bool | list[bool] = True,
+    ) -> None:
         """
-        Sort the DataFrame by one of the columns. The sort modifies the DataFrame inplace. The key and reverse
-        parameters have the same meaning as for the built-in sort() function.
+        Sort the DataFrame by one or more of the columns. The sort modifies the DataFrame inplace, the order and its
+        cycles are computed once with argsort() and then the index and each column are reordered in place along the
+        cycles, so no column is copied. The key and reverse parameters have the same meaning as for the built-in sort()
+        function. The sort is stable.
 
-        :param column: column name to use for the sort
+        :param column: column name or list of column names to use for the sort. The first column is the primary sort
         :param key: if not None then a function of one argument that is used to extract a comparison key from each
                     list element
         :param reverse: if True then the list elements are sort as if each comparison were reversed.
+        :param ascending: True or False for all the columns, or a list of booleans with one for each column. False
+            sorts that column in descending order. Combined with reverse=True each direction is flipped
         :return: nothing
         """
-        if isinstance(column, list):
-            raise TypeError("Can only sort by a single column  ")
-        sort = sorted_list_indexes(self._data[self._columns.index(column)], key, reverse)
-        # sort index
-        self._index = [self._index[x] for x in sort]
-        # each column
-        for c in range(len(self._data)):
-            self._data[c] = [self._data[c][i] for i in sort]
+        self._check_writable()
+        columns = column if isinstance(column, list) else [column]
+        if isinstance(ascending, bool):
+            ascending = [ascending] * len(columns)
+        self._permute(self.argsort(columns, [x != reverse for x in ascending], key))
 
     def _validate_index(self, indexes: list[Any]) -> None:
         if len(indexes) != len(set(indexes)):
@@ -1391,17 +2411,28 @@ class DataFrame[IndexT, ColumnT]:
         :param data_frame: DataFrame to append
         :return: nothing
         """
+        self._check_writable()
         if len(data_frame) == 0:  # empty DataFrame, do nothing
             return
         data_frame_index = data_frame.index
-        combined_index = self._index + data_frame_index
-        if len(set(combined_index)) != len(combined_index):
+        if any(self._index_exists(x) for x in data_frame_index):
             raise ValueError("duplicate indexes in DataFrames")
 
-        for c, column in enumerate(data_frame.columns):
-            self.set(indexes=data_frame_index, columns=column, values=data_frame.data[c].copy())
+        values = dict(zip(data_frame.columns, data_frame.data))
+        for column in values:
+            if column not in self._column_map:
+                self._add_column(column)
+        # add all the new rows at once with their values
+        if self._sort:
+            self._insert_missing_rows(data_frame_index, values)
+        else:
+            self._add_missing_rows(data_frame_index, values)
+        if self._journal is not None:
+            # record a plain copy, the DataFrame may have a journal or views that cannot be pickled
+            copy = self.from_columns([list(x) for x in values.values()], list(values), data_frame_index, sort=False)
+            self._journal.record("append", copy)
 
-    def equality(self, column: Any, indexes: list[Any] | list[bool] | None = None, value: Any = None) -> list[bool]:
+    def equality(self, column: Any, indexes: list[Any] | list[bool] | None = None, value: Any = None) -> Mask:
         """
         Math helper method. Given a column and optional indexes will return a list of booleans on the equality of the
         value for that index in the DataFrame to the value parameter.
@@ -1410,86 +2441,433 @@ class DataFrame[IndexT, ColumnT]:
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
         :param value: value to compare
-        :return: list of booleans
+        :return: Mask
+        """
+        if indexes is None and column in self._secondary_indexes:
+            return self._locations_mask(self._equal_locations(column, value))
+        return Mask([x == value for x in self._get_values(column, indexes)])
+
+    def gt(self, column: Any, indexes: list[Any] | list[bool] | None = None, value: Any = None) -> Mask:
+        """
+        Math helper method. Given a column and optional indexes will return a list of booleans of whether the value
+        for that index in the DataFrame is greater than the value parameter.
+
+        :param column: column name to compare
+        :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
+        length as the DataFrame
+        :param value: value to compare
+        :return: Mask
+        """
+        return Mask(scalar_op(operator.gt, self._get_values(column, indexes), value))
+
+    def lt(self, column: Any, indexes: list[Any] | list[bool] | None = None, value: Any = None) -> Mask:
+        """
+        Math helper method. Given a column and optional indexes will return a list of booleans of whether the value
+        for that index in the DataFrame is less than the value parameter.
+
+        :param column: column name to compare
+        :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
+        length as the DataFrame
+        :param value: value to compare
+        :return: Mask
+        """
+        return Mask(scalar_op(operator.lt, self._get_values(column, indexes), value))
+
+    def between(
+        self, column: Any, indexes: list[Any] | list[bool] | None = None, low: Any = None, high: Any = None
+    ) -> Mask:
+        """
+        Math helper method. Given a column and optional indexes will return a list of booleans of whether the value
+        for that index in the DataFrame is greater than or equal to low and less than or equal to high. If low or high
+        is None then that end is open, similar to get_slice.
+
+        :param column: column name to compare
+        :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
+        length as the DataFrame
+        :param low: lowest value, inclusive
+        :param high: highest value, inclusive
+        :return: Mask
+        """
+        if indexes is None and self.secondary_indexes.get(column) == "sorted":
+            index = cast(SortedIndex, self._secondary_index(column))
+            return self._locations_mask(index.locations_between(low, high))
+        return Mask(between(self._get_values(column, indexes), low, high))
+
+    def _get_values(self, column: Any, indexes: list[Any] | list[bool] | None) -> Sequence[Any]:
+        """
+        Return the values of the column for the indexes. If indexes is None then the column data is returned without a
+        copy. Values from a typed column are returned as an array of the same typecode.
+
+        :param column: column name
+        :param indexes: list of index values or list of booleans, or None for all rows
+        :return: list or array
         """
-        indexes = [True] * len(self._index) if indexes is None else indexes
-        compare_list = self.get_rows(indexes, column, as_list=True)
-        return [x == value for x in compare_list]
+        if indexes is None:
+            return self._data[self._column_location(column)]
+        values = self.get_rows(indexes, column, as_list=True)
+        data = self._data[self._column_location(column)]
+        return array(data.typecode, values) if isinstance(data, array) else values
 
     def _get_lists(
         self, left_column: Any, right_column: Any, indexes: list[Any] | list[bool] | None
-    ) -> tuple[list[Any], list[Any]]:
-        indexes = [True] * len(self._index) if indexes is None else indexes
-        left_list = self.get_rows(indexes, left_column, as_list=True)
-        right_list = self.get_rows(indexes, right_column, as_list=True)
-        return left_list, right_list
+    ) -> tuple[Sequence[Any], Sequence[Any]]:
+        return self._get_values(left_column, indexes), self._get_values(right_column, indexes)
+
+    def _math(
+        self,
+        func: Callable[[Any, Any], Any],
+        left_column: Any,
+        right_column: Any,
+        indexes: list[Any] | list[bool] | None,
+        value: Any,
+    ) -> list[Any]:
+        if value is not None:
+            return scalar_op(func, self._get_values(left_column, indexes), value)
+        left_list, right_list = self._get_lists(left_column, right_column, indexes)
+        return binary_op(func, left_list, right_list)
 
-    def add(self, left_column: Any, right_column: Any, indexes: list[Any] | list[bool] | None = None) -> list[Any]:
+    def add(
+        self,
+        left_column: Any,
+        right_column: Any = None,
+        indexes: list[Any] | list[bool] | None = None,
+        value: Any = None,
+    ) -> list[Any]:
         """
-        Math helper method that adds element-wise two columns. If indexes are not None then will only perform the
-        math on that sub-set of the columns.
+        Math helper method that adds element-wise two columns, or a column and a single value. If indexes are not None
+        then will only perform the math on that sub-set of the columns.
 
         :param left_column: first column name
         :param right_column: second column name
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
+        :param value: if not None then add this value to every element of the left_column instead of the right_column
         :return: list
         """
-        left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [left_val + r for left_val, r in zip(left_list, right_list)]
+        return self._math(operator.add, left_column, right_column, indexes, value)
 
-    def subtract(self, left_column: Any, right_column: Any, indexes: list[Any] | list[bool] | None = None) -> list[Any]:
+    def subtract(
+        self,
+        left_column: Any,
+        right_column: Any = None,
+        indexes: list[Any] | list[bool] | None = None,
+        value: Any = None,
+    ) -> list[Any]:
         """
-        Math helper method that subtracts element-wise two columns. If indexes are not None then will only perform the
-        math on that sub-set of the columns.
+        Math helper method that subtracts element-wise two columns, or a single value from a column. If indexes are not
+        None then will only perform the math on that sub-set of the columns.
 
         :param left_column: first column name
         :param right_column: name of column to subtract from the left_column
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
+        :param value: if not None then subtract this value from every element of the left_column
         :return: list
         """
-        left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [left_val - r for left_val, r in zip(left_list, right_list)]
+        return self._math(operator.sub, left_column, right_column, indexes, value)
 
-    def multiply(self, left_column: Any, right_column: Any, indexes: list[Any] | list[bool] | None = None) -> list[Any]:
+    def multiply(
+        self,
+        left_column: Any,
+        right_column: Any = None,
+        indexes: list[Any] | list[bool] | None = None,
+        value: Any = None,
+    ) -> list[Any]:
         """
-        Math helper method that multiplies element-wise two columns. If indexes are not None then will only perform the
-        math on that sub-set of the columns.
+        Math helper method that multiplies element-wise two columns, or a column and a single value. If indexes are not
+        None then will only perform the math on that sub-set of the columns.
 
         :param left_column: first column name
         :param right_column: second column name
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
+        :param value: if not None then multiply every element of the left_column by this value
         :return: list
         """
-        left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [left_val * r for left_val, r in zip(left_list, right_list)]
+        return self._math(operator.mul, left_column, right_column, indexes, value)
 
-    def divide(self, left_column: Any, right_column: Any, indexes: list[Any] | list[bool] | None = None) -> list[Any]:
+    def divide(
+        self,
+        left_column: Any,
+        right_column: Any = None,
+        indexes: list[Any] | list[bool] | None = None,
+        value: Any = None,
+    ) -> list[Any]:
         """
-        Math helper method that divides element-wise two columns. If indexes are not None then will only perform the
-        math on that sub-set of the columns.
+        Math helper method that divides element-wise two columns, or a column by a single value. If indexes are not
+        None then will only perform the math on that sub-set of the columns.
 
         :param left_column: column name of dividend
         :param right_column: column name of divisor
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
+        :param value: if not None then divide every element of the left_column by this value
         :return: list
         """
-        left_list, right_list = self._get_lists(left_column, right_column, indexes)
-        return [left_val / r for left_val, r in zip(left_list, right_list)]
+        return self._math(operator.truediv, left_column, right_column, indexes, value)
 
-    def isin(self, column: Any, compare_list: list[Any]) -> list[bool]:
+    def isin(self, column: Any, compare_list: list[Any]) -> Mask:
         """
         Returns a boolean list where each element is whether that element in the column is in the compare_list.
 
         :param column: single column name, does not work for multiple columns
         :param compare_list: list of items to compare to
-        :return: list of booleans
+        :return: Mask
         """
+        index = self._secondary_index(column)
+        if index is not None:
+            return self._locations_mask(index.locations_in(compare_list))
         compare_set = set(compare_list)
-        return [x in compare_set for x in self._data[self._columns.index(column)]]
+        return Mask([x in compare_set for x in self._data[self._column_location(column)]])
+
+    def _equal_locations(self, column: ColumnT, value: Any) -> list[int]:
+        """
+        Return the locations of the rows where the column is equal to the value, from the secondary index of the
+        column if it has one or otherwise from a scan of the column.
+
+        :param column: column name
+        :param value: value to compare
+        :return: list of locations
+        """
+        index = self._secondary_index(column)
+        if index is None:
+            return [i for i, x in enumerate(self._data[self._column_location(column)]) if x == value]
+        return index.locations(value)
+
+    @overload
+    def where(self, column: ColumnT, value: Any, as_view: Literal[True]) -> DataFrameView[IndexT, ColumnT]: ...
+
+    @overload
+    def where(self, column: ColumnT, value: Any, as_view: Literal[False] = False) -> Self: ...
+
+    def where(self, column: ColumnT, value: Any, as_view: bool = False) -> Self | DataFrameView[IndexT, ColumnT]:
+        """
+        Return a DataFrame of the rows where the column is equal to the value. If the column has a secondary index, see
+        create_index(), then the rows are found from the index without a scan of the column.
+
+        :param column: column name
+        :param value: value to compare
+        :param as_view: if True then return a DataFrameView of the rows that does not copy the data
+        :return: DataFrame or DataFrameView
+        """
+        view = DataFrameView(self, self._equal_locations(column, value))
+        return view if as_view else cast(Self, view.to_frame())
+
+    def groupby(self, keys: ColumnT | list[ColumnT], sort: bool = True) -> GroupBy:
+        """
+        Group the rows by the values of one or more key columns. Call agg() on the result to get a new DataFrame of the
+        aggregations of each group, for example df.groupby("symbol").agg({"qty": "sum", "*": "count"}).
+
+        :param keys: key column name or list of key column names
+        :param sort: if True then the result is in order of the group keys, otherwise in the order the keys first
+            appear
+        :return: GroupBy
+        """
+        return GroupBy(self, keys, sort)
+
+    def _key_values(self, keys: list[ColumnT]) -> Sequence[Any]:
+        """
+        Return the values of the key columns, for more than one column these are tuples of the values of each row.
+
+        :param keys: list of column names
+        :return: column data or list of tuples
+        """
+        if len(keys) == 1:
+            return self._data[self._column_location(keys[0])]
+        return list(zip(*(self._data[self._column_location(x)] for x in keys)))
+
+    def join(
+        self,
+        other: DataFrame,
+        on: ColumnT | list[ColumnT] | None = None,
+        how: How = "inner",
+        columns: list[ColumnT] | None = None,
+        other_columns: list[Any] | None = None,
+        rsuffix: str = "_other",
+    ) -> Self:
+        """
+        Join the columns of another DataFrame to the rows of this DataFrame with the same key. The key is the index if
+        on is None, otherwise it is the values of the on column, or the tuple of the values of a list of columns, which
+        both DataFrames must have.
+
+        For how: "inner" keeps the rows with a match in both, "left" keeps all the rows of this DataFrame, "outer"
+        keeps all the rows of both, "semi" keeps the rows of this DataFrame with a match and "anti" the rows without
+        one. Semi and anti only filter this DataFrame and do not add columns. Missing values of rows without a match
+        are None, or NaN in a float typed column. An integer typed column with missing values is a list in the
+        result.
+
+        If on is None and both DataFrames are sort=True the rows are matched in one walk down both indexes, otherwise
+        by a hash table of the keys of the other DataFrame. A key that matches many rows makes a row for each match.
+        Only the columns in columns and other_columns are copied into the result.
+
+        A join on the index keeps the key as the index, so for sort=True the result is in key order. A join on columns
+        keeps the key columns once, from this DataFrame, and the result has a new integer index. Semi and anti keep the
+        index of this DataFrame.
+
+        :param other: DataFrame to join
+        :param on: (optional) column name or list of column names of the key, if None then the index
+        :param how: inner, left, outer, semi or anti
+        :param columns: (optional) list of the columns of this DataFrame to include, if None then all
+        :param other_columns: (optional) list of the columns of the other DataFrame to include, if None then all
+        :param rsuffix: added to the names of the columns of the other DataFrame that are also in the result
+        :return: new DataFrame
+        """
+        if how not in HOWS:
+            raise ValueError("how must be one of %s" % list(HOWS))
+        columns = self._columns.copy() if columns is None else list(columns)
+        other_columns = other._columns.copy() if other_columns is None else list(other_columns)
+        keys = [] if on is None else on if isinstance(on, list) else [on]
+        for column in columns:
+            self._column_location(column)
+        for column in other_columns:
+            other._column_location(column)
+
+        if on is None:
+            left_keys: Sequence[Any] = self._index
+            right_keys: Sequence[Any] = other._index
+        else:
+            left_keys = self._key_values(keys)
+            right_keys = other._key_values(keys)
+        merge = on is None and self._sort and other._sort
+        left_locations, right_locations = (merge_join if merge else hash_join)(left_keys, right_keys, how)
+
+        if right_locations is None:
+            # semi and anti are a subset of the rows of this DataFrame
+            data = [_take_locations(self._data[self._column_map[x]], left_locations) for x in columns]
+            index = _take_locations(self._index, left_locations)
+            dtypes = _typecodes(columns, data)
+            return self.from_columns(data, columns, index, self._index_name, self._sort, self._storage, dtypes, False)
+
+        columns = [x for x in keys if x not in columns] + columns
+        data = []
+        for column in columns:
+            column_data = self._data[self._column_map[column]]
+            values = _take_locations(column_data, left_locations)
+            if column in keys and how == "outer":
+                # the keys of the rows only in the other DataFrame come from the other DataFrame
+                other_values = other._data[other._column_location(column)]
+                values = [
+                    other_values[j] if i is None else x for i, j, x in zip(left_locations, right_locations, values)
+                ]
+                if isinstance(column_data, array):
+                    values = array(column_data.typecode, values)
+            data.append(values)
+        names = set(columns)
+        for column in other_columns:
+            if column in keys:
+                continue
+            name = column if column not in names else "%s%s" % (column, rsuffix)
+            names.add(name)
+            columns.append(name)
+            data.append(_take_locations(other._data[other._column_map[column]], right_locations))
+
+        dtypes = _typecodes(columns, data)
+        if on is not None:
+            return self.from_columns(data, columns, None, self._index_name, True, self._storage, dtypes, False)
+        if how == "outer" and not isinstance(left_locations, range):
+            index = [other._index[j] if i is None else self._index[i] for i, j in zip(left_locations, right_locations)]
+        else:
+            index = _take_locations(self._index, left_locations)
+        result = self.from_columns(data, columns, index, self._index_name, False, self._storage, dtypes, False)
+        if self._sort:
+            result.sort = True
+        return result
+
+    def merge_asof(
+        self,
+        other: DataFrame,
+        direction: Direction = "backward",
+        tolerance: Any = None,
+        by: ColumnT | list[ColumnT] | None = None,
+        other_columns: list[Any] | None = None,
+        rsuffix: str = "_other",
+    ) -> Self:
+        """
+        Join the columns of the row of another DataFrame with the nearest index to each row of this DataFrame, such as
+        the last quote at or before the time of each trade. Both DataFrames must be sort=True. For direction:
+        "backward" matches the last row of the other DataFrame with an index less than or equal to the index of the
+        row, "forward" the first row with an index greater than or equal to it, and "nearest" the closest row, where
+        a tie goes to the earlier row.
+
+        The match for each row starts where the match for the row before ended, so the whole join is one walk forward
+        through the index of the other DataFrame.
+
+        :param other: sort=True DataFrame to join
+        :param direction: backward, forward or nearest
+        :param tolerance: (optional) largest difference between the index values of a match, otherwise there is no
+            match. For a datetime index this is a timedelta
+        :param by: (optional) column name or list of column names that must also be equal for a match, such as the
+            symbol of the trade and quote
+        :param other_columns: (optional) list of the columns of the other DataFrame to include, if None then all
+            except the by columns
+        :param rsuffix: added to the names of the columns of the other DataFrame that are also in this DataFrame
+        :return: new DataFrame with the index and columns of this DataFrame and the columns of the other DataFrame.
+            Rows without a match have None, or NaN in a float typed column. An integer typed column with missing values
+            is a list in the result
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError("direction must be one of %s" % list(DIRECTIONS))
+        if not (self._sort and other._sort):
+            raise RuntimeError("Can only use merge_asof on sorted DataFrames")
+        keys = [] if by is None else by if isinstance(by, list) else [by]
+        if other_columns is None:
+            other_columns = [x for x in other._columns if x not in keys]
+        for column in other_columns:
+            other._column_location(column)
+
+        if keys:
+            locations = asof_join(
+                self._index, other._index, direction, tolerance, self._key_values(keys), other._key_values(keys)
+            )
+        else:
+            locations = asof_join(self._index, other._index, direction, tolerance)
+
+        rows = range(len(self._index))
+        columns = self._columns.copy()
+        data = [_take_locations(x, rows) for x in self._data]
+        names = set(columns)
+        for column in other_columns:
+            name = column if column not in names else "%s%s" % (column, rsuffix)
+            names.add(name)
+            columns.append(name)
+            data.append(_take_locations(other._data[other._column_map[column]], locations))
+        index = _take_locations(self._index, rows)
+        return self.from_columns(
+            data, columns, index, self._index_name, True, self._storage, _typecodes(columns, data), False
+        )
+
+    def resampler(self, freq: Any, agg: dict[ColumnT, Any]) -> Resampler:
+        """
+        Return a Resampler of the rows in buckets of equal width of the index, see resample(). The Resampler keeps the
+        result and each call to update() only computes again the last bucket and any new buckets from the rows
+        appended since the last call, so bars can be kept up to date on every tick with append_row().
+
+        :param freq: bucket width, a timedelta or a string such as "1s" or "5min" for a datetime index, or a number
+            for a number index
+        :param agg: dict of column name to reducer or list of reducers, see resample()
+        :return: Resampler
+        """
+        if not self._sort:
+            raise RuntimeError("Can only use resample on sorted DataFrames")
+        return Resampler(self, freq, agg, type(self), self._index_name)
+
+    def resample(self, freq: Any, agg: dict[ColumnT, Any]) -> DataFrame:
+        """
+        Aggregate the rows in buckets of equal width of the index, such as one minute bars of ticks indexed by
+        datetime or by int timestamps. The DataFrame must be sort=True. The bucket boundaries are found by bisection of
+        the index so there is no work for each row outside of the reducers. Only buckets that have rows are in the
+        result, which is indexed by the start of each bucket.
+
+        The agg is the same as for GroupBy.agg(): a dict of column name to reducer or list of reducers, where the
+        built-in reducers are first, last, min, max, sum, count and mean, "ohlc" is the open, high, low and close
+        columns, and "*": "count" is the number of rows. For example {"px": "ohlc", "qty": "sum", "*": "count"}.
+
+        :param freq: bucket width, a timedelta or a string such as "1s" or "5min" for a datetime index, or a number
+            for a number index
+        :param agg: dict of column name to reducer or list of reducers
+        :return: new DataFrame
+        """
+        return self.resampler(freq, agg).update()
 
     def iterrows(self, index: bool = True) -> Iterator[dict[Any, Any]]:
         """
@@ -1498,10 +2876,9 @@ class DataFrame[IndexT, ColumnT]:
         :param index: if True include the index in the results
         :return: dictionary
         """
-        for i in range(len(self._index)):
-            row = {self._index_name: self._index[i]} if index else dict()
-            for c, col in enumerate(self._columns):
-                row[col] = self._data[c][i]
+        for index_value, *values in zip(self._index, *self._data):
+            row = {self._index_name: index_value} if index else dict()
+            row.update(zip(self._columns, values))
             yield row
 
     def itertuples(self, index: bool = True, name: str = "Raccoon") -> Iterator[tuple[Any, ...]]:
@@ -1553,10 +2930,12 @@ class DataFrame[IndexT, ColumnT]:
 
         row_tuple = namedtuple(name, fields)
 
-        for row_index, index_value in enumerate(self._index):
-            values = [index_value] if index else []
-            values.extend(column_data[row_index] for column_data in self._data)
-            yield row_tuple(*values)
+        if index:
+            for values in zip(self._index, *self._data):
+                yield row_tuple(*values)
+        else:
+            for values in zip(*self._data, strict=True):
+                yield row_tuple(*values)
 
     def reset_index(self, drop: bool = False) -> None:
         """
@@ -1569,6 +2948,7 @@ class DataFrame[IndexT, ColumnT]:
         :param drop: if True then the current index is dropped, if False then index converted to columns
         :return: nothing
         """
+        self._check_writable()
         if not drop:
             if isinstance(self.index_name, tuple):
                 index_data = list(map(list, zip(*self._index)))
@@ -1581,6 +2961,93 @@ class DataFrame[IndexT, ColumnT]:
         self.index_name = "index"
 
     # DataFrame creation functions
+    @classmethod
+    def from_columns(
+        cls,
+        data: list[Sequence[Any]],
+        columns: list[ColumnT],
+        index: Sequence[IndexT] | None = None,
+        index_name: str | tuple | None = "index",
+        sort: bool | None = None,
+        storage: Literal["list", "blocked"] = "list",
+        dtypes: dict[Any, str] | None = None,
+        validate: bool = True,
+    ) -> Self:
+        """
+        Creates and return a DataFrame from a list of the column values and a list of the column names. Values that are
+        already in the container for the column, a list or BlockedList for the storage or an array of the dtype, are
+        used as is and not copied, as is a list index with list storage.
+
+        With validate=False the inputs are trusted to be valid: the columns are not padded, the index is not checked
+        for duplicates and for sort=True the index must already be sorted. This skips all the work of the constructor
+        and is for data that is known to be valid, such as data taken from another DataFrame.
+
+        :param data: list of the values of each column
+        :param columns: list of column names in the same order as data
+        :param index: (optional) list of index values. If None then the index will be integers starting with zero
+        :param index_name: (optional) name for the index. Default is "index"
+        :param sort: if True then DataFrame will keep the index sort. If None then will default to True if no index is
+            provided.
+        :param storage: "list" or "blocked", see the DataFrame constructor
+        :param dtypes: (optional) dict of column name to array typecode, see the DataFrame constructor
+        :param validate: if True then validate the columns and index, and if sort is True sort the index and columns
+            in place
+        :return: DataFrame
+        """
+        if storage not in ("list", "blocked"):
+            raise ValueError("storage must be list or blocked")
+        if sort is None:
+            sort = index is None
+        new = cls._trusted([], [], list(columns), index_name, sort, storage, dict(dtypes) if dtypes else {})
+        new._data = [new._to_column(c, x) for c, x in zip(new._columns, data)]
+        if index is None:
+            index = list(range(len(new._data[0]) if new._data else 0))
+        new._index = index if isinstance(index, list) and storage == "list" else new._new_list(index)
+        if validate:
+            if any(x not in TYPECODES for x in new._dtypes.values()):
+                raise ValueError("dtypes must be array typecodes in %s" % TYPECODES)
+            if len(data) != len(new._columns):
+                raise ValueError("number of column names does not match number of data columns")
+            new.validate_integrity()
+            if sort:
+                new.sort_index()
+        return new
+
+    @classmethod
+    def _trusted(
+        cls,
+        data: list[Any],
+        index: Any,
+        columns: list[ColumnT],
+        index_name: str | tuple | None,
+        sort: bool,
+        storage: str,
+        dtypes: dict[Any, str],
+    ) -> Self:
+        """
+        Creates and return a DataFrame from an index and columns that are known to be valid and are already in the
+        containers for the storage and dtypes. Nothing is checked, converted or copied, so the arguments must not be
+        shared with another DataFrame.
+
+        :return: DataFrame
+        """
+        new = cls.__new__(cls)
+        new._data = data
+        new._index = index
+        new._index_name = index_name
+        new._columns = columns
+        new._sort = sort
+        new._storage = storage
+        new._dtypes = dtypes
+        new._index_map = None
+        new._column_map = {column: i for i, column in enumerate(columns)}
+        new._aggregates = {}
+        new._secondary_indexes = {}
+        new._journal = None
+        new._in_order = True
+        new._mmap = None
+        return new
+
     @classmethod
     def from_json(cls, json_string: str) -> Self:
         """
@@ -1598,3 +3065,429 @@ class DataFrame[IndexT, ColumnT]:
             input_dict["meta_data"]["index_name"] = tuple(input_dict["meta_data"]["index_name"])
         data = input_dict["data"] if input_dict["data"] else None
         return cls(data=data, index=input_dict["index"], **input_dict["meta_data"])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Creates and return a DataFrame from the binary columnar format created by to_bytes. The index and columns are
+        trusted to be as they were saved, so they are not validated or sorted again.
+
+        :param data: bytes-like object
+        :return: DataFrame
+        """
+        meta_data, index, columns_data = serialize.read(data)
+        return cls.from_columns(columns_data, index=index, validate=False, **meta_data)
+
+    @classmethod
+    def load(cls, path: str) -> Self:
+        """
+        Creates and return a DataFrame from a file created by save.
+
+        :param path: file path
+        :return: DataFrame
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    @classmethod
+    def replay(
+        cls, path: str, attach: bool = False, sync_every: int = 100, checkpoint_bytes: int | None = None
+    ) -> Self:
+        """
+        Creates and return a DataFrame recovered from a journal started with attach_journal(). The checkpoint is
+        loaded and then the changes recorded in the log after it are applied in order. A partly written record at the
+        end of the log, from a crash during the write, is ignored.
+
+        :param path: file path of the log
+        :param attach: if True attach a journal to the DataFrame that continues recording to the same log
+        :param sync_every: number of records between each sync of the log to disk, if attach is True
+        :param checkpoint_bytes: (optional) checkpoint size of the log, if attach is True
+        :return: DataFrame
+        """
+        return Journal.replay(cls, path, attach, sync_every, checkpoint_bytes)
+
+    @overload
+    @classmethod
+    def read_csv(
+        cls,
+        path: str,
+        chunksize: None = None,
+        dtypes: dict[Any, str] | None = None,
+        index_col: Any | None = None,
+        sort: bool | None = None,
+        converters: dict[Any, Callable[[str], Any]] | None = None,
+        storage: Literal["list", "blocked"] = "list",
+        delimiter: str = ",",
+    ) -> Self: ...
+
+    @overload
+    @classmethod
+    def read_csv(
+        cls,
+        path: str,
+        chunksize: int,
+        dtypes: dict[Any, str] | None = None,
+        index_col: Any | None = None,
+        sort: bool | None = None,
+        converters: dict[Any, Callable[[str], Any]] | None = None,
+        storage: Literal["list", "blocked"] = "list",
+        delimiter: str = ",",
+    ) -> Iterator[Self]: ...
+
+    @classmethod
+    def read_csv(
+        cls,
+        path: str,
+        chunksize: int | None = None,
+        dtypes: dict[Any, str] | None = None,
+        index_col: Any | None = None,
+        sort: bool | None = None,
+        converters: dict[Any, Callable[[str], Any]] | None = None,
+        storage: Literal["list", "blocked"] = "list",
+        delimiter: str = ",",
+    ) -> Self | Iterator[Self]:
+        """
+        Creates and return a DataFrame from a CSV file with a header row of the column names. The file is read in
+        chunks of rows and each chunk is turned into columns that are converted and added to the DataFrame a whole
+        column at a time. If chunksize is given then instead of one DataFrame this returns a generator of DataFrames of
+        at most chunksize rows each, so files larger than memory can be processed.
+
+        Values are strings unless the column is in dtypes or converters. Empty fields are NaN in float typed columns,
+        raise an error in integer typed columns and are None in converted columns. Blank lines are skipped and the
+        column names in the header must be unique.
+
+        :param path: file path
+        :param chunksize: (optional) if not None then return a generator of DataFrames with this many rows
+        :param dtypes: (optional) dict of column name to array typecode, those columns are converted to int or float
+            and stored in an array.array of that typecode. A typecode for index_col converts the index values to int or
+            float, the index stays a list
+        :param index_col: (optional) name or position of the column to use as the index. If None then the index will
+            be integers starting with zero
+        :param sort: if True then DataFrame will keep the index sort. If None then will default to True if index_col is
+            None
+        :param converters: (optional) dict of column name to a function of one string argument that converts the values
+            of that column, for example {"qty": int, "time": datetime.fromisoformat}
+        :param storage: "list" or "blocked", see the DataFrame constructor
+        :param delimiter: field delimiter
+        :return: DataFrame, or generator of DataFrames if chunksize is not None
+        """
+        sort = (index_col is None) if sort is None else sort
+        chunks = cls._read_csv_chunks(
+            path, chunksize or csv_io.CHUNKSIZE, dtypes, index_col, converters, storage, delimiter
+        )
+        if chunksize is not None:
+            return (chunk._finish_csv(index_col is not None, sort) for chunk in chunks)
+        frame = next(chunks, None)
+        if frame is None:  # empty file
+            return cls(index_name="index" if index_col is None else index_col, sort=sort, storage=storage)
+        for chunk in chunks:
+            frame._index.extend(chunk._index)
+            for c in range(len(frame._data)):
+                frame._data[c].extend(chunk._data[c])
+        return frame._finish_csv(index_col is not None, sort)
+
+    @classmethod
+    def _read_csv_chunks(
+        cls,
+        path: str,
+        chunksize: int,
+        dtypes: dict[Any, str] | None,
+        index_col: Any | None,
+        converters: dict[Any, Callable[[str], Any]] | None,
+        storage: Literal["list", "blocked"],
+        delimiter: str,
+    ) -> Iterator[Self]:
+        """
+        Generator of the DataFrames for each chunk of a CSV file, see read_csv() for the parameters. The index of the
+        DataFrames is not validated or sorted.
+        """
+        dtypes = dtypes or {}
+        converters = converters or {}
+        start = 0
+        with open(path, newline="", encoding="utf-8") as file:
+            for header, columns_data in csv_io.read_chunks(file, chunksize, delimiter):
+                rows = len(columns_data[0]) if columns_data else 0
+                if index_col is None:
+                    index_name, index = "index", list(range(start, start + rows))
+                else:
+                    i = index_col if isinstance(index_col, int) else header.index(index_col)
+                    index_name = header[i]
+                    header = header[:i] + header[i + 1 :]
+                    index = csv_io.convert(columns_data.pop(i), dtypes.get(index_name), converters.get(index_name))
+                    if isinstance(index, array):
+                        index = index.tolist()
+                data = [csv_io.convert(x, dtypes.get(c), converters.get(c)) for c, x in zip(header, columns_data)]
+                start += rows
+                data_dtypes = {c: dtypes[c] for c in header if c in dtypes}
+                yield cls.from_columns(data, header, index, index_name, False, storage, data_dtypes, validate=False)
+
+    def _finish_csv(self, validate: bool, sort: bool) -> Self:
+        """
+        Validate the index of a DataFrame read from a CSV and sort it if required.
+
+        :param validate: if True then validate the index, which is only needed if it was read from the file
+        :param sort: sort value of the DataFrame
+        :return: this DataFrame
+        """
+        if validate:
+            self._validate_index(self._index)
+            if sort:
+                self.sort_index()
+        self._sort = sort
+        return self
+
+    @classmethod
+    def from_arrow(cls, table: Any, index_col: str | None = None) -> Self:
+        """
+        Creates and return a DataFrame from an Apache Arrow Table, which requires the pyarrow package. If the Table was
+        made by to_arrow() then the index, column names and meta data are restored. Typed array columns are copied
+        straight from the Arrow buffers, other columns are converted to lists.
+
+        :param table: pyarrow Table
+        :param index_col: (optional) name of the Table column to use as the index. If None then the index from
+            to_arrow() is used if there is one, otherwise the index will be integers starting with zero
+        :return: DataFrame
+        """
+        meta_data, index, data = arrow.from_table(table, index_col)
+        return cls(data=data or None, index=index, **meta_data)
+
+    @classmethod
+    def open_mmap(cls, path: str) -> Self:
+        """
+        Creates and return a read only DataFrame from a file created by save, by memory mapping the file. The index and
+        columns are MappedColumns that decode each value from the file only when it is read, so opening is fast no
+        matter the size of the file, and the pages of the file are shared by all the processes that open it. The
+        DataFrame can be read with get, get_slice, get_location, iterrows, itertuples and the other getters, which
+        return normal DataFrames. Any method that changes the DataFrame will raise a TypeError. Close the file with
+        close(), or use the DataFrame as a context manager.
+
+        :param path: file path
+        :return: DataFrame
+        """
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        header, data = serialize.read_header(buffer)
+        index = cast(list[Any], serialize.mapped(header["index"], data))
+        columns_data = [cast(list[Any], serialize.mapped(x, data)) for x in header["data"]]
+        frame = cls._trusted(columns_data, index, **header["meta_data"])
+        frame._mmap = buffer
+        return frame
+
+
+class DataFrameView[IndexT, ColumnT]:
+    """
+    DataFrameView class. The raccoon DataFrameView is a read only view of the rows and columns of a DataFrame, the
+    multi-column sibling of the ViewSeries. The view holds a reference to the parent DataFrame and either a range of
+    row locations or a list of row locations, so creating or slicing a view does not copy any data. The values are
+    read from the parent columns when they are accessed, use to_frame() to copy the view into a new DataFrame.
+
+    Because the view reads the parent DataFrame, changes to the values of the parent show in the view, and inserting or
+    deleting rows of the parent changes which rows the view covers.
+    """
+
+    __slots__ = ["_frame", "_rows", "_columns"]
+
+    def __init__(
+        self,
+        frame: DataFrame[IndexT, ColumnT],
+        rows: range | list[int] | None = None,
+        columns: list[ColumnT] | None = None,
+    ):
+        """
+        :param frame: parent DataFrame
+        :param rows: (optional) range of row locations or list of row locations. If None then all the rows. For a
+            sorted DataFrame the locations must be increasing to keep the view sorted.
+        :param columns: (optional) list of column names. If None then all the columns
+        """
+        if rows is None:
+            rows = range(len(frame))
+        elif not isinstance(rows, (range, list)):
+            raise TypeError("rows must be a range or a list of locations")
+        if columns is None:
+            columns = list(frame.columns)
+        elif not isinstance(columns, list):
+            raise TypeError("columns must be a list")
+        else:
+            for column in columns:
+                frame._column_location(column)
+        self._frame = frame
+        self._rows = rows
+        self._columns = columns
+
+    def __repr__(self) -> str:
+        return "DataFrameView(rows=%s, columns=%s)" % (self._rows, self._columns)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _take(self, values: Sequence[Any]) -> Any:
+        """
+        Return the values at the rows of the view. A range of rows with a step of one is a single slice.
+        """
+        rows = self._rows
+        if isinstance(rows, range) and rows.step == 1:
+            return values[rows.start : rows.stop]
+        return [values[i] for i in rows]
+
+    def _view(self, rows: range | list[int], columns: list[ColumnT] | None = None) -> DataFrameView[IndexT, ColumnT]:
+        return DataFrameView(self._frame, rows, self._columns if columns is None else columns)
+
+    @property
+    def frame(self) -> DataFrame[IndexT, ColumnT]:
+        return self._frame
+
+    @property
+    def rows(self) -> range | list[int]:
+        return self._rows
+
+    @property
+    def columns(self) -> list[ColumnT]:
+        return self._columns.copy()
+
+    @property
+    def index_name(self) -> str | tuple | None:
+        return self._frame.index_name
+
+    @property
+    def sort(self) -> bool:
+        return self._frame.sort and (not isinstance(self._rows, range) or self._rows.step > 0)
+
+    @property
+    def index(self) -> list[IndexT]:
+        """
+        Returns a list of the index values of the rows of the view, this is a copy.
+        """
+        return list(self._take(self._frame._index))
+
+    @property
+    def data(self) -> list[list[Any]]:
+        """
+        Returns a list of the values of each column of the view, these are copies.
+        """
+        return [self.get_entire_column(column) for column in self._columns]
+
+    def get_entire_column(self, column: ColumnT) -> list[Any]:
+        """
+        Returns a list of the values of a single column for the rows of the view.
+
+        :param column: column name
+        :return: list
+        """
+        return list(self._take(self._frame._data[self._frame._column_location(column)]))
+
+    def get_location(
+        self, location: int, columns: Any | list[Any] | None = None, index: bool = True
+    ) -> dict[Any, Any] | Any:
+        """
+        For a location in the view and either (1) list of columns return a dictionary of the values or (2) single
+        column name return the value of that cell. Can accept relative indexing from the end of the view in standard
+        python notation [-3, -2, -1]
+
+        :param location: location in the view in standard python form of positive or negative number
+        :param columns: list of columns, single column name, or None to include all columns of the view
+        :param index: if True then include the index in the dictionary
+        :return: dictionary or a single cell value
+        """
+        frame = self._frame
+        i = self._rows[location]
+        if columns is not None and not isinstance(columns, list):
+            return frame._data[frame._column_location(columns)][i]
+        row = {frame.index_name: frame._index[i]} if index else dict()
+        for column in self._columns if columns is None else columns:
+            row[column] = frame._data[frame._column_location(column)][i]
+        return row
+
+    def get_slice(self, start_index: Any = None, stop_index: Any = None) -> DataFrameView[IndexT, ColumnT]:
+        """
+        For sorted views return a view of all the rows where the index is greater than or equal to the start_index if
+        provided and less than or equal to the stop_index if provided. Both end points are considered inclusive. The
+        rows are found with a binary search so no data is copied.
+
+        :param start_index: lowest index value to include, or None to start from the first row
+        :param stop_index: highest index value to include, or None to end at the last row
+        :return: DataFrameView
+        """
+        if not self.sort:
+            raise RuntimeError("Can only use get_slice on sorted DataFrames")
+        index = self._frame._index
+        start = bisect_left(self._rows, start_index, key=index.__getitem__) if start_index is not None else None
+        stop = bisect_right(self._rows, stop_index, key=index.__getitem__) if stop_index is not None else None
+        return self._view(self._rows[start:stop])
+
+    def head(self, rows: int) -> DataFrameView[IndexT, ColumnT]:
+        """
+        Return a view of the first N rows
+
+        :param rows: number of rows
+        :return: DataFrameView
+        """
+        return self._view(self._rows[: max(0, rows)])
+
+    def tail(self, rows: int) -> DataFrameView[IndexT, ColumnT]:
+        """
+        Return a view of the last N rows
+
+        :param rows: number of rows
+        :return: DataFrameView
+        """
+        return self._view(self._rows[max(0, len(self._rows) - rows) :])
+
+    def __getitem__(self, index: Any) -> DataFrameView[IndexT, ColumnT] | list[Any]:
+        """
+        Convenience wrapper for using view[]. Slices are of locations in the view, not index values.
+        Usage...
+        view[2:5] -- view of the locations 2 to 4
+        view['a'] -- list of the values of the column
+        view[['a', 'b']] -- view of the columns
+
+        :param index: any of the parameters above
+        :return: DataFrameView or list
+        """
+        if isinstance(index, slice):
+            return self._view(self._rows[index])
+        if isinstance(index, list):
+            return self._view(self._rows, index)
+        return self.get_entire_column(index)
+
+    def iterrows(self, index: bool = True) -> Iterator[dict[Any, Any]]:
+        """
+        Iterates over the rows of the view as dictionary of the values.
+
+        :param index: if True include the index in the results
+        :return: dictionary
+        """
+        for location in range(len(self._rows)):
+            yield self.get_location(location, index=index)
+
+    def to_dict(self, index: bool = True) -> dict[Any, Any]:
+        """
+        Returns a dict where the keys are the column names and the values are lists of the values for that column.
+
+        :param index: If True then include the index in the dict with the index_name as the key
+        :return: dict
+        """
+        result = {self._frame.index_name: self.index} if index else dict()
+        for column in self._columns:
+            result[column] = self.get_entire_column(column)
+        return result
+
+    def to_frame(self) -> DataFrame[IndexT, ColumnT]:
+        """
+        Copies the rows and columns of the view into a new DataFrame.
+
+        :return: DataFrame
+        """
+        frame = self._frame
+        data = [frame._to_column(x, self._take(frame._data[frame._column_location(x)])) for x in self._columns]
+        new = frame._trusted(
+            data,
+            frame._to_index(list(self._take(frame._index))),
+            self.columns,
+            frame.index_name,
+            self.sort,
+            frame.storage,
+            frame._column_dtypes(self._columns),
+        )
+        if frame.sort and not new.sort:  # the rows of the view are not in index order
+            new.sort = True
+        return new
@@ -0,0 +1,210 @@
+"""
+GroupBy class, the grouping of the rows of a DataFrame by the values of key columns, returned by DataFrame.groupby()
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import Counter
+from operator import itemgetter
+from statistics import fmean
+from typing import Any, Callable, Sequence
+
+from raccoon.sort_utils import is_sorted
+
+Reducer = Callable[[Sequence[Any]], Any]
+
+
+def _skip_none(function: Reducer) -> Reducer:
+    """
+    Return a reducer that calls the function on the values that are not None. If all the values are None then count
+    and sum are zero and the others are None.
+    """
+
+    def reducer(values: Sequence[Any]) -> Any:
+        if None in values:
+            values = [x for x in values if x is not None]
+        if not values and function is not len and function is not sum:
+            return None
+        return function(values)
+
+    reducer.__name__ = getattr(function, "__name__", "reducer")
+    return reducer
+
+
+# built-in reducers by name, None values are not included
+REDUCERS: dict[str, Reducer] = {
+    "count": _skip_none(len),
+    "sum": _skip_none(sum),
+    "min": _skip_none(min),
+    "max": _skip_none(max),
+    "mean": _skip_none(fmean),
+    "first": _skip_none(itemgetter(0)),
+    "last": _skip_none(itemgetter(-1)),
+}
+
+
+# the column names and reducers of the "ohlc" reducer
+OHLC = (("open", "first"), ("high", "max"), ("low", "min"), ("close", "last"))
+
+
+def parse_aggregations(aggregations: dict[Any, Any]) -> list[tuple[Any, Any, Reducer]]:
+    """
+    Return the list of (result column, column, reducer) of a dict of the aggregations. The values of the dict are a
+    reducer name, a function or a list of them. A single reducer keeps the name of the column, a list of reducers makes
+    a column named (column, reducer name) for each. The column "*" with "count" is the number of rows named "count".
+    The reducer "ohlc" is the four columns (column, "open"), (column, "high"), (column, "low") and (column, "close").
+
+    :param aggregations: dict of column name to reducers
+    :return: list of tuples
+    """
+    results = []
+    for column, reducers in aggregations.items():
+        single = isinstance(reducers, str) or callable(reducers)
+        for reducer in [reducers] if single else reducers:
+            if reducer == "ohlc" and column != "*":
+                results.extend(((column, name), column, REDUCERS[x]) for name, x in OHLC)
+                continue
+            if isinstance(reducer, str):
+                if reducer not in REDUCERS:
+                    raise ValueError("reducer must be a function or one of %s" % (list(REDUCERS) + ["ohlc"]))
+                name, function = reducer, REDUCERS[reducer]
+            elif callable(reducer):
+                name, function = reducer.__name__, reducer
+            else:
+                raise TypeError("reducer must be a function or a name")
+            if column == "*":
+                if name != "count":
+                    raise ValueError('the only reducer for "*" is "count"')
+                results.append(("count", None, function))
+            else:
+                results.append((column if single else (column, name), column, function))
+    return results
+
+
+class GroupBy:
+    """
+    Rows of a DataFrame grouped by the values of one or more key columns. The groups are found in a single pass over
+    the key columns that hashes the key values straight from the column data, then agg() reduces each column with one
+    more pass to split the column into the groups.
+
+    If the DataFrame is sort=True and the key values are already in sorted order, such as a date column of a DataFrame
+    indexed by time, then the rows of each group are together. The group boundaries are then found by bisection and each
+    group is a slice of the column, with no hashing at all.
+    """
+
+    __slots__ = ["_frame", "_keys", "_sort"]
+
+    def __init__(self, frame: Any, keys: Any | list[Any], sort: bool = True):
+        """
+        :param frame: DataFrame
+        :param keys: key column name or list of key column names
+        :param sort: if True then the result is in order of the group keys, otherwise in the order the keys first
+            appear in the DataFrame
+        """
+        keys = list(keys) if isinstance(keys, list) else [keys]
+        if not keys:
+            raise ValueError("keys cannot be empty")
+        for key in keys:
+            frame._column_location(key)
+        self._frame = frame
+        self._keys = keys
+        self._sort = sort
+
+    def __repr__(self) -> str:
+        return "GroupBy(keys=%s, sort=%s)" % (self._keys, self._sort)
+
+    @property
+    def keys(self) -> list[Any]:
+        return self._keys.copy()
+
+    def agg(self, aggregations: dict[Any, Any]) -> Any:
+        """
+        Return a new DataFrame with a row for each group, the index is the group key and the columns are the
+        aggregations. For more than one key column the group key is a tuple of the key values and the index name is
+        the tuple of the key column names.
+
+        The aggregations are a dict of column name to a reducer or a list of reducers. A reducer is the name of one of
+        the built-in reducers: count, sum, min, max, mean, first and last, which do not include None values, or ohlc for
+        the four columns of first, max, min and last. Or it is a function that is called with the sequence of the values
+        of the group, including any None, and returns the result. For example {"qty": "sum", "px": ["min", "max"],
+        "*": "count"} has the columns "qty", ("px", "min"), ("px", "max") and "count", where "*" counts the rows of
+        each group.
+
+        A None key value is a group of its own. Keys that cannot be compared with each other, such as None with other
+        values, cannot be sorted, so then the result is sort=False with the groups in the order the keys first appear.
+
+        :param aggregations: dict of column name to reducer or list of reducers
+        :return: DataFrame
+        """
+        frame = self._frame
+        outputs = parse_aggregations(aggregations)
+        for _, column, _ in outputs:
+            if column is not None:
+                frame._column_location(column)
+        keys = frame._key_values(self._keys)
+        sort = self._sort
+        try:
+            runs = frame.sort and is_sorted(keys)
+        except TypeError:  # keys that cannot be compared, such as None, are grouped by hashing
+            runs = False
+
+        if runs:
+            # each group is a run of equal keys, so find the ends by bisection and split the columns by slicing
+            starts: list[int] = []
+            group_keys: list[Any] = []
+            start = 0
+            while start < len(keys):
+                starts.append(start)
+                group_keys.append(keys[start])
+                start = bisect_right(keys, keys[start], start)
+            ends = starts[1:] + [len(keys)]
+            counts = [end - start for start, end in zip(starts, ends)]
+
+            def split(values: Sequence[Any]) -> list[Sequence[Any]]:
+                return [values[start:end] for start, end in zip(starts, ends)]
+
+            order = None
+        else:
+            groups: dict[Any, int] = {}
+            codes = [groups.setdefault(key, len(groups)) for key in keys]
+            group_keys = list(groups)
+            counter = Counter(codes)
+            counts = [counter[code] for code in range(len(group_keys))]
+
+            def split(values: Sequence[Any]) -> list[Sequence[Any]]:
+                parts: list[list[Any]] = [[] for _ in group_keys]
+                appends = [part.append for part in parts]
+                for code, value in zip(codes, values):
+                    appends[code](value)
+                return parts
+
+            order = None
+            if sort:
+                try:
+                    order = sorted(range(len(group_keys)), key=group_keys.__getitem__)
+                except TypeError:  # keys that cannot be compared stay in the order they first appear
+                    sort = False
+
+        results = []
+        parts_cache: dict[Any, list[Sequence[Any]]] = {}
+        for _, column, function in outputs:
+            if column is None:
+                results.append(counts)
+                continue
+            if column not in parts_cache:
+                parts_cache[column] = split(frame._data[frame._column_location(column)])
+            results.append([function(x) for x in parts_cache[column]])
+
+        if order is not None:
+            group_keys = [group_keys[i] for i in order]
+            results = [[values[i] for i in order] for values in results]
+        index_name = self._keys[0] if len(self._keys) == 1 else tuple(self._keys)
+        return type(frame).from_columns(
+            results,
+            [name for name, _, _ in outputs],
+            index=group_keys,
+            index_name=index_name,
+            sort=sort,
+            validate=False,
+        )
@@ -0,0 +1,305 @@
+"""
+Implementation of the DataFrame interchange protocol, returned by DataFrame.__dataframe__(), so libraries that support
+the protocol can read a raccoon DataFrame without converting it through python objects. Typed array columns are
+handed over as their own buffer without a copy. List columns of ints, floats, bools, strings or datetimes are converted
+to buffers in a single pass.
+
+The protocol is described at https://data-apis.org/dataframe-protocol/latest/
+"""
+
+from __future__ import annotations
+
+import enum
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Sequence
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class DtypeKind(enum.IntEnum):
+    INT = 0
+    UINT = 1
+    FLOAT = 2
+    BOOL = 20
+    STRING = 21
+    DATETIME = 22
+    CATEGORICAL = 23
+
+
+class ColumnNullType(enum.IntEnum):
+    NON_NULLABLE = 0
+    USE_NAN = 1
+    USE_SENTINEL = 2
+    USE_BITMASK = 3
+    USE_BYTEMASK = 4
+
+
+class DlpackDeviceType(enum.IntEnum):
+    CPU = 1
+
+
+# Apache Arrow C format strings for the integer and float kinds by bit width
+ARROW_FORMATS = {
+    (DtypeKind.INT, 8): "c",
+    (DtypeKind.INT, 16): "s",
+    (DtypeKind.INT, 32): "i",
+    (DtypeKind.INT, 64): "l",
+    (DtypeKind.UINT, 8): "C",
+    (DtypeKind.UINT, 16): "S",
+    (DtypeKind.UINT, 32): "I",
+    (DtypeKind.UINT, 64): "L",
+    (DtypeKind.FLOAT, 32): "f",
+    (DtypeKind.FLOAT, 64): "g",
+}
+
+Dtype = tuple[DtypeKind, int, str, str]
+
+
+def typecode_dtype(typecode: str, itemsize: int) -> Dtype:
+    """
+    Return the protocol dtype of an array typecode.
+
+    :param typecode: array typecode
+    :param itemsize: size in bytes of each item
+    :return: tuple of (kind, bit width, format string, endianness)
+    """
+    if typecode in "fd":
+        kind = DtypeKind.FLOAT
+    elif typecode in "bhilq":
+        kind = DtypeKind.INT
+    else:
+        kind = DtypeKind.UINT
+    return kind, itemsize * 8, ARROW_FORMATS[(kind, itemsize * 8)], "="
+
+
+class Buffer:
+    """
+    Protocol buffer over an array. The buffer keeps a reference to the array so the memory stays valid.
+    """
+
+    __slots__ = ["_values"]
+
+    def __init__(self, values: array):
+        """
+        :param values: array that owns the memory
+        """
+        self._values = values
+
+    @property
+    def bufsize(self) -> int:
+        return self._values.itemsize * len(self._values)
+
+    @property
+    def ptr(self) -> int:
+        return self._values.buffer_info()[0]
+
+    def __dlpack__(self) -> Any:
+        raise NotImplementedError("__dlpack__ is not supported")
+
+    def __dlpack_device__(self) -> tuple[DlpackDeviceType, None]:
+        return DlpackDeviceType.CPU, None
+
+    def __repr__(self) -> str:
+        return "Buffer(bufsize=%s, ptr=%s)" % (self.bufsize, self.ptr)
+
+
+def _validity(values: Sequence[Any]) -> array | None:
+    """
+    Return a byte mask of 1 for the values that are not None and 0 for None, or None if there are no None values.
+    """
+    if None not in values:
+        return None
+    return array("B", [x is not None for x in values])
+
+
+def _encode(name: Any, values: Sequence[Any], allow_copy: bool) -> tuple[Dtype, dict[str, Any], int]:
+    """
+    Return the dtype, buffers and null count of a column.
+
+    :param name: column name, used in error messages
+    :param values: column data
+    :param allow_copy: if False then raise an error for columns that need a copy
+    :return: tuple of (dtype, dict of the buffers, null count)
+    """
+    if isinstance(values, array):
+        dtype = typecode_dtype(values.typecode, values.itemsize)
+        return dtype, {"data": (Buffer(values), dtype), "validity": None, "offsets": None}, 0
+    if not allow_copy:
+        raise RuntimeError("column %r is a list and exporting it requires a copy" % (name,))
+
+    kinds = set(map(type, values))
+    kinds.discard(type(None))
+    validity = _validity(values)
+    null_count = validity.count(0) if validity is not None else 0
+    kind = kinds.pop() if len(kinds) == 1 else (type(None) if not kinds else None)
+    buffers: dict[str, Any] = {"data": None, "validity": None, "offsets": None}
+    if validity is not None:
+        buffers["validity"] = (Buffer(validity), (DtypeKind.BOOL, 8, "b", "="))
+
+    if kind is int or kind is type(None):  # all None is exported as ints that are all null
+        data = array("q", [0 if x is None else x for x in values] if null_count else values)
+        dtype: Dtype = (DtypeKind.INT, 64, "l", "=")
+    elif kind is float:
+        data = array("d", [0.0 if x is None else x for x in values] if null_count else values)
+        dtype = (DtypeKind.FLOAT, 64, "g", "=")
+    elif kind is bool:
+        data = array("B", [False if x is None else x for x in values] if null_count else values)
+        dtype = (DtypeKind.BOOL, 8, "b", "=")
+    elif kind is str:
+        strings = ["" if x is None else x for x in values] if null_count else values
+        encoded = [x.encode() for x in strings]
+        offsets = array("q", [0])
+        position = 0
+        for x in encoded:
+            position += len(x)
+            offsets.append(position)
+        data = array("B", b"".join(encoded))
+        dtype = (DtypeKind.STRING, 8, "U", "=")
+        buffers["offsets"] = (Buffer(offsets), (DtypeKind.INT, 64, "l", "="))
+        buffers["data"] = (Buffer(data), (DtypeKind.UINT, 8, "C", "="))
+        return dtype, buffers, null_count
+    elif kind is datetime:
+        tzinfos = {x.tzinfo for x in values if x is not None}
+        if tzinfos not in ({None}, {timezone.utc}):
+            raise TypeError("column %r has datetimes with mixed or non UTC time zones" % (name,))
+        tzinfo = tzinfos.pop()
+        epoch = EPOCH if tzinfo is None else EPOCH_UTC
+        data = array("q", [0 if x is None else (x - epoch) // MICROSECOND for x in values])
+        dtype = (DtypeKind.DATETIME, 64, "tsu:" if tzinfo is None else "tsu:UTC", "=")
+    else:
+        raise TypeError("column %r must contain only one of int, float, bool, str or datetime values" % (name,))
+    buffers["data"] = (Buffer(data), dtype)
+    return dtype, buffers, null_count
+
+
+class Column:
+    """
+    Protocol column of a raccoon DataFrame column. The buffers are created when the column is created.
+    """
+
+    __slots__ = ["_name", "_size", "_dtype", "_buffers", "_null_count", "_nan_as_null"]
+
+    def __init__(self, name: Any, values: Sequence[Any], allow_copy: bool = True, nan_as_null: bool = False):
+        """
+        :param name: column name
+        :param values: column data
+        :param allow_copy: if False then raise a RuntimeError if the column cannot be exported without a copy
+        :param nan_as_null: kept for the protocol, NaN values are not treated as null
+        """
+        self._name = name
+        self._size = len(values)
+        self._dtype, self._buffers, self._null_count = _encode(name, values, allow_copy)
+        self._nan_as_null = nan_as_null
+
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def offset(self) -> int:
+        return 0
+
+    @property
+    def dtype(self) -> Dtype:
+        return self._dtype
+
+    @property
+    def describe_categorical(self) -> dict[str, Any]:
+        raise TypeError("raccoon columns are not categorical")
+
+    @property
+    def describe_null(self) -> tuple[ColumnNullType, Any]:
+        if self._buffers["validity"] is not None:
+            return ColumnNullType.USE_BYTEMASK, 0
+        if self._dtype[0] == DtypeKind.FLOAT:
+            return ColumnNullType.USE_NAN, None
+        return ColumnNullType.NON_NULLABLE, None
+
+    @property
+    def null_count(self) -> int:
+        return self._null_count
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return {}
+
+    def num_chunks(self) -> int:
+        return 1
+
+    def get_chunks(self, n_chunks: int | None = None) -> Iterator[Column]:
+        if n_chunks is not None and n_chunks != 1:
+            raise ValueError("raccoon columns only have one chunk")
+        yield self
+
+    def get_buffers(self) -> dict[str, Any]:
+        return dict(self._buffers)
+
+
+class InterchangeFrame:
+    """
+    Protocol DataFrame of a raccoon DataFrame. The index is not a column in the protocol, it is in the metadata under
+    "raccoon.index" and "raccoon.index_name".
+    """
+
+    __slots__ = ["_frame", "_nan_as_null", "_allow_copy", "_columns"]
+
+    def __init__(
+        self, frame: Any, nan_as_null: bool = False, allow_copy: bool = True, columns: list[Any] | None = None
+    ):
+        """
+        :param frame: raccoon DataFrame
+        :param nan_as_null: kept for the protocol, NaN values are not treated as null
+        :param allow_copy: if False then raise a RuntimeError for any column that cannot be exported without a copy
+        :param columns: (optional) list of the column names to include, if None then all columns
+        """
+        self._frame = frame
+        self._nan_as_null = nan_as_null
+        self._allow_copy = allow_copy
+        self._columns = frame.columns if columns is None else columns
+
+    def __dataframe__(self, nan_as_null: bool = False, allow_copy: bool = True) -> InterchangeFrame:
+        return InterchangeFrame(self._frame, nan_as_null, allow_copy, self._columns)
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        return {"raccoon.index": self._frame.index, "raccoon.index_name": self._frame.index_name}
+
+    def num_columns(self) -> int:
+        return len(self._columns)
+
+    def num_rows(self) -> int:
+        return len(self._frame)
+
+    def num_chunks(self) -> int:
+        return 1
+
+    def column_names(self) -> list[str]:
+        return [str(x) for x in self._columns]
+
+    def get_column(self, i: int) -> Column:
+        return self.get_column_by_name(self._columns[i])
+
+    def get_column_by_name(self, name: Any) -> Column:
+        if name not in self._columns:
+            name = self._columns[self.column_names().index(name)]
+        values = self._frame._data[self._frame._column_location(name)]
+        return Column(name, values, self._allow_copy, self._nan_as_null)
+
+    def get_columns(self) -> Iterator[Column]:
+        for column in self._columns:
+            yield self.get_column_by_name(column)
+
+    def select_columns(self, indices: Sequence[int]) -> InterchangeFrame:
+        return InterchangeFrame(self._frame, self._nan_as_null, self._allow_copy, [self._columns[i] for i in indices])
+
+    def select_columns_by_name(self, names: Sequence[str]) -> InterchangeFrame:
+        column_names = self.column_names()
+        columns = [self._columns[column_names.index(x)] for x in names]
+        return InterchangeFrame(self._frame, self._nan_as_null, self._allow_copy, columns)
+
+    def get_chunks(self, n_chunks: int | None = None) -> Iterator[InterchangeFrame]:
+        if n_chunks is not None and n_chunks != 1:
+            raise ValueError("raccoon DataFrames only have one chunk")
+        yield self
@@ -0,0 +1,202 @@
+"""
+Utility functions that match the rows of two DataFrames by their key values for DataFrame.join() and
+DataFrame.merge_asof(). Each returns the row locations to take from each side, with None where a side has no matching
+row.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Literal, Sequence
+
+How = Literal["inner", "left", "outer", "semi", "anti"]
+
+HOWS = ("inner", "left", "outer", "semi", "anti")
+
+Direction = Literal["backward", "forward", "nearest"]
+
+DIRECTIONS = ("backward", "forward", "nearest")
+
+Locations = list[int | None] | range
+
+
+def hash_join(left: Sequence[Any], right: Sequence[Any], how: How) -> tuple[Locations, Locations | None]:
+    """
+    Match the keys with a hash table of the right keys. The result is in the order of the left keys, and for
+    each left key the matches are in the order of the right keys. For an outer join the right rows with no match follow
+    in their order.
+
+    :param left: left key values
+    :param right: right key values
+    :param how: inner, left, outer, semi or anti
+    :return: tuple of (left locations, right locations), for semi and anti the right locations are None
+    """
+    if how == "semi" or how == "anti":
+        right_set = set(right)
+        keep = how == "semi"
+        return [i for i, key in enumerate(left) if (key in right_set) is keep], None
+
+    table: dict[Any, list[int]] = {}
+    for j, key in enumerate(right):
+        matches = table.get(key)
+        if matches is None:
+            table[key] = [j]
+        else:
+            matches.append(j)
+
+    left_locations: list[int | None] = []
+    right_locations: list[int | None] = []
+    keep_unmatched = how != "inner"
+    for i, key in enumerate(left):
+        matches = table.get(key)
+        if matches is None:
+            if keep_unmatched:
+                left_locations.append(i)
+                right_locations.append(None)
+        elif len(matches) == 1:
+            left_locations.append(i)
+            right_locations.append(matches[0])
+        else:
+            left_locations.extend([i] * len(matches))
+            right_locations.extend(matches)
+
+    if how == "outer":
+        left_set = set(left)
+        for j, key in enumerate(right):
+            if key not in left_set:
+                left_locations.append(None)
+                right_locations.append(j)
+    return left_locations, right_locations
+
+
+def merge_join(left: Sequence[Any], right: Sequence[Any], how: How) -> tuple[Locations, Locations | None]:
+    """
+    Match the keys of two sorted sequences in one walk down both. The result is in key order. If the keys of both
+    sides are the same then the locations are ranges without any matching.
+
+    :param left: left key values, in sorted order
+    :param right: right key values, in sorted order
+    :param how: inner, left, outer, semi or anti
+    :return: tuple of (left locations, right locations), for semi and anti the right locations are None
+    """
+    if left == right:
+        if how == "anti":
+            return [], None
+        return range(len(left)), None if how == "semi" else range(len(right))
+
+    left_locations: list[int | None] = []
+    right_locations: list[int | None] = []
+    keep_left = how in ("left", "outer", "anti")
+    keep_right = how == "outer"
+    pairs = how in ("inner", "left", "outer")
+    i = j = 0
+    n, m = len(left), len(right)
+    while i < n and j < m:
+        key = left[i]
+        other = right[j]
+        if key < other:
+            if keep_left:
+                left_locations.append(i)
+                right_locations.append(None)
+            i += 1
+        elif other < key:
+            if keep_right:
+                left_locations.append(None)
+                right_locations.append(j)
+            j += 1
+        else:
+            i_end = i + 1 if i + 1 == n or left[i + 1] != key else bisect_right(left, key, i)
+            j_end = j + 1 if j + 1 == m or right[j + 1] != key else bisect_right(right, key, j)
+            if pairs:
+                for x in range(i, i_end):
+                    left_locations.extend([x] * (j_end - j))
+                    right_locations.extend(range(j, j_end))
+            elif how == "semi":
+                left_locations.extend(range(i, i_end))
+            i, j = i_end, j_end
+    if keep_left and i < n:
+        left_locations.extend(range(i, n))
+        right_locations.extend([None] * (n - i))
+    if keep_right and j < m:
+        left_locations.extend([None] * (m - j))
+        right_locations.extend(range(j, m))
+    return left_locations, right_locations if pairs else None
+
+
+def _asof_match(keys: Sequence[Any], key: Any, lo: int, direction: Direction, tolerance: Any) -> tuple[int, int | None]:
+    """
+    Find the as of match of the key in the sorted keys starting the search at lo.
+
+    :return: tuple of (position to start the search for the next larger key, location of the match or None)
+    """
+    if direction == "backward":
+        i = bisect_right(keys, key, lo)
+        match = i - 1 if i > 0 else None
+    else:
+        i = bisect_left(keys, key, lo)
+        if direction == "forward" or i == 0:
+            match = i if i < len(keys) else None
+        elif i == len(keys) or key - keys[i - 1] <= keys[i] - key:
+            match = i - 1
+        else:
+            match = i
+    if match is not None and tolerance is not None and abs(key - keys[match]) > tolerance:
+        match = None
+    return i, match
+
+
+def asof_join(
+    left: Sequence[Any],
+    right: Sequence[Any],
+    direction: Direction = "backward",
+    tolerance: Any = None,
+    left_by: Sequence[Any] | None = None,
+    right_by: Sequence[Any] | None = None,
+) -> list[int | None]:
+    """
+    For each left key find the right row with the last key less than or equal to it for "backward", the first key
+    greater than or equal to it for "forward", or the closest key for "nearest", where a tie goes to the earlier row.
+    Both keys must be in sorted order. Because the left keys only increase the search for each one starts where the
+    last one ended, so this is a single walk forward through the right keys where each step is a bisection.
+
+    With left_by and right_by only the right rows with the same by value as the left row are matched, the right rows
+    are split by the by value in one pass and each group keeps its own place in the walk.
+
+    :param left: left key values, in sorted order
+    :param right: right key values, in sorted order
+    :param direction: backward, forward or nearest
+    :param tolerance: (optional) largest difference between the left and right keys of a match
+    :param left_by: (optional) by values of the left rows
+    :param right_by: (optional) by values of the right rows
+    :return: list of the right location for each left row, None if there is no match
+    """
+    result: list[int | None] = []
+    if left_by is None or right_by is None:
+        position = 0
+        if direction == "backward" and tolerance is None:  # the most common case without the call per row
+            for key in left:
+                position = bisect_right(right, key, position)
+                result.append(position - 1 if position else None)
+            return result
+        for key in left:
+            position, match = _asof_match(right, key, position, direction, tolerance)
+            result.append(match)
+        return result
+
+    groups: dict[Any, tuple[list[Any], list[int]]] = {}
+    for j, (key, by) in enumerate(zip(right, right_by)):
+        group = groups.get(by)
+        if group is None:
+            groups[by] = ([key], [j])
+        else:
+            group[0].append(key)
+            group[1].append(j)
+    positions = dict.fromkeys(groups, 0)
+    for key, by in zip(left, left_by):
+        group = groups.get(by)
+        if group is None:
+            result.append(None)
+            continue
+        positions[by], match = _asof_match(group[0], key, positions[by], direction, tolerance)
+        result.append(None if match is None else group[1][match])
+    return result
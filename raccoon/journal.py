@@ -0,0 +1,269 @@
+"""
+Journal class, the append-only write-ahead log of the changes made to a DataFrame so it can be recovered after a crash
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import struct
+import zlib
+from typing import IO, Any, Callable
+
+from raccoon import serialize
+
+# operations recorded in the journal, the location in this tuple is the operation code stored in each record
+OPERATIONS = (
+    "set_cell",
+    "set_row",
+    "set_column",
+    "set_location",
+    "append_row",
+    "append_rows",
+    "delete_rows",
+    "delete_all_rows",
+    "delete_columns",
+    "rename_columns",
+    "append",
+)
+OPERATION_CODES = {name: code for code, name in enumerate(OPERATIONS)}
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+# the log starts with the magic number and the generation of the checkpoint it follows
+LOG_HEADER = struct.Struct("<8sQ")
+LOG_MAGIC = b"RACCOONJ"
+# each record is the length and CRC32 of the payload followed by the payload
+RECORD_HEADER = struct.Struct("<II")
+
+
+def _fsync_directory(path: str) -> None:
+    """
+    Sync the directory of the path so a file renamed into it is durable. Not all platforms can open a directory, in
+    which case this does nothing.
+    """
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_file(path: str, write: Callable[[IO[bytes]], None]) -> None:
+    """
+    Atomically replace the file at the path: write to a temporary file, sync it and then rename it over the path.
+
+    :param path: file path
+    :param write: function that writes the contents to a binary file object
+    :return: nothing
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        write(file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    _fsync_directory(path)
+
+
+class Journal:
+    """
+    Append-only write-ahead log of the changes made to a DataFrame. Each call to set_cell, set_row, set_column,
+    set_location, append_row, append_rows, append, delete_rows, delete_all_rows, delete_columns and rename_columns is
+    recorded as the operation and its arguments in a compact binary record with a CRC32 check. Any other change to the
+    index or columns, such as sort_index() or setting the index, takes a checkpoint.
+
+    A checkpoint saves the entire DataFrame in the binary columnar format to the path with ".checkpoint" added, and
+    then starts a new empty log, so recovery only has to replay the changes since the last checkpoint. Use
+    checkpoint_bytes to take a checkpoint automatically whenever the log grows past that size.
+
+    The records are written in batches, with the file flushed and synced to disk every sync_every records. On a crash
+    the records written since the last sync may be lost, and any partly written record at the end of the log is
+    ignored on replay.
+
+    Use DataFrame.attach_journal() to start a journal and DataFrame.replay() to recover the DataFrame.
+    """
+
+    __slots__ = ["_frame", "_path", "_sync_every", "_checkpoint_bytes", "_generation", "_file", "_unsynced"]
+
+    def __init__(self, frame: Any, path: str, sync_every: int = 100, checkpoint_bytes: int | None = None):
+        """
+        :param frame: DataFrame the journal is for
+        :param path: file path of the log
+        :param sync_every: number of records between each sync of the log to disk
+        :param checkpoint_bytes: (optional) if not None take a checkpoint when the log is larger than this size
+        """
+        if sync_every < 1:
+            raise ValueError("sync_every must be at least 1")
+        self._frame = frame
+        self._path = path
+        self._sync_every = sync_every
+        self._checkpoint_bytes = checkpoint_bytes
+        self._generation = 0
+        self._file: IO[bytes] | None = None
+        self._unsynced = 0
+
+    def __repr__(self) -> str:
+        return "Journal(path=%r, generation=%s, size=%s)" % (self._path, self._generation, self.size)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def checkpoint_path(self) -> str:
+        return self._path + CHECKPOINT_SUFFIX
+
+    @property
+    def generation(self) -> int:
+        """
+        Number of checkpoints taken, which is stored in both the checkpoint and the log so a log that was left behind
+        by a crash during a checkpoint is never replayed on top of the newer checkpoint
+        """
+        return self._generation
+
+    @property
+    def size(self) -> int:
+        """
+        Size of the log in bytes, including the records not yet synced
+        """
+        return self._file.tell() if self._file is not None else 0
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def record(self, operation: str, *args: Any) -> None:
+        """
+        Record an operation. This is called by the DataFrame after each change and does not need to be called directly.
+        The arguments are pickled, so the values stored in a DataFrame with a journal must be able to be pickled.
+
+        :param operation: name of the DataFrame method
+        :param args: arguments of the method
+        :return: nothing
+        """
+        if self._file is None:
+            raise ValueError("journal is closed")
+        payload = pickle.dumps((OPERATION_CODES[operation], args), protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._unsynced += 1
+        if self._unsynced >= self._sync_every:
+            self.sync()
+        if self._checkpoint_bytes is not None and self._file.tell() > self._checkpoint_bytes:
+            self.checkpoint()
+
+    def sync(self) -> None:
+        """
+        Flush the records written and sync the log to disk.
+
+        :return: nothing
+        """
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def checkpoint(self) -> None:
+        """
+        Save the entire DataFrame to the checkpoint file and start a new empty log. Both files are replaced atomically,
+        the checkpoint first, so there is always a checkpoint and log that together recover the DataFrame.
+
+        :return: nothing
+        """
+        generation = self._generation + 1
+        frame = self._frame
+
+        def write_checkpoint(file: IO[bytes]) -> None:
+            file.write(generation.to_bytes(8, "little"))
+            serialize.write(file, frame._meta_data(), frame._index, frame._data)
+
+        _write_file(self.checkpoint_path, write_checkpoint)
+        self._new_log(generation)
+
+    def _new_log(self, generation: int) -> None:
+        """
+        Replace the log with an empty log for the generation and open it for appending.
+        """
+        if self._file is not None:
+            self._file.close()
+        _write_file(self._path, lambda file: file.write(LOG_HEADER.pack(LOG_MAGIC, generation)))
+        self._generation = generation
+        self._open(LOG_HEADER.size)
+
+    def _open(self, end: int) -> None:
+        """
+        Open the log for appending after cutting it to the end of the last complete record.
+        """
+        file = open(self._path, "r+b")
+        file.truncate(end)
+        file.seek(end)
+        self._file = file
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """
+        Sync and close the log. No more operations can be recorded.
+
+        :return: nothing
+        """
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    @classmethod
+    def replay(
+        cls,
+        frame_class: Any,
+        path: str,
+        attach: bool = False,
+        sync_every: int = 100,
+        checkpoint_bytes: int | None = None,
+    ) -> Any:
+        """
+        Recover a DataFrame by loading the checkpoint and then applying every complete record in the log. Records in a
+        log from an older generation than the checkpoint are already in the checkpoint and are skipped.
+
+        :param frame_class: DataFrame class to create
+        :param path: file path of the log
+        :param attach: if True attach a journal to the recovered DataFrame that continues the same log
+        :param sync_every: number of records between each sync of the log to disk, if attach is True
+        :param checkpoint_bytes: (optional) checkpoint size of the log, if attach is True
+        :return: DataFrame
+        """
+        with open(path + CHECKPOINT_SUFFIX, "rb") as file:
+            checkpoint = file.read()
+        generation = int.from_bytes(checkpoint[:8], "little")
+        frame = frame_class.from_bytes(memoryview(checkpoint)[8:])
+
+        with open(path, "rb") as file:
+            log = file.read()
+        end = LOG_HEADER.size
+        magic, log_generation = LOG_HEADER.unpack_from(log) if len(log) >= end else (None, None)
+        if magic != LOG_MAGIC and magic is not None:
+            raise ValueError("not a raccoon journal file")
+        current = log_generation == generation
+        while current and end + RECORD_HEADER.size <= len(log):
+            length, crc = RECORD_HEADER.unpack_from(log, end)
+            start = end + RECORD_HEADER.size
+            payload = log[start : start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break  # partly written record from a crash
+            code, args = pickle.loads(payload)
+            getattr(frame, OPERATIONS[code])(*args)
+            end = start + length
+
+        if attach:
+            journal = cls(frame, path, sync_every, checkpoint_bytes)
+            journal._generation = generation
+            if current:
+                journal._open(end)
+            else:
+                journal._new_log(generation)
+            frame._journal = journal
+        return frame
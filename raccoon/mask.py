@@ -0,0 +1,56 @@
+"""
+Mask class, the boolean list returned by select_index, isin, equality and the comparison methods
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+
+class Mask(list[bool]):
+    """
+    A list of booleans that selects rows, one boolean for each row. A Mask is a list so it can be used anywhere a
+    boolean list is accepted, but when passed to the get, set and delete methods it is known to be a boolean list
+    without checking every element, so those methods skip the per-element type check that a plain list requires.
+
+    Masks can be combined element-wise with & (and), | (or) and ~ (not).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, values: Iterable[bool] = ()):
+        """
+        :param values: iterable of booleans
+        """
+        super().__init__(values)
+
+    def _check_length(self, other: list[bool]) -> None:
+        if len(other) != len(self):
+            raise ValueError("masks must be the same length")
+
+    def __and__(self, other: list[bool]) -> Mask:  # type: ignore[override]
+        self._check_length(other)
+        return Mask([x and y for x, y in zip(self, other)])
+
+    def __or__(self, other: list[bool]) -> Mask:  # type: ignore[override]
+        self._check_length(other)
+        return Mask([x or y for x, y in zip(self, other)])
+
+    def __invert__(self) -> Mask:
+        return Mask([not x for x in self])
+
+    def __repr__(self) -> str:
+        return "Mask(%s)" % super().__repr__()
+
+
+def is_mask(values: Any) -> bool:
+    """
+    Return True if the values are a boolean list. A Mask is known to be one without looking at the elements, any other
+    list must be non-empty and have every element a bool.
+
+    :param values: Mask or list
+    :return: boolean
+    """
+    if isinstance(values, Mask):
+        return True
+    return bool(values) and isinstance(values[0], bool) and all(isinstance(i, bool) for i in values)
@@ -0,0 +1,170 @@
+"""
+Element-wise math and comparison functions used by the DataFrame math helper methods. If NumPy is installed then typed
+array columns are calculated with NumPy, otherwise and for all list columns the calculation is pure python. Both paths
+return the same python list.
+"""
+
+import operator
+from array import array
+from collections.abc import Sequence
+from typing import Any, Callable
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+# functions that can be calculated with numpy, mapped to the numpy ufunc name
+NUMPY_FUNCTIONS = {
+    operator.add: "add",
+    operator.sub: "subtract",
+    operator.mul: "multiply",
+    operator.truediv: "true_divide",
+    operator.gt: "greater",
+    operator.lt: "less",
+    operator.ge: "greater_equal",
+    operator.le: "less_equal",
+}
+
+# python ints with an absolute value below this convert to float exactly, so mixed int and float math is the same
+EXACT_FLOAT_INT = 2**53
+INT64_LIMIT = 2**63
+
+
+def _to_numpy(values: Sequence[Any]) -> Any:
+    """
+    Return a numpy array of int64 or float64 for a typed array column, or None if the values are not a typed array or
+    cannot be converted without changing the values. No copy is made for int64 and float64 arrays.
+
+    :param values: column data
+    :return: numpy array or None
+    """
+    if not isinstance(values, array):
+        return None
+    data = np.frombuffer(values, dtype=values.typecode) if len(values) else np.array([], dtype=values.typecode)
+    if data.dtype.kind == "f":
+        return data.astype(np.float64, copy=False)
+    if data.dtype.kind == "u" and data.dtype.itemsize == 8 and len(data) and int(data.max()) >= INT64_LIMIT:
+        return None
+    return data.astype(np.int64, copy=False)
+
+
+def _max_abs(data: Any) -> int:
+    """
+    Return the largest absolute value in an int64 numpy array as a python int.
+    """
+    if not len(data):
+        return 0
+    return max(abs(int(data.min())), abs(int(data.max())))
+
+
+def _is_exact(func: Callable[[Any, Any], Any], left: Any, right: Any) -> bool:
+    """
+    Return True if the numpy calculation will give exactly the same result as python. Integer math in python never
+    overflows, comparisons of ints and floats in python are exact, and division by zero raises an error, so those
+    cases return False and are left to python.
+
+    :param func: operator function
+    :param left: left numpy array
+    :param right: right numpy array, or python int or float scalar
+    :return: boolean
+    """
+    if isinstance(right, float):
+        right_int, right_max = False, 0
+    elif isinstance(right, int):
+        right_int, right_max = True, abs(right)
+    else:
+        right_int = right.dtype.kind == "i"
+        right_max = _max_abs(right) if right_int else 0
+    left_int = left.dtype.kind == "i"
+    left_max = _max_abs(left) if left_int else 0
+
+    if func is operator.truediv and np.any(right == 0):
+        return False
+    if left_int and right_int:
+        if func in (operator.add, operator.sub):
+            return left_max + right_max < INT64_LIMIT
+        if func is operator.mul:
+            return left_max * right_max < INT64_LIMIT
+        if func is operator.truediv:
+            return left_max < EXACT_FLOAT_INT and right_max < EXACT_FLOAT_INT
+        return right_max < INT64_LIMIT
+    # one side is float, so the ints will be converted to float
+    return left_max < EXACT_FLOAT_INT and right_max < EXACT_FLOAT_INT
+
+
+def _numpy_op(func: Callable[[Any, Any], Any], left: Sequence[Any], right: Sequence[Any] | Any, scalar: bool) -> Any:
+    """
+    Calculate with numpy if possible.
+
+    :return: list of the results, or None if the calculation cannot be done with numpy
+    """
+    if np is None or func not in NUMPY_FUNCTIONS:
+        return None
+    left_data = _to_numpy(left)
+    if left_data is None:
+        return None
+    if scalar:
+        if type(right) not in (int, float):
+            return None
+        right_data = right
+    else:
+        right_data = _to_numpy(right)
+        if right_data is None or len(right_data) != len(left_data):
+            return None
+    if not _is_exact(func, left_data, right_data):
+        return None
+    return getattr(np, NUMPY_FUNCTIONS[func])(left_data, right_data).tolist()
+
+
+def binary_op(func: Callable[[Any, Any], Any], left: Sequence[Any], right: Sequence[Any]) -> list[Any]:
+    """
+    Apply the function element-wise to two sequences of the same length.
+
+    :param func: function of two arguments, such as operator.add
+    :param left: left sequence
+    :param right: right sequence
+    :return: list of results
+    """
+    result = _numpy_op(func, left, right, scalar=False)
+    if result is not None:
+        return result
+    return list(map(func, left, right))
+
+
+def scalar_op(func: Callable[[Any, Any], Any], left: Sequence[Any], value: Any) -> list[Any]:
+    """
+    Apply the function element-wise to a sequence and a single value that is broadcast to every element.
+
+    :param func: function of two arguments, such as operator.add
+    :param left: sequence
+    :param value: single value used as the right argument of the function for every element
+    :return: list of results
+    """
+    result = _numpy_op(func, left, value, scalar=True)
+    if result is not None:
+        return result
+    return [func(x, value) for x in left]
+
+
+def between(values: Sequence[Any], low: Any = None, high: Any = None) -> list[bool]:
+    """
+    Return a list of booleans of whether each value is greater than or equal to low and less than or equal to high.
+    If low or high is None then that end is not checked.
+
+    :param values: sequence
+    :param low: lowest value, inclusive
+    :param high: highest value, inclusive
+    :return: list of booleans
+    """
+    if low is None and high is None:
+        return [True] * len(values)
+    if low is None:
+        return scalar_op(operator.le, values, high)
+    if high is None:
+        return scalar_op(operator.ge, values, low)
+    if np is not None:
+        data = _to_numpy(values)
+        if data is not None and all(type(x) in (int, float) and _is_exact(operator.ge, data, x) for x in (low, high)):
+            return ((data >= low) & (data <= high)).tolist()
+    return [low <= x <= high for x in values]
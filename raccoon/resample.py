@@ -0,0 +1,182 @@
+"""
+Resampler class, the aggregation of the rows of a sorted DataFrame or Series into buckets of equal width of the index,
+such as one minute bars of ticks, used by DataFrame.resample() and Series.resample()
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, Sequence
+
+from raccoon.groupby import parse_aggregations
+
+# units of a frequency string
+UNITS = {
+    "ms": timedelta(milliseconds=1),
+    "s": timedelta(seconds=1),
+    "m": timedelta(minutes=1),
+    "min": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+}
+
+
+def to_freq(freq: Any) -> Any:
+    """
+    Return the width of a bucket. A string of a number and a unit of ms, s, m or min, h or d is a timedelta, for
+    example "5min". Any other value, such as a timedelta or an int, is returned as is.
+
+    :param freq: frequency string, timedelta or number
+    :return: bucket width
+    """
+    if isinstance(freq, str):
+        match = re.fullmatch(r"(\d*)\s*([a-z]+)", freq.strip())
+        if match is None or match.group(2) not in UNITS:
+            raise ValueError("freq string must be a number and one of the units %s" % list(UNITS))
+        freq = int(match.group(1) or 1) * UNITS[match.group(2)]
+    if not freq > freq - freq:
+        raise ValueError("freq must be greater than zero")
+    return freq
+
+
+def bucket_start(value: Any, freq: Any) -> Any:
+    """
+    Return the start of the bucket of the value. Buckets are aligned to zero for numbers and to midnight of
+    1 January 1970, in the same time zone, for datetimes.
+
+    :param value: index value
+    :param freq: bucket width
+    :return: bucket start
+    """
+    origin = datetime(1970, 1, 1, tzinfo=value.tzinfo) if isinstance(value, datetime) else 0
+    return value - (value - origin) % freq
+
+
+class Resampler:
+    """
+    Buckets of equal width of the sorted index of a DataFrame or Series, with the aggregations of the rows of each
+    bucket as a DataFrame with a row for each bucket that has rows, indexed by the start of the bucket. Each bucket is
+    found with one bisection of the index for the end of the bucket, so there is no work for each row outside of the
+    reducers, and each reducer is called once per bucket on a slice of the column.
+
+    The result is kept and calling update() takes in the rows appended since the last update. Only the last bucket,
+    which the new rows can add to, is computed again and the new buckets after it are appended to the result. The index
+    and columns are looked up through the DataFrame or Series on every update, so a column replaced with set_column()
+    is followed. The data is assumed to only change by appending rows in index order. If the data is shorter than at
+    the last update, for example after delete_all_rows(), then the result is computed again from the start.
+    """
+
+    __slots__ = ["_source", "_name", "_freq", "_outputs", "_result", "_start", "_position"]
+
+    def __init__(
+        self,
+        source: Any,
+        freq: Any,
+        aggregations: dict[Any, Any],
+        frame_class: type,
+        index_name: Any = "index",
+        name: Any = None,
+    ):
+        """
+        :param source: sort=True DataFrame or Series of the rows, this is not copied
+        :param freq: bucket width, see to_freq()
+        :param aggregations: dict of column name to reducer or list of reducers, see GroupBy.agg()
+        :param frame_class: DataFrame class of the result
+        :param index_name: index name of the result
+        :param name: for a Series source the column name of its values, None for a DataFrame source
+        """
+        self._source = source
+        self._name = name
+        self._freq = to_freq(freq)
+        self._outputs = parse_aggregations(aggregations)
+        for _, column, _ in self._outputs:
+            if column is not None:
+                self._column(column)
+        self._result = frame_class(columns=self.columns, index_name=index_name, sort=True)
+        self._start = 0  # location of the first row of the last bucket
+        self._position = 0  # number of rows taken in
+
+    def __repr__(self) -> str:
+        return "Resampler(freq=%s, buckets=%s)" % (self._freq, len(self._result))
+
+    @property
+    def freq(self) -> Any:
+        return self._freq
+
+    @property
+    def columns(self) -> list[Any]:
+        return [name for name, _, _ in self._outputs]
+
+    @property
+    def result(self) -> Any:
+        """
+        DataFrame of the aggregations as of the last update
+        """
+        return self._result
+
+    def _column(self, column: Any) -> Sequence[Any]:
+        """
+        Return the current data of a column of the source.
+
+        :param column: column name
+        :return: column data
+        """
+        if self._name is None:
+            return self._source._data[self._source._column_location(column)]
+        if column != self._name:
+            raise ValueError("%r is not in list" % (column,))
+        return self._source._data
+
+    def update(self) -> Any:
+        """
+        Take in the rows appended since the last update and return the result DataFrame. The same DataFrame is
+        returned by every update and changed in place.
+
+        :return: DataFrame
+        """
+        index = self._source._index
+        end = len(index)
+        if end < self._position:
+            self._result.delete_all_rows()
+            self._start = self._position = 0
+        if end == self._position:
+            return self._result
+
+        data = {column: self._column(column) for _, column, _ in self._outputs if column is not None}
+        starts = []
+        rows = []
+        lo = self._start
+        while lo < end:
+            start = bucket_start(index[lo], self._freq)
+            hi = bisect_left(index, start + self._freq, lo, end)
+            starts.append(start)
+            rows.append(self._reduce(data, lo, hi))
+            self._start = lo
+            lo = hi
+        self._position = end
+
+        result = self._result
+        if len(result) and result._index[-1] == starts[0]:  # the last bucket has new rows
+            result.set_location(-1, dict(zip(self.columns, rows[0])))
+            del starts[0], rows[0]
+        if starts:
+            result.append_rows(starts, {name: list(x) for name, x in zip(self.columns, zip(*rows))})
+        return result
+
+    def _reduce(self, data: dict[Any, Sequence[Any]], lo: int, hi: int) -> list[Any]:
+        """
+        Return the aggregations of the rows from location lo to hi.
+        """
+        parts: dict[Any, Sequence[Any]] = {}
+        values = []
+        for _, column, function in self._outputs:
+            if column is None:
+                values.append(hi - lo)
+                continue
+            part = parts.get(column)
+            if part is None:
+                part = parts[column] = data[column][lo:hi]
+            values.append(function(part))
+        return values
@@ -0,0 +1,187 @@
+"""
+Rolling class, the rolling window statistics over the last values of a growing ViewSeries
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from math import fsum, sqrt
+from typing import Any, Sequence
+
+
+class Rolling:
+    """
+    Rolling window sum, mean, standard deviation, min and max over the last N values of a sequence that grows by
+    appending, such as the data of a ViewSeries on a DataFrame column that rows are appended to. Reading any of the
+    statistics first takes in the values appended since the last read, so the object can be polled on every tick and
+    the cost of each new value is constant: the sums are updated for the value entering and the value leaving the
+    window, and the min and max are kept in monotonic deques of locations. To keep floating point error from building
+    up the sums are recomputed from the window each time the window has fully turned over.
+
+    The values must be numbers and the data is assumed to only change by appending. None and NaN values are missing:
+    they take up a place in the window but are not in the statistics. A value that is not a number raises an error on
+    every read until the data is changed, and the statistics stay those of the values before it. If the data is
+    shorter than at the last update, for example after delete_all_rows(), then the statistics are restarted from the
+    last N values.
+    """
+
+    __slots__ = [
+        "_data",
+        "_window",
+        "_position",
+        "_length",
+        "_count",
+        "_sum",
+        "_sumsq",
+        "_min_deque",
+        "_max_deque",
+        "_steps",
+    ]
+
+    def __init__(self, data: Sequence[Any], window: int):
+        """
+        :param data: sequence of values, this is a view and not copied
+        :param window: number of values in the window
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self._data = data
+        self._window = window
+        self._reset(max(len(data) - window, 0))
+        self.update()
+
+    def __repr__(self) -> str:
+        return "Rolling(window=%s, count=%s, sum=%s)" % (self._window, self.count, self._sum)
+
+    def _reset(self, position: int) -> None:
+        """
+        Clear the window so the next update starts at the position.
+
+        :param position: location in the data of the first value to take in
+        :return: nothing
+        """
+        self._position = position
+        self._length = 0
+        self._count = 0
+        self._sum: Any = 0
+        self._sumsq: Any = 0
+        self._min_deque: deque[int] = deque()
+        self._max_deque: deque[int] = deque()
+        self._steps = 0
+
+    def update(self) -> None:
+        """
+        Take in the values appended to the data since the last update. This is called by every statistic so it does
+        not need to be called directly.
+
+        :return: nothing
+        """
+        data = self._data
+        end = len(data)
+        if end < self._position or end - self._position > self._window:
+            # the data got shorter, or more than a whole window is new, so only the last window is needed
+            self._reset(max(end - self._window, 0))
+        window = self._window
+        min_deque, max_deque = self._min_deque, self._max_deque
+        total, sumsq, count, length = self._sum, self._sumsq, self._count, self._length
+        position = self._position
+        try:
+            for i in range(position, end):
+                value = data[i]
+                if value is not None and value == value:  # None and NaN are missing, NaN is not equal to itself
+                    try:
+                        total, sumsq = total + value, sumsq + value * value
+                    except TypeError:
+                        raise TypeError(
+                            "value %r at location %s of the rolling data is not a number" % (value, i)
+                        ) from None
+                    count += 1
+                    while min_deque and data[min_deque[-1]] >= value:
+                        min_deque.pop()
+                    min_deque.append(i)
+                    while max_deque and data[max_deque[-1]] <= value:
+                        max_deque.pop()
+                    max_deque.append(i)
+                if length == window:  # the oldest value leaves the window
+                    old = data[i - window]
+                    if old is not None and old == old:
+                        total, sumsq = total - old, sumsq - old * old
+                        count -= 1
+                    if min_deque and min_deque[0] == i - window:
+                        min_deque.popleft()
+                    if max_deque and max_deque[0] == i - window:
+                        max_deque.popleft()
+                else:
+                    length += 1
+                position = i + 1
+        finally:
+            # keep the values taken in before a value that is not a number, so they are not taken in again
+            self._steps += position - self._position
+            self._sum, self._sumsq, self._count, self._length = total, sumsq, count, length
+            self._position = position
+        if self._steps >= window:
+            self._steps = 0
+            values = self._window_values()
+            self._sum = fsum(values) if isinstance(self._sum, float) else sum(values)
+            self._sumsq = fsum(x * x for x in values) if isinstance(self._sumsq, float) else sum(x * x for x in values)
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def count(self) -> int:
+        """
+        Number of values in the window that are not missing, which is less than the window size until that many values
+        have been seen
+        """
+        self.update()
+        return self._count
+
+    @property
+    def is_full(self) -> bool:
+        self.update()
+        return self._length == self._window
+
+    @property
+    def values(self) -> list[Any]:
+        """
+        List of the values in the window that are not missing, oldest first
+        """
+        self.update()
+        return self._window_values()
+
+    def _window_values(self) -> list[Any]:
+        values = self._data[self._position - self._length : self._position]
+        return [x for x in values if x is not None and x == x]
+
+    @property
+    def sum(self) -> Any:
+        self.update()
+        return self._sum
+
+    @property
+    def mean(self) -> float | None:
+        self.update()
+        return self._sum / self._count if self._count else None
+
+    @property
+    def std(self) -> float | None:
+        """
+        Sample standard deviation, or None if there are fewer than two values in the window
+        """
+        self.update()
+        if self._count < 2:
+            return None
+        variance = (self._sumsq - self._sum * self._sum / self._count) / (self._count - 1)
+        return sqrt(max(variance, 0.0))
+
+    @property
+    def min(self) -> Any:
+        self.update()
+        return self._data[self._min_deque[0]] if self._min_deque else None
+
+    @property
+    def max(self) -> Any:
+        self.update()
+        return self._data[self._max_deque[0]] if self._max_deque else None
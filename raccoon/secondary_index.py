@@ -0,0 +1,304 @@
+"""
+Secondary indexes on the columns of a DataFrame, created with DataFrame.create_index(). A secondary index finds the
+rows of a column with a value without a scan of the column. The HashIndex is a dict of each value to its row locations
+for equality and membership lookups. The SortedIndex keeps the values in sorted order so it also answers range lookups.
+
+An index is built from the column on the first lookup and then kept in sync as cells are set and rows are appended,
+inserted or deleted. Rows inserted in the middle of a sorted DataFrame or deleted shift the locations of the rows after
+them, the HashIndex only updates those locations while the SortedIndex updates every location. Changes that reorder
+the rows, such as sorting, clear the index and it is built again on the next lookup.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+from itertools import islice
+from typing import Any, Iterable, Sequence
+
+
+class SecondaryIndex(ABC):
+    """
+    Base class of the secondary indexes. The locations returned by the lookups are in ascending order.
+    """
+
+    __slots__ = ["_built"]
+
+    kind = ""
+
+    def __init__(self) -> None:
+        self._built = False
+
+    def __repr__(self) -> str:
+        return "%s(built=%s)" % (type(self).__name__, self._built)
+
+    @property
+    def built(self) -> bool:
+        return self._built
+
+    @abstractmethod
+    def build(self, values: Sequence[Any]) -> None:
+        """
+        Build the index from all the values of the column.
+
+        :param values: column data
+        :return: nothing
+        """
+
+    def clear(self) -> None:
+        """
+        Clear the index so it is built again on the next lookup.
+
+        :return: nothing
+        """
+        self._built = False
+
+    @abstractmethod
+    def add(self, location: int, value: Any) -> None:
+        """
+        Add a value at a new row location after all the current rows. Does nothing if the index is not built.
+
+        :param location: row location
+        :param value: value
+        :return: nothing
+        """
+
+    @abstractmethod
+    def insert(self, locations: list[int], values: list[Any]) -> None:
+        """
+        Insert new rows before the rows at the locations, which shifts the locations of the rows after them. Does
+        nothing if the index is not built.
+
+        :param locations: ascending list of the locations before the insert where each new row goes, as returned by
+            sorted_insert_locations()
+        :param values: list of the value of each new row
+        :return: nothing
+        """
+
+    @abstractmethod
+    def delete(self, locations: list[int]) -> None:
+        """
+        Delete the rows at the locations, which shifts the locations of the rows after them. Does nothing if the index
+        is not built.
+
+        :param locations: ascending list of unique row locations
+        :return: nothing
+        """
+
+    @abstractmethod
+    def replace(self, location: int, old: Any, new: Any) -> None:
+        """
+        Replace the value at a row location. Does nothing if the index is not built.
+
+        :param location: row location
+        :param old: current value
+        :param new: new value
+        :return: nothing
+        """
+
+    @abstractmethod
+    def locations(self, value: Any) -> list[int]:
+        """
+        Return the locations of the rows equal to the value.
+
+        :param value: value
+        :return: list of locations
+        """
+
+    def locations_in(self, values: Iterable[Any]) -> list[int]:
+        """
+        Return the locations of the rows equal to any of the values.
+
+        :param values: iterable of values
+        :return: list of locations
+        """
+        return list(merge(*(self.locations(x) for x in set(values))))
+
+
+class HashIndex(SecondaryIndex):
+    """
+    Secondary index of a dict of each value to the list of its row locations. The values must be hashable. Inserting
+    or deleting rows updates only the locations after the first of those rows, plus a binary search in the list of
+    each value.
+    """
+
+    __slots__ = ["_map"]
+
+    kind = "hash"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._map: dict[Any, list[int]] = {}
+
+    def build(self, values: Sequence[Any]) -> None:
+        index_map: dict[Any, list[int]] = {}
+        for i, x in enumerate(values):
+            locations = index_map.get(x)
+            if locations is None:
+                index_map[x] = [i]
+            else:
+                locations.append(i)
+        self._map = index_map
+        self._built = True
+
+    def clear(self) -> None:
+        super().clear()
+        self._map = {}
+
+    def add(self, location: int, value: Any) -> None:
+        if self._built:
+            self._map.setdefault(value, []).append(location)
+
+    def insert(self, locations: list[int], values: list[Any]) -> None:
+        if not self._built or not locations:
+            return
+        first = locations[0]
+        for rows in self._map.values():  # only the locations at or after the first insert move
+            start = bisect_left(rows, first)
+            if start < len(rows):
+                rows[start:] = [x + bisect_right(locations, x) for x in islice(rows, start, None)]
+        for k, (location, value) in enumerate(zip(locations, values)):
+            insort(self._map.setdefault(value, []), location + k)
+
+    def delete(self, locations: list[int]) -> None:
+        if not self._built or not locations:
+            return
+        first = locations[0]
+        deleted = set(locations)
+        for value, rows in list(self._map.items()):  # only the locations at or after the first delete move
+            start = bisect_left(rows, first)
+            if start == len(rows):
+                continue
+            rows[start:] = [x - bisect_left(locations, x) for x in islice(rows, start, None) if x not in deleted]
+            if not rows:
+                del self._map[value]
+
+    def replace(self, location: int, old: Any, new: Any) -> None:
+        if not self._built or old is new:
+            return
+        locations = self._map.get(old, [])
+        i = bisect_left(locations, location)
+        if i == len(locations) or locations[i] != location:  # a value not equal to itself, such as NaN
+            self.clear()
+            return
+        del locations[i]
+        if not locations:
+            del self._map[old]
+        insort(self._map.setdefault(new, []), location)
+
+    def locations(self, value: Any) -> list[int]:
+        return list(self._map.get(value, ()))
+
+
+class SortedIndex(SecondaryIndex):
+    """
+    Secondary index of the values in sorted order with the row location of each value. Equal values are in order of
+    their location. The values must all be comparable with each other, except for None, the missing value of list
+    columns, which is kept apart from the sorted values. The locations are in the order of the values, so inserting or
+    deleting rows updates every location.
+    """
+
+    __slots__ = ["_keys", "_locations", "_none"]
+
+    kind = "sorted"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._keys: list[Any] = []
+        self._locations: list[int] = []
+        self._none: list[int] = []
+
+    def build(self, values: Sequence[Any]) -> None:
+        if not isinstance(values, list):
+            values = list(values)
+        self._none = [i for i, x in enumerate(values) if x is None]
+        locations = range(len(values)) if not self._none else [i for i, x in enumerate(values) if x is not None]
+        self._locations = sorted(locations, key=values.__getitem__)
+        self._keys = [values[i] for i in self._locations]
+        self._built = True
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys = []
+        self._locations = []
+        self._none = []
+
+    def _insert(self, location: int, value: Any) -> None:
+        if value is None:
+            insort(self._none, location)
+            return
+        lo = bisect_left(self._keys, value)
+        hi = bisect_right(self._keys, value, lo)
+        i = bisect_left(self._locations, location, lo, hi)
+        self._keys.insert(i, value)
+        self._locations.insert(i, location)
+
+    def add(self, location: int, value: Any) -> None:
+        if not self._built:
+            return
+        if value is None:
+            self._none.append(location)
+            return
+        i = bisect_right(self._keys, value)
+        self._keys.insert(i, value)
+        self._locations.insert(i, location)
+
+    def insert(self, locations: list[int], values: list[Any]) -> None:
+        if not self._built:
+            return
+        self._locations = [x + bisect_right(locations, x) for x in self._locations]
+        self._none = [x + bisect_right(locations, x) for x in self._none]
+        for k, (location, value) in enumerate(zip(locations, values)):
+            self._insert(location + k, value)
+
+    def delete(self, locations: list[int]) -> None:
+        if not self._built:
+            return
+        deleted = set(locations)
+        kept = [i for i, x in enumerate(self._locations) if x not in deleted]
+        self._keys = [self._keys[i] for i in kept]
+        self._locations = [self._locations[i] - bisect_left(locations, self._locations[i]) for i in kept]
+        self._none = [x - bisect_left(locations, x) for x in self._none if x not in deleted]
+
+    def replace(self, location: int, old: Any, new: Any) -> None:
+        if not self._built or old is new:
+            return
+        if old is None:
+            del self._none[bisect_left(self._none, location)]
+        else:
+            lo = bisect_left(self._keys, old)
+            hi = bisect_right(self._keys, old, lo)
+            i = bisect_left(self._locations, location, lo, hi)
+            if i == hi or self._locations[i] != location:  # a value not equal to itself, such as NaN
+                self.clear()
+                return
+            del self._keys[i]
+            del self._locations[i]
+        self._insert(location, new)
+
+    def locations(self, value: Any) -> list[int]:
+        if value is None:
+            return list(self._none)
+        try:
+            lo = bisect_left(self._keys, value)
+        except TypeError:  # a value that cannot be compared with the column values is not in the column
+            return []
+        return self._locations[lo : bisect_right(self._keys, value, lo)]
+
+    def locations_between(self, low: Any = None, high: Any = None) -> list[int]:
+        """
+        Return the locations of the rows greater than or equal to low and less than or equal to high. If low or high is
+        None then that end is open. Rows with None values are never included.
+
+        :param low: lowest value, inclusive
+        :param high: highest value, inclusive
+        :return: list of locations
+        """
+        lo = bisect_left(self._keys, low) if low is not None else 0
+        hi = bisect_right(self._keys, high) if high is not None else len(self._keys)
+        return sorted(self._locations[lo:hi])
+
+
+# secondary index classes by kind
+KINDS: dict[str, type[SecondaryIndex]] = {"hash": HashIndex, "sorted": SortedIndex}
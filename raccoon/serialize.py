@@ -0,0 +1,448 @@
+"""
+Binary columnar format used by DataFrame.to_bytes(), from_bytes(), save(), load() and open_mmap(). The file is a
+magic number, the length of the header, the pickled header and then one section for each buffer, every buffer
+starting on an 8 byte boundary so fixed width values can be read in place. The header holds the DataFrame meta data
+and a descriptor for the index and each column that gives its encoding and the offset and size of its buffers,
+relative to the end of the header.
+
+The encodings are chosen from the types of the values:
+
+- int64 for ints, float64 for floats and one byte per value for bools
+- strings as the UTF-8 of the values joined by a NUL byte, plus an int64 array of the start of each value
+- naive datetimes as int64 microseconds since 1970-01-01, timezone aware datetimes that all have the same tzinfo as
+  int64 microseconds since 1970-01-01 UTC, and dates as int64 ordinals
+- tuples that are all the same length, such as a multi-index, as one encoded vector for each position
+- typed array columns as the raw bytes of the array, loaded back as an array of the same typecode
+
+Any of the above can have None values, in which case a null buffer of one byte per value is added. Anything else is
+pickled, so like pickle the format should only be loaded from trusted sources.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from typing import IO, Any, Callable, Iterator, Never, Sequence, overload
+
+MAGIC = b"RACCOON\x01"
+ALIGNMENT = 8
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+SEPARATOR = "\x00"
+# number of values decoded at a time when iterating over a MappedColumn
+ITERATION_CHUNK = 4096
+
+# the value stored in place of None for each nullable encoding
+_FILL = {"int": 0, "float": 0.0, "bool": False, "str": ""}
+
+
+class _Buffers:
+    """
+    Collects the buffers of the encoded vectors and the offset of each one relative to the start of the data section.
+    """
+
+    __slots__ = ["buffers", "size"]
+
+    def __init__(self) -> None:
+        self.buffers: list[Any] = []
+        self.size = 0
+
+    def add(self, buffer: Any) -> tuple[int, int]:
+        """
+        Add a bytes-like object.
+
+        :param buffer: bytes, bytearray or array
+        :return: tuple of (offset, number of bytes)
+        """
+        nbytes = memoryview(buffer).nbytes
+        offset = self.size
+        self.buffers.append(buffer)
+        self.size += nbytes
+        padding = -self.size % ALIGNMENT
+        if padding:
+            self.buffers.append(bytes(padding))
+            self.size += padding
+        return offset, nbytes
+
+
+def _little_endian(values: array) -> array:
+    """
+    Return the array with the bytes in little endian order, which is the order used for all numbers in the format.
+    """
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def _value_kind(kinds: set[type]) -> str:
+    """
+    Return the encoding for a set of value types, not including NoneType.
+    """
+    if len(kinds) != 1:
+        return "pickle"
+    return {
+        int: "int",
+        float: "float",
+        bool: "bool",
+        str: "str",
+        datetime: "datetime",
+        date: "date",
+        tuple: "tuple",
+    }.get(kinds.pop(), "pickle")
+
+
+def _encode_pickle(values: Sequence[Any], buffers: _Buffers) -> dict[str, Any]:
+    return {
+        "kind": "pickle",
+        "count": len(values),
+        "values": buffers.add(pickle.dumps(list(values), protocol=pickle.HIGHEST_PROTOCOL)),
+    }
+
+
+def encode(values: Sequence[Any], buffers: _Buffers) -> dict[str, Any]:
+    """
+    Encode a sequence of values into the buffers.
+
+    :param values: list, BlockedList or array
+    :param buffers: _Buffers to add to
+    :return: descriptor dict of the encoding
+    """
+    count = len(values)
+    if isinstance(values, array):
+        return {"kind": "array", "typecode": values.typecode, "values": buffers.add(_little_endian(values))}
+
+    kinds = set(map(type, values))
+    nulls = type(None) in kinds
+    kinds.discard(type(None))
+    if not kinds:
+        return {"kind": "none", "count": count}
+    kind = _value_kind(kinds)
+    descriptor: dict[str, Any] = {"kind": kind, "count": count}
+    if kind == "pickle":
+        return _encode_pickle(values, buffers)
+
+    if kind == "tuple":
+        lengths = {len(x) for x in values if x is not None}
+        if len(lengths) != 1:
+            return _encode_pickle(values, buffers)
+        width = lengths.pop()
+        filled = [(None,) * width if x is None else x for x in values] if nulls else values
+        descriptor["items"] = [encode([x[i] for x in filled], buffers) for i in range(width)]
+    elif kind == "datetime":
+        tzinfos = {x.tzinfo for x in values if x is not None}
+        if len(tzinfos) != 1:
+            return _encode_pickle(values, buffers)
+        tzinfo = tzinfos.pop()
+        epoch = EPOCH if tzinfo is None else EPOCH_UTC
+        descriptor["tzinfo"] = tzinfo
+        ints = [0 if x is None else (x - epoch) // MICROSECOND for x in values]
+        descriptor["values"] = buffers.add(_little_endian(array("q", ints)))
+    elif kind == "date":
+        ints = [1 if x is None else x.toordinal() for x in values]
+        descriptor["values"] = buffers.add(_little_endian(array("q", ints)))
+    else:
+        filled = [_FILL[kind] if x is None else x for x in values] if nulls else values
+        if kind == "int":
+            if filled and (min(filled) < INT64_MIN or max(filled) > INT64_MAX):
+                return _encode_pickle(values, buffers)
+            descriptor["values"] = buffers.add(_little_endian(array("q", filled)))
+        elif kind == "float":
+            descriptor["values"] = buffers.add(_little_endian(array("d", filled)))
+        elif kind == "bool":
+            descriptor["values"] = buffers.add(bytes(filled))
+        else:  # str
+            joined = SEPARATOR.join(filled)
+            blob = joined.encode()
+            starts, position = array("q"), 0
+            for x in filled:
+                starts.append(position)
+                position += (len(x) if x.isascii() else len(x.encode())) + 1
+            starts.append(position)
+            descriptor["splittable"] = joined.count(SEPARATOR) == max(count - 1, 0)
+            descriptor["values"] = buffers.add(blob)
+            descriptor["starts"] = buffers.add(_little_endian(starts))
+
+    if nulls:
+        descriptor["nulls"] = buffers.add(bytes(x is None for x in values))
+    return descriptor
+
+
+def _read_array(typecode: str, data: memoryview, location: tuple[int, int]) -> array:
+    offset, nbytes = location
+    values = array(typecode)
+    values.frombytes(data[offset : offset + nbytes])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _null_locations(data: memoryview, location: tuple[int, int]) -> list[int]:
+    """
+    Return the locations of the None values from a null buffer. The buffer is searched with bytes.find so the time is
+    proportional to the number of None values and not the length.
+    """
+    offset, nbytes = location
+    nulls = bytes(data[offset : offset + nbytes])
+    locations = []
+    i = nulls.find(1)
+    while i != -1:
+        locations.append(i)
+        i = nulls.find(1, i + 1)
+    return locations
+
+
+def decode(descriptor: dict[str, Any], data: memoryview) -> list[Any] | array:
+    """
+    Decode a vector from the data section.
+
+    :param descriptor: descriptor dict from encode()
+    :param data: memoryview of the data section
+    :return: list, or array for the array encoding
+    """
+    kind = descriptor["kind"]
+    if kind == "array":
+        return _read_array(descriptor["typecode"], data, descriptor["values"])
+    if kind == "none":
+        return [None] * descriptor["count"]
+    if kind == "pickle":
+        offset, nbytes = descriptor["values"]
+        return pickle.loads(data[offset : offset + nbytes])
+
+    values: list[Any]
+    if kind == "int":
+        values = _read_array("q", data, descriptor["values"]).tolist()
+    elif kind == "float":
+        values = _read_array("d", data, descriptor["values"]).tolist()
+    elif kind == "bool":
+        offset, nbytes = descriptor["values"]
+        values = list(map(bool, data[offset : offset + nbytes]))
+    elif kind == "str":
+        offset, nbytes = descriptor["values"]
+        blob = bytes(data[offset : offset + nbytes])
+        if not descriptor["count"]:
+            values = []
+        elif descriptor["splittable"]:
+            values = blob.decode().split(SEPARATOR)
+        else:
+            starts = _read_array("q", data, descriptor["starts"])
+            values = [blob[starts[i] : starts[i + 1] - 1].decode() for i in range(descriptor["count"])]
+    elif kind == "datetime":
+        tzinfo = descriptor["tzinfo"]
+        ints = _read_array("q", data, descriptor["values"])
+        if tzinfo is None:
+            values = [EPOCH + timedelta(microseconds=x) for x in ints]
+        elif tzinfo is timezone.utc:
+            values = [EPOCH_UTC + timedelta(microseconds=x) for x in ints]
+        else:
+            values = [(EPOCH_UTC + timedelta(microseconds=x)).astimezone(tzinfo) for x in ints]
+    elif kind == "date":
+        values = list(map(date.fromordinal, _read_array("q", data, descriptor["values"])))
+    elif kind == "tuple":
+        values = list(zip(*[decode(x, data) for x in descriptor["items"]])) or [()] * descriptor["count"]
+    else:
+        raise ValueError("unknown encoding: %s" % kind)
+
+    if "nulls" in descriptor:
+        for i in _null_locations(data, descriptor["nulls"]):
+            values[i] = None
+    return values
+
+
+class MappedColumn(Sequence[Any]):
+    """
+    Read only sequence of the values of an encoded vector that decodes each value from the data section only when it
+    is read, used for the columns and index of a memory mapped DataFrame. Fixed width values are read in place through
+    a memoryview so no copy of the data is made, and when the data section is a memory mapped file the pages are shared
+    by every process that maps the same file.
+    """
+
+    __slots__ = ["_count", "_item", "_items"]
+
+    def __init__(self, count: int, item: Callable[[int], Any], items: Callable[[int, int, int], list[Any]]):
+        """
+        :param count: number of values
+        :param item: function that returns the value at a non-negative location
+        :param items: function of (start, stop, step) that returns a list of the values in that range
+        """
+        self._count = count
+        self._item = item
+        self._items = items
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, i: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[Any]: ...
+
+    def __getitem__(self, i: int | slice) -> Any:
+        if isinstance(i, slice):
+            return self._items(*i.indices(self._count))
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("index out of range")
+        return self._item(i)
+
+    def __iter__(self) -> Iterator[Any]:
+        for start in range(0, self._count, ITERATION_CHUNK):
+            yield from self._items(start, min(start + ITERATION_CHUNK, self._count), 1)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MappedColumn, list, tuple, array)):
+            return self._count == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "MappedColumn(count=%s)" % self._count
+
+    def _read_only(self, *args: Any) -> Never:
+        raise TypeError("memory mapped DataFrame is read only")
+
+    __setitem__ = __delitem__ = append = extend = insert = _read_only
+
+
+def _cast(data: memoryview, location: tuple[int, int], typecode: str) -> memoryview:
+    offset, nbytes = location
+    return data[offset : offset + nbytes].cast(typecode)
+
+
+def _convert(values: memoryview, function: Callable[[Any], Any]) -> tuple[Callable, Callable]:
+    """
+    Return the item and items functions for a MappedColumn that applies the function to each fixed width value.
+    """
+    return (lambda i: function(values[i])), (lambda start, stop, step: list(map(function, values[start:stop:step])))
+
+
+def mapped(descriptor: dict[str, Any], data: memoryview) -> MappedColumn:
+    """
+    Return a MappedColumn of the vector in the data section. Vectors encoded with pickle, and all vectors on big endian
+    machines, are decoded in full when called and the MappedColumn reads from that list.
+
+    :param descriptor: descriptor dict from encode()
+    :param data: memoryview of the data section
+    :return: MappedColumn
+    """
+    kind = descriptor["kind"]
+    item: Callable[[int], Any]
+    items: Callable[[int, int, int], list[Any]]
+    if kind in ("pickle", "none") or sys.byteorder == "big":
+        values = decode(descriptor, data)
+        return MappedColumn(len(values), values.__getitem__, lambda start, stop, step: list(values[start:stop:step]))
+
+    if kind in ("array", "int", "float", "bool"):
+        typecode = {"array": descriptor.get("typecode"), "int": "q", "float": "d", "bool": "?"}[kind]
+        view = _cast(data, descriptor["values"], typecode)
+        count = len(view)
+        item, items = view.__getitem__, (lambda start, stop, step: view[start:stop:step].tolist())
+    elif kind == "str":
+        offset, nbytes = descriptor["values"]
+        blob = data[offset : offset + nbytes]
+        starts = _cast(data, descriptor["starts"], "q")
+        count = descriptor["count"]
+
+        def item(i: int) -> str:
+            return str(blob[starts[i] : starts[i + 1] - 1], "utf-8")
+
+        def items(start: int, stop: int, step: int) -> list[str]:
+            if step != 1 or not descriptor["splittable"] or start >= stop:
+                return [item(i) for i in range(start, stop, step)]
+            return str(blob[starts[start] : starts[stop] - 1], "utf-8").split(SEPARATOR)
+
+    elif kind == "datetime":
+        tzinfo = descriptor["tzinfo"]
+        count = descriptor["count"]
+        if tzinfo is None:
+            item, items = _convert(_cast(data, descriptor["values"], "q"), lambda x: EPOCH + timedelta(microseconds=x))
+        else:
+            item, items = _convert(
+                _cast(data, descriptor["values"], "q"),
+                lambda x: (EPOCH_UTC + timedelta(microseconds=x)).astimezone(tzinfo),
+            )
+    elif kind == "date":
+        count = descriptor["count"]
+        item, items = _convert(_cast(data, descriptor["values"], "q"), date.fromordinal)
+    elif kind == "tuple":
+        count = descriptor["count"]
+        columns = [mapped(x, data) for x in descriptor["items"]]
+
+        def item(i: int) -> tuple:
+            return tuple(x[i] for x in columns)
+
+        def items(start: int, stop: int, step: int) -> list[tuple]:
+            return list(zip(*[x[start:stop:step] for x in columns])) or [()] * len(range(start, stop, step))
+
+    else:
+        raise ValueError("unknown encoding: %s" % kind)
+
+    if "nulls" in descriptor:
+        nulls = _cast(data, descriptor["nulls"], "?")
+        value_item, value_items = item, items
+
+        def item(i: int) -> Any:
+            return None if nulls[i] else value_item(i)
+
+        def items(start: int, stop: int, step: int) -> list[Any]:
+            values = value_items(start, stop, step)
+            return [None if null else x for x, null in zip(values, nulls[start:stop:step])]
+
+    return MappedColumn(count, item, items)
+
+
+def write(file: IO[bytes], meta_data: dict[str, Any], index: Sequence[Any], data: list[Sequence[Any]]) -> None:
+    """
+    Write a DataFrame to a binary file object.
+
+    :param file: file object opened for binary writing
+    :param meta_data: dict of the DataFrame meta data
+    :param index: index values
+    :param data: list of the column values
+    :return: nothing
+    """
+    buffers = _Buffers()
+    header = {
+        "meta_data": meta_data,
+        "index": encode(index, buffers),
+        "data": [encode(x, buffers) for x in data],
+    }
+    header_bytes = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+    header_bytes += bytes(-len(header_bytes) % ALIGNMENT)
+    file.write(MAGIC)
+    file.write(len(header_bytes).to_bytes(8, "little"))
+    file.write(header_bytes)
+    for buffer in buffers.buffers:
+        file.write(buffer)
+
+
+def read_header(buffer: Any) -> tuple[dict[str, Any], memoryview]:
+    """
+    Read the header from the bytes of a file written by write().
+
+    :param buffer: bytes-like object such as bytes or an mmap
+    :return: tuple of (header dict, memoryview of the data section)
+    """
+    view = memoryview(buffer)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        raise ValueError("not a raccoon binary file")
+    start = len(MAGIC) + 8
+    length = int.from_bytes(view[len(MAGIC) : start], "little")
+    header = pickle.loads(view[start : start + length])
+    return header, view[start + length :]
+
+
+def read(buffer: Any) -> tuple[dict[str, Any], list[Any] | array, list[list[Any] | array]]:
+    """
+    Read a DataFrame from the bytes of a file written by write().
+
+    :param buffer: bytes-like object
+    :return: tuple of (meta data dict, index, list of column values)
+    """
+    header, data = read_header(buffer)
+    return header["meta_data"], decode(header["index"], data), [decode(x, data) for x in header["data"]]
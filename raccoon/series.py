@@ -7,14 +7,28 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from bisect import bisect_left, bisect_right
 from collections import OrderedDict
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from itertools import compress
 from typing import Any, Literal, Self, cast, overload
 
 from tabulate import tabulate
 
 from raccoon import DataFrame
-from raccoon.sort_utils import sorted_exists, sorted_index, sorted_list_indexes
+from raccoon.aggregates import RunningAggregate
+from raccoon.blocked_list import BlockedList
+from raccoon.mask import Mask, is_mask
+from raccoon.resample import Resampler
+from raccoon.rolling import Rolling
+from raccoon.sort_utils import (
+    apply_permutation,
+    is_sorted,
+    merge_insert,
+    permutation_cycles,
+    sorted_exists,
+    sorted_index,
+    sorted_insert_locations,
+    sorted_list_indexes,
+)
 
 
 def _is_non_string_sequence(value: Any) -> bool:
@@ -28,7 +42,7 @@ class SeriesBase[IndexT, T](ABC):
     """
 
     # Define slots to make object faster
-    __slots__ = ["_data", "_data_name", "_index", "_index_name", "_sort"]
+    __slots__ = ["_data", "_data_name", "_index", "_index_name", "_sort", "_storage"]
 
     def __init__(self):
         """
@@ -39,6 +53,7 @@ class SeriesBase[IndexT, T](ABC):
         self._data: Any = []
         self._data_name: str | tuple | None = None
         self._sort: bool = False
+        self._storage: str = "list"
 
     def __len__(self) -> int:
         return len(self._index)
@@ -100,6 +115,10 @@ class SeriesBase[IndexT, T](ABC):
     def sort(self) -> bool:
         pass
 
+    @property
+    def storage(self) -> str:
+        return self._storage
+
     @overload
     def get(self, indexes: list[IndexT] | list[bool], as_list: Literal[True]) -> list[T]: ...
 
@@ -119,6 +138,8 @@ class SeriesBase[IndexT, T](ABC):
         :param as_list: if True then return the values as a list, if False return a Series.
         :return: either Series, list, or single value. The return is a shallow copy
         """
+        if isinstance(indexes, BlockedList):  # the index of a blocked storage Series
+            indexes = list(indexes)
         if isinstance(indexes, list):
             return self.get_rows(indexes, as_list=True) if as_list else self.get_rows(indexes)
         else:
@@ -132,7 +153,7 @@ class SeriesBase[IndexT, T](ABC):
         :param index: index value
         :return: value
         """
-        i = sorted_index(self._index, index) if self._sort else self._index.index(index)
+        i = self._index_location(index)
         return self._data[i]
 
     @overload
@@ -149,7 +170,7 @@ class SeriesBase[IndexT, T](ABC):
         :param as_list: if True return a list, if False return Series
         :return: Series if as_list if False, a list if as_list is True
         """
-        if indexes and isinstance(indexes[0], bool) and all(isinstance(i, bool) for i in indexes):  # boolean list
+        if is_mask(indexes):  # boolean list
             if len(indexes) != len(self._index):
                 raise ValueError("boolean index list must be same size of existing index")
             if all(indexes):  # the entire column
@@ -159,11 +180,7 @@ class SeriesBase[IndexT, T](ABC):
                 data = list(compress(self._data, indexes))
                 index = list(compress(self._index, indexes))
         else:  # index values list
-            locations = (
-                [sorted_index(self._index, x) for x in indexes]
-                if self._sort
-                else [self._index.index(x) for x in indexes]
-            )
+            locations = [self._index_location(x) for x in indexes]
             data = [self._data[i] for i in locations]
             index = [self._index[i] for i in locations]
         return (
@@ -175,6 +192,7 @@ class SeriesBase[IndexT, T](ABC):
                 data_name=self._data_name,
                 index_name=self._index_name,
                 sort=self._sort,
+                storage=self._storage,
             )
         )
 
@@ -262,15 +280,16 @@ class SeriesBase[IndexT, T](ABC):
                 data_name=self._data_name,
                 index_name=self._index_name,
                 sort=self._sort,
+                storage=self._storage,
             )
 
     def _slice_index(self, slicer: slice) -> list[bool]:
         try:
-            start_index = sorted_index(self._index, slicer.start) if self._sort else self._index.index(slicer.start)
+            start_index = self._index_location(slicer.start)
         except ValueError:
             raise IndexError("start of slice not in the index")
         try:
-            end_index = sorted_index(self._index, slicer.stop) if self._sort else self._index.index(slicer.stop)
+            end_index = self._index_location(slicer.stop)
         except ValueError:
             raise IndexError("end of slice not in the index")
         if end_index < start_index:
@@ -279,6 +298,15 @@ class SeriesBase[IndexT, T](ABC):
         index_len = len(self._index)
         return [False] * start_index + [True] * (end_index - start_index + 1) + [False] * (index_len - 1 - end_index)
 
+    def _index_location(self, index: IndexT) -> int:
+        """
+        Return the location of an index value, using a binary search if the Series is sorted.
+
+        :param index: index value
+        :return: location of the index value
+        """
+        return sorted_index(self._index, index) if self._sort else self._index.index(index)
+
     def _validate_index(self, indexes: list[IndexT]) -> None:
         """
         Raises an error if the indexes are not valid
@@ -286,7 +314,7 @@ class SeriesBase[IndexT, T](ABC):
         :param list indexes: list of indexes
         :return: nothing
         """
-        if not (isinstance(indexes, list) or indexes is None):
+        if not (isinstance(indexes, (list, BlockedList)) or indexes is None):
             raise TypeError("indexes must be list or None")
         if len(indexes) != len(set(indexes)):  # noqa
             raise ValueError("index contains duplicates")
@@ -343,8 +371,45 @@ class SeriesBase[IndexT, T](ABC):
         rows_bool.extend([True] * min(rows, len(self._index)))
         return self.get(indexes=rows_bool)
 
+    def resampler(self, freq: Any, agg: Any = "last") -> Resampler:
+        """
+        Return a Resampler of the values in buckets of equal width of the index, see resample(). The Resampler keeps
+        the result and each call to update() only computes again the last bucket and any new buckets from the rows
+        appended since the last call, so it can be updated on every tick.
+
+        :param freq: bucket width, a timedelta or a string such as "1s" or "5min" for a datetime index, or a number
+            for a number index
+        :param agg: reducer or list of reducers, see resample()
+        :return: Resampler
+        """
+        if not self._sort:
+            raise RuntimeError("Can only use resample on sorted Series")
+        name = self._data_name if self._data_name is not None else "value"
+        return Resampler(self, freq, {name: agg}, DataFrame, self._index_name, name)
+
+    def resample(self, freq: Any, agg: Any = "last") -> Series[IndexT, Any] | DataFrame:
+        """
+        Aggregate the values in buckets of equal width of the index, such as one second bars of a Series indexed by
+        datetime. The Series must be sort=True. The bucket boundaries are found by bisection of the index so there is
+        no work for each row outside of the reducers. Only buckets that have rows are in the result.
+
+        The agg is the name of a built-in reducer: first, last, min, max, sum, count or mean, or a function that is
+        called with the values of the bucket, or a list of them, or "ohlc" for the open, high, low and close. For a
+        single reducer the result is a Series, otherwise a DataFrame with a column named (data_name, reducer name) for
+        each reducer.
+
+        :param freq: bucket width, a timedelta or a string such as "1s" or "5min" for a datetime index, or a number
+            for a number index
+        :param agg: reducer, list of reducers or "ohlc"
+        :return: Series or DataFrame indexed by the start of each bucket
+        """
+        result = self.resampler(freq, agg).update()
+        if agg == "ohlc" or not (isinstance(agg, str) or callable(agg)):
+            return result
+        return Series(result.data[0], result.index, self._data_name, self._index_name, sort=True)
+
     @overload
-    def select_index(self, compare: Any | tuple, result: Literal["boolean"] = "boolean") -> list[bool]: ...
+    def select_index(self, compare: Any | tuple, result: Literal["boolean"] = "boolean") -> Mask: ...
 
     @overload
     def select_index(self, compare: IndexT | tuple[Any, ...], result: Literal["value"]) -> list[IndexT]: ...
@@ -363,7 +428,7 @@ class SeriesBase[IndexT, T](ABC):
         :return: list of booleans or values
         """
         if isinstance(compare, tuple):
-            booleans = []
+            booleans = Mask()
             for value in self._index:
                 if not isinstance(value, tuple):
                     booleans.append(False)
@@ -372,11 +437,8 @@ class SeriesBase[IndexT, T](ABC):
                     all(compare[i] == item if compare[i] is not None else True for i, item in enumerate(value))
                 )
         else:
-            booleans = [False] * len(self._index)
-            if self._sort:
-                booleans[sorted_index(self._index, compare)] = True
-            else:
-                booleans[self._index.index(compare)] = True
+            booleans = Mask([False] * len(self._index))
+            booleans[self._index_location(compare)] = True
         if result == "boolean":
             return booleans
         elif result == "value":
@@ -384,17 +446,17 @@ class SeriesBase[IndexT, T](ABC):
         else:
             raise ValueError("only valid values for result parameter are: boolean or value.")
 
-    def isin(self, compare_list: list[Any]) -> list[bool]:
+    def isin(self, compare_list: list[Any]) -> Mask:
         """
         Returns a boolean list where each element is whether that element in the column is in the compare_list.
 
         :param compare_list: list of items to compare to
-        :return: list of booleans
+        :return: Mask
         """
         compare_set = set(compare_list)
-        return [x in compare_set for x in self._data]
+        return Mask([x in compare_set for x in self._data])
 
-    def equality(self, indexes: list[IndexT] | list[bool] | None = None, value: Any = None) -> list[bool]:
+    def equality(self, indexes: list[IndexT] | list[bool] | None = None, value: Any = None) -> Mask:
         """
         Math helper method. Given a column and optional indexes will return a list of booleans on the equality of the
         value for that index in the DataFrame to the value parameter.
@@ -402,11 +464,10 @@ class SeriesBase[IndexT, T](ABC):
         :param indexes: list of index values or list of booleans. If a list of booleans then the list must be the same\
         length as the DataFrame
         :param value: value to compare
-        :return: list of booleans
+        :return: Mask
         """
-        indexes = [True] * len(self._index) if indexes is None else indexes
-        compare_list = self.get_rows(indexes, as_list=True)
-        return [x == value for x in compare_list]
+        compare_list = self._data if indexes is None else self.get_rows(indexes, as_list=True)
+        return Mask([x == value for x in compare_list])
 
 
 class Series[IndexT, T](SeriesBase[IndexT, T]):
@@ -416,9 +477,12 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
     expanding frequently. This is known to be slow with Pandas due to the use of numpy as the underlying data structure.
     Raccoon uses native lists as the underlying data structure which is quick to expand and grow the size. The Series
     can be designated as sort, in which case the rows will be sort by index on construction, and then any addition of
-    a new row will insert it into the Series so that the index remains sort.
+    a new row will insert it into the Series so that the index remains sort. For large sorted Series where rows are
+    frequently inserted in the middle use storage="blocked" to store the index and data in BlockedLists.
     """
 
+    __slots__ = ["_index_map", "_aggregate", "_in_order"]
+
     def __init__(
         self,
         data: list[T] | None = None,
@@ -426,6 +490,7 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         data_name: str | tuple | None = "value",
         index_name: str | tuple | None = "index",
         sort: bool | None = None,
+        storage: Literal["list", "blocked"] = "list",
     ):
         """
         :param data: (optional) list of values.
@@ -434,9 +499,17 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param index_name: (optional) name for the index. Default is "index"
         :param sort: if True then Series will keep the index sort. If True all index values must be of same type. If
             None then will default to True if no index is provided.
+        :param storage: "list" to store the index and data in python lists, or "blocked" to store them in
+            BlockedLists for fast inserts and deletes in the middle of large Series
         """
         super().__init__()
+        self._index_map: dict[Any, int] | None = None
+        self._aggregate: RunningAggregate | None = None
+        self._in_order = True
+        self._storage = storage
 
+        if storage not in ("list", "blocked"):
+            raise ValueError("storage must be list or blocked")
         if index is not None and not _is_non_string_sequence(index):
             raise TypeError("index must be a non-string sequence")
 
@@ -448,15 +521,15 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
 
         # setup data list
         if data is None:
-            self._data = list()
+            self._data = self._new_list()
             if index:
                 # pad out to the number of rows
                 self._pad_data(len(index))
                 self.index = list(index)
             else:
                 self.index = list()
-        elif isinstance(data, list):
-            self._data = [x for x in data]
+        elif isinstance(data, (list, BlockedList)):
+            self._data = self._new_list(data)
             # setup index
             if index:
                 self.index = list(index)
@@ -474,6 +547,63 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
             else:
                 self.sort = True
 
+    def _new_list(self, values: Iterable[Any] = ()) -> list[Any]:
+        """
+        Return a new list of the values using the container for the storage type of the Series.
+
+        :param values: iterable of values
+        :return: list or BlockedList
+        """
+        return cast(list[Any], BlockedList(values)) if self._storage == "blocked" else list(values)
+
+    def _index_location(self, index: IndexT) -> int:
+        """
+        Return the location of an index value. Sorted Series use a binary search. Unsorted Series use a dictionary of
+        index value to location that is built on the first lookup and then kept in sync as rows are added and deleted,
+        so repeated lookups are constant time instead of a scan of the index.
+
+        :param index: index value
+        :return: location of the index value
+        """
+        if self._sort:
+            return sorted_index(self._index, index)
+        if self._index_map is None:
+            self._index_map = {x: i for i, x in enumerate(self._index)}
+        try:
+            return self._index_map[index]
+        except KeyError:
+            raise ValueError(f"{index!r} is not in list")
+
+    def _index_exists(self, index: IndexT) -> bool:
+        """
+        Return True if the index value is already in the Series. For a sorted Series a value greater than the last
+        index is known to be new without a search, otherwise a binary search is used. An unsorted Series, and a sorted
+        Series where append_row() or append_rows() put the index out of order, use the index value to location
+        dictionary, so the check does not grow with the size of the Series.
+
+        :param index: index value
+        :return: True if the index value exists
+        """
+        if self._sort and self._in_order:
+            if not self._index or index > self._index[-1]:
+                return False
+            return sorted_exists(self._index, index)[0]
+        if self._index_map is None:
+            self._index_map = {x: i for i, x in enumerate(self._index)}
+        return index in self._index_map
+
+    def _check_order(self, indexes: list[Any]) -> None:
+        """
+        For a sorted Series note if the index values about to be appended put the index out of order, after which
+        _index_exists() cannot use a binary search until the index is sorted again.
+
+        :param indexes: list of the index values to append
+        :return: nothing
+        """
+        if self._sort and self._in_order and indexes:
+            if (self._index and not indexes[0] > self._index[-1]) or not is_sorted(indexes):
+                self._in_order = False
+
     def _pad_data(self, index_len: int) -> None:
         """
         Pad the data in Series with [None] to ensure that data is the same length as index
@@ -494,7 +624,9 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
     @index.setter
     def index(self, index_list: list[Any]) -> None:
         self._validate_index(index_list)
-        self._index = list(index_list)
+        self._index = self._new_list(index_list)
+        self._index_map = None
+        self._in_order = not self._sort or is_sorted(self._index)
 
     @property
     def sort(self) -> bool:
@@ -506,17 +638,50 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         if self._sort:
             self.sort_index()
 
+    @property
+    def aggregate(self) -> RunningAggregate | None:
+        """
+        Return the RunningAggregate of the Series data, or None if there is none. See add_aggregate().
+
+        :return: RunningAggregate or None
+        """
+        return self._aggregate
+
+    def add_aggregate(self) -> RunningAggregate:
+        """
+        Start keeping running aggregates of count, sum, sum of squares, min and max for the data. The aggregates are
+        updated as values are set, appended and deleted, so reading them does not touch the data.
+
+        :return: RunningAggregate
+        """
+        self._aggregate = RunningAggregate(self._data)
+        return self._aggregate
+
+    def remove_aggregate(self) -> None:
+        """
+        Stop keeping the running aggregates for the data.
+
+        :return: nothing
+        """
+        self._aggregate = None
+
     def sort_index(self) -> None:
         """
-        Sort the Series by the index. The sort modifies the Series inplace
+        Sort the Series by the index. The sort modifies the Series inplace. If the index is already sorted then nothing
+        is changed.
 
         :return: nothing
         """
+        self._in_order = True
+        if is_sorted(self._index):
+            return
         sort = sorted_list_indexes(self._index)
+        cycles = permutation_cycles(sort)
         # sort index
-        self._index = [self._index[x] for x in sort]
+        apply_permutation(self._index, sort, cycles)
+        self._index_map = None
         # sort data
-        self._data = [self._data[x] for x in sort]
+        apply_permutation(self._data, sort, cycles)
 
     def set(self, indexes: Any | list[Any] | list[bool], values: T | list[T] | Any = None) -> None:
         """
@@ -528,6 +693,8 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param values: value or list of values to set. If a list then must be the same length as the index's parameter.
         :return: nothing
         """
+        if isinstance(indexes, BlockedList):  # the index of a blocked storage Series
+            indexes = list(indexes)
         if isinstance(indexes, list):
             self.set_rows(indexes, values)
         else:
@@ -541,6 +708,8 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param index: index of the new row
         :return: nothing
         """
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
         self._index.append(index)
         self._data.append(None)
 
@@ -557,6 +726,7 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         else:
             self._index.insert(i, index)
             self._data.insert(i, None)
+            self._index_map = None
 
     def _add_missing_rows(self, indexes: list[Any]) -> None:
         """
@@ -566,23 +736,27 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param indexes: list of indexes
         :return: nothing
         """
-        existing = set(self._index)
-        new_indexes = [x for x in indexes if x not in existing]
+        new_indexes = [x for x in dict.fromkeys(indexes) if not self._index_exists(x)]
         for x in new_indexes:
             self._add_row(x)
 
     def _insert_missing_rows(self, indexes: list[Any]) -> None:
         """
         Given a list of indexes, find all the indexes that are not currently in the Series and make a new row for
-        that index, inserting into the index. This requires the Series to be sorted=True
+        that index, inserting into the index. This requires the Series to be sorted=True. When there is more than one
+        new index they are sorted and merged into the index and data in a single pass.
 
         :param indexes: list of indexes
         :return: nothing
         """
-        existing = set(self._index)
-        new_indexes = [x for x in indexes if x not in existing]
-        for x in new_indexes:
-            self._insert_row(bisect_left(self._index, x), x)
+        new_indexes = sorted({x for x in indexes if not self._index_exists(x)})
+        if len(new_indexes) == 1:
+            self._insert_row(bisect_left(self._index, new_indexes[0]), new_indexes[0])
+        elif new_indexes:
+            locations = sorted_insert_locations(self._index, new_indexes)
+            merge_insert(self._index, locations, new_indexes)
+            merge_insert(self._data, locations)
+            self._index_map = None
 
     def set_cell(self, index: IndexT, value: T | Any) -> None:
         """
@@ -592,17 +766,22 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param value: value to set
         :return: nothing
         """
+        if self._aggregate is not None:  # before a new row is added for the index
+            self._aggregate.check((value,))
         if self._sort:
             exists, i = sorted_exists(self._index, index)
             if not exists:
                 self._insert_row(i, index)
         else:
             try:
-                i = self._index.index(index)
+                i = self._index_location(index)
             except ValueError:
                 i = len(self._index)
                 self._add_row(index)
-        self._data[i] = value
+        if self._aggregate is not None:
+            self._set_values([i], [value])
+        else:
+            self._data[i] = value
 
     def set_rows(self, index: list[Any] | list[bool], values: T | list[T] | Any = None) -> None:
         """
@@ -615,19 +794,19 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         list is values, or the length of the True values in the index list if the index list is booleans
         :return: nothing
         """
-        if index and isinstance(index[0], bool) and all(isinstance(i, bool) for i in index):  # boolean list
-            value_list = list(values) if isinstance(values, list) else [values for x in index if x]
+        if is_mask(index):  # boolean list
+            value_list = list(values) if isinstance(values, (list, BlockedList)) else [values for x in index if x]
             if len(index) != len(self._index):
                 raise ValueError("boolean index list must be same size of existing index")
             if len(value_list) != index.count(True):
                 raise ValueError("length of values list must equal number of True entries in index list")
-            indexes = [i for i, x in enumerate(index) if x]
-            for x, i in enumerate(indexes):
-                self._data[i] = value_list[x]
+            self._set_values([i for i, x in enumerate(index) if x], value_list)
         else:  # list of index
-            value_list = list(values) if isinstance(values, list) else [values for _ in index]
+            value_list = list(values) if isinstance(values, (list, BlockedList)) else [values for _ in index]
             if len(value_list) != len(index):
                 raise ValueError("length of values and index must be the same.")
+            if self._aggregate is not None:  # before new rows are added for the index
+                self._aggregate.check(value_list)
             # insert or append indexes as needed
             if self._sort:
                 exists = []
@@ -641,12 +820,30 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
                     indexes = [sorted_index(self._index, x) for x in index]
             else:
                 try:  # all index in current index
-                    indexes = [self._index.index(x) for x in index]
+                    indexes = [self._index_location(x) for x in index]
                 except ValueError:  # new rows need to be added
                     self._add_missing_rows(index)
-                    indexes = [self._index.index(x) for x in index]
-            for x, i in enumerate(indexes):
-                self._data[i] = value_list[x]
+                    indexes = [self._index_location(x) for x in index]
+            self._set_values(indexes, value_list)
+
+    def _set_values(self, locations: list[int], values: list[Any]) -> None:
+        """
+        Set the values at the locations. The values are checked against the aggregate before any is set, and the
+        aggregate is updated for each value only after it is set.
+
+        :param locations: list of row locations
+        :param values: list of new values, one for each location
+        :return: nothing
+        """
+        if self._aggregate is None:
+            for x, i in enumerate(locations):
+                self._data[i] = values[x]
+            return
+        self._aggregate.check(values)
+        for x, i in enumerate(locations):
+            old = self._data[i]
+            self._data[i] = values[x]
+            self._aggregate.replace(old, values[x])
 
     def set_location(self, location: int, value: Any) -> None:
         """
@@ -656,7 +853,10 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param value: value
         :return: nothing
         """
-        self._data[location] = value
+        if self._aggregate is not None:
+            self._set_values([location], [value])
+        else:
+            self._data[location] = value
 
     def set_locations(self, locations: list[int], values: list[Any] | Any) -> None:
         """
@@ -724,11 +924,18 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param value: value
         :return: nothing
         """
-        if index in self._index:
+        if self._index_exists(index):
             raise IndexError("index already in Series")
+        if self._aggregate is not None:
+            self._aggregate.check((value,))
 
+        self._check_order([index])
+        if self._index_map is not None:
+            self._index_map[index] = len(self._index)
         self._index.append(index)
         self._data.append(value)
+        if self._aggregate is not None:
+            self._aggregate.add(value)
 
     def append_rows(self, indexes: list[IndexT], values: list[T]) -> None:
         """
@@ -745,13 +952,19 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
             raise ValueError("length of values is not equal to length of indexes")
 
         # check the indexes are not duplicates
-        combined_index = self._index + indexes
-        if len(set(combined_index)) != len(combined_index):
+        if len(set(indexes)) != len(indexes) or any(self._index_exists(x) for x in indexes):
             raise IndexError("duplicate indexes in Series")
+        if self._aggregate is not None:
+            self._aggregate.check(values)
 
         # append index value
+        self._check_order(indexes)
+        if self._index_map is not None:
+            self._index_map.update(zip(indexes, range(len(self._index), len(self._index) + len(indexes))))
         self._index.extend(indexes)
         self._data.extend(values)
+        if self._aggregate is not None:
+            self._aggregate.extend(values)
 
     def delete(self, indexes: Any | list[Any] | list[bool]) -> None:
         """
@@ -760,23 +973,28 @@ class Series[IndexT, T](SeriesBase[IndexT, T]):
         :param indexes: either a list of values or list of booleans for the rows to delete
         :return: nothing
         """
+        if isinstance(indexes, BlockedList):  # the index of a blocked storage Series
+            indexes = list(indexes)
         index_list = indexes if isinstance(indexes, list) else [indexes]
-        if (
-            index_list and isinstance(index_list[0], bool) and all(isinstance(i, bool) for i in index_list)
-        ):  # boolean list
+        if is_mask(index_list):  # boolean list
             if len(index_list) != len(self._index):
                 raise ValueError("boolean indexes list must be same size of existing indexes")
             delete_locations = [i for i, x in enumerate(index_list) if x]
         else:
-            delete_locations = (
-                [sorted_index(self._index, x) for x in index_list]
-                if self._sort
-                else [self._index.index(x) for x in index_list]
-            )
+            delete_locations = [self._index_location(x) for x in index_list]
         delete_locations = sorted(delete_locations, reverse=True)  # need to sort and reverse list so deleting works
+        if self._aggregate is not None:
+            for i in delete_locations:
+                self._aggregate.remove(self._data[i])
         for i in delete_locations:
             del self._data[i]
+            if self._index_map is not None:
+                del self._index_map[self._index[i]]
             del self._index[i]
+        if self._index_map is not None and delete_locations:
+            # every row after the first deleted row has moved, so update their locations
+            for i in range(delete_locations[-1], len(self._index)):
+                self._index_map[self._index[i]] = i
 
     def reset_index(self) -> None:
         """
@@ -826,7 +1044,7 @@ class ViewSeries[IndexT, T](SeriesBase[IndexT, T]):
         # standard variable setup
         self._data = data  # direct view, no copy
         self._data_name = data_name
-        self.index = index if isinstance(index, list) else list(index)
+        self.index = index if isinstance(index, (list, BlockedList)) else list(index)
         self._index_name = index_name
         self._sort = sort
         self._offset = offset
@@ -901,7 +1119,7 @@ class ViewSeries[IndexT, T](SeriesBase[IndexT, T]):
                 return self.get(indexes, as_list=True)
 
         # list of booleans
-        elif isinstance(indexes, list) and all(isinstance(x, bool) for x in indexes):
+        elif isinstance(indexes, Mask) or (isinstance(indexes, list) and all(isinstance(x, bool) for x in indexes)):
             return self.get(cast(list[IndexT] | list[bool], indexes), as_list=True)
 
         # list of values
@@ -941,6 +1159,17 @@ class ViewSeries[IndexT, T](SeriesBase[IndexT, T]):
         """
         return self.value(index, int_as_index=False)
 
+    def rolling(self, window: int) -> Rolling:
+        """
+        Return a Rolling object of the sum, mean, std, min and max of the last window values of the data. The Rolling
+        object is a view on the data, as the underlying column grows by appended rows each read of a statistic takes in
+        the new values at a constant cost per value, so it can be polled on every tick.
+
+        :param window: number of values in the window
+        :return: Rolling
+        """
+        return Rolling(self._data, window)
+
     # Series creation functions
     @classmethod
     def from_dataframe(cls, dataframe: DataFrame[IndexT, Any], column: str | tuple | None, offset: int = 0) -> Self:
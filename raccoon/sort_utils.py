@@ -2,8 +2,11 @@
 Utility functions for sorting and dealing with sorted Series and DataFrames
 """
 
+from array import array
 from bisect import bisect_left
-from typing import Any, Callable
+from itertools import islice
+from operator import le
+from typing import Any, Callable, MutableSequence, Sequence
 
 
 def sorted_exists(values: list[Any], x: Any) -> tuple[bool, int]:
@@ -55,3 +58,139 @@ def sorted_list_indexes[T](
     else:
         key_func = lambda i: list_to_sort[i]
     return sorted(range(len(list_to_sort)), key=key_func, reverse=reverse)
+
+
+def sorted_columns_indexes(
+    columns: Sequence[Sequence[Any]], ascending: Sequence[bool], key: Callable[[Any], Any] | None = None
+) -> list[int]:
+    """
+    Returns the order of the locations that sorts by several columns of the same length, where the first column is the
+    primary sort and each later column breaks the ties of the ones before it. The locations are sorted by each column
+    in turn from the last to the first. Because the built-in sort is stable, and stays stable when reversed, this gives
+    the same order as sorting by a tuple of the values without building a tuple for each row, and each column can have
+    its own direction.
+
+    :param columns: list of the columns to sort by, each a list, BlockedList or array
+    :param ascending: list of booleans with one for each column, False to sort that column in descending order
+    :param key: if not None then a function of one argument that is used to extract a comparison key from each value
+    :return: list of locations in sorted order
+    """
+    order = list(range(len(columns[0]))) if columns else []
+    for values, up in zip(reversed(columns), reversed(ascending)):
+        if not isinstance(values, (list, array)):  # other sequences can be slow to index by location
+            values = list(values)
+        if key is None:
+            order.sort(key=values.__getitem__, reverse=not up)
+        else:
+            order.sort(key=lambda i: key(values[i]), reverse=not up)
+    return order
+
+
+def is_sorted(values: Sequence[Any]) -> bool:
+    """
+    Returns True if the values are in ascending order. This is a single linear pass that stops at the first value out
+    of order, so it is much faster than a sort and is used to skip sorting values that are already in order.
+
+    :param values: list, BlockedList or array
+    :return: True if each value is less than or equal to the next
+    """
+    return all(map(le, values, islice(values, 1, None)))
+
+
+def permutation_cycles(order: Sequence[int]) -> list[list[int]]:
+    """
+    Returns the cycles of a permutation that move a value, each cycle a list of the locations where location k takes
+    the value from the next location in the cycle and the last location takes the value from the first. Locations that
+    do not move are not included.
+
+    :param order: list of locations, such as the result of sorted_list_indexes()
+    :return: list of cycles
+    """
+    visited = bytearray(len(order))
+    cycles = []
+    for start, i in enumerate(order):
+        if visited[start] or i == start:
+            continue
+        cycle = [start]
+        visited[start] = 1
+        while i != start:
+            visited[i] = 1
+            cycle.append(i)
+            i = order[i]
+        cycles.append(cycle)
+    return cycles
+
+
+def apply_permutation(
+    values: MutableSequence[Any], order: Sequence[int], cycles: list[list[int]] | None = None
+) -> None:
+    """
+    Reorder the values in place so that the value at location i is the value that was at location order[i]. The
+    values are moved along the cycles of the permutation with one temporary value for each cycle, so no copy of the
+    values is made and the container is kept, an array stays an array and a BlockedList stays a BlockedList.
+
+    :param values: list, BlockedList or array
+    :param order: list of locations, such as the result of sorted_list_indexes()
+    :param cycles: (optional) the result of permutation_cycles() for the order, to reorder many containers with the
+        same order without finding the cycles each time
+    :return: nothing
+    """
+    if cycles is None:
+        cycles = permutation_cycles(order)
+    for cycle in cycles:
+        if len(cycle) == 2:  # the most common cycle, such as every cycle of reversing the values
+            i, j = cycle
+            values[i], values[j] = values[j], values[i]
+            continue
+        i = cycle[0]
+        first = values[i]
+        for j in cycle:  # the first step sets the first location to itself
+            values[i] = values[j]
+            i = j
+        values[i] = first
+
+
+def sorted_insert_locations(values: list[Any], new_values: list[Any]) -> list[int]:
+    """
+    For sorted list, values, and sorted list of new items, new_values, returns the location in values where each new
+    item is to be inserted to keep the list in sorted order. Because new_values is sorted the search for each item
+    starts from the location of the previous one.
+
+    :param values: sorted list
+    :param new_values: sorted list of items not in values
+    :return: list of insert locations
+    """
+    locations = []
+    lo = 0
+    for x in new_values:
+        lo = bisect_left(values, x, lo)
+        locations.append(lo)
+    return locations
+
+
+def merge_insert(values: list[Any], locations: list[int], items: list[Any] | None = None) -> None:
+    """
+    Inserts items into the list at the locations in a single linear pass, rather than one list.insert() per item which
+    moves the tail of the list for every insert. The locations are positions in the original list, as returned by
+    sorted_insert_locations(), and must be in ascending order. The list is modified in place so any other references
+    to it remain valid.
+
+    :param values: list to insert into
+    :param locations: list of insert locations, one for each item
+    :param items: list of items to insert, if None then None will be inserted at each location
+    :return: nothing
+    """
+    if not locations:
+        return
+    new_items = [None] * len(locations) if items is None else items
+    if locations[0] == len(values):  # all the items go on the end
+        values.extend(new_items)
+        return
+    merged = values[:0]  # empty slice so arrays stay arrays
+    previous = 0
+    for location, item in zip(locations, new_items):
+        merged.extend(values[previous:location])
+        merged.append(item)
+        previous = location
+    merged.extend(values[previous:])
+    values[:] = merged
@@ -0,0 +1,10 @@
+from math import isclose
+
+
+def check_aggregate(aggregate, values):
+    values = [x for x in values if x is not None and x == x]
+    assert aggregate.count == len(values)
+    assert isclose(aggregate.sum, sum(values), abs_tol=1e-9)
+    assert isclose(aggregate.sumsq, sum(x * x for x in values), abs_tol=1e-9)
+    assert aggregate.min == (min(values) if values else None)
+    assert aggregate.max == (max(values) if values else None)
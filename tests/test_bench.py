@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from raccoon.bench import SCENARIOS, compare, load_results, main, run
+
+
+def test_run():
+    results = run(scale=0.01, repeat=1)
+    assert list(results) == list(SCENARIOS)
+    assert all(x >= 0 for x in results.values())
+
+    assert list(run(["get_cell", "json"], scale=0.01, repeat=1)) == ["get_cell", "json"]
+    with pytest.raises(ValueError):
+        run(["bad"])
+
+
+def test_compare():
+    rows = compare({"a": 2.0, "b": 1.0, "c": 1.0}, {"a": 1.0, "b": 1.0}, threshold=1.5)
+    assert rows == [("a", 2.0, 1.0, 2.0, True), ("b", 1.0, 1.0, 1.0, False)]
+
+
+def test_main(tmp_path, capsys):
+    output = str(tmp_path / "results.json")
+    assert main(["get_cell", "delete_rows", "--scale", "0.01", "--repeat", "1", "--output", output]) == 0
+    with open(output) as file:
+        saved = json.load(file)
+    assert set(saved) == {"environment", "scale", "results"}
+    assert list(load_results(output)) == ["get_cell", "delete_rows"]
+
+    # no regressions against itself with a generous threshold
+    assert main(["get_cell", "--scale", "0.01", "--repeat", "1", "--baseline", output, "--threshold", "1000"]) == 0
+
+    # a baseline that is impossibly fast fails
+    saved["results"] = {"get_cell": 1e-12}
+    with open(output, "w") as file:
+        json.dump(saved, file)
+    assert main(["get_cell", "--scale", "0.01", "--repeat", "1", "--baseline", output]) == 1
+    assert "get_cell" in capsys.readouterr().err
+
+    assert main(["--list"]) == 0
+    assert "time_series_append" in capsys.readouterr().out
@@ -0,0 +1,149 @@
+from math import isclose, nan
+
+import pytest
+
+import raccoon as rc
+from raccoon.aggregates import RunningAggregate
+from tests import check_aggregate
+
+
+def test_running_aggregate():
+    aggregate = RunningAggregate([4, 1, None, 7, nan, 3])
+    check_aggregate(aggregate, [4, 1, 7, 3])
+    assert aggregate.mean == 3.75
+    assert isclose(aggregate.variance, 6.25)
+    assert isclose(aggregate.std, 2.5)
+
+    aggregate.remove(1)
+    aggregate.remove(7)
+    check_aggregate(aggregate, [4, 3])
+
+    aggregate.replace(3, 10)
+    aggregate.add(4)
+    check_aggregate(aggregate, [4, 10, 4])
+
+    aggregate.remove(4)
+    check_aggregate(aggregate, [10, 4])
+
+    # a value that cannot be added changes nothing
+    with pytest.raises(TypeError):
+        aggregate.add("x")
+    with pytest.raises(TypeError):
+        aggregate.replace(4, "x")
+    check_aggregate(aggregate, [10, 4])
+
+    aggregate.clear()
+    check_aggregate(aggregate, [])
+    assert aggregate.mean is None
+    assert aggregate.std is None
+
+    # many removes of values that are not the min or max compact the heaps
+    aggregate = RunningAggregate(range(1000))
+    for x in range(1, 999):
+        aggregate.remove(x)
+    assert len(aggregate._min_heap) < 100
+    check_aggregate(aggregate, [0, 999])
+
+
+def test_dataframe_aggregates():
+    df = rc.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]}, index=[10, 11, 12], columns=["a", "b"], sort=False)
+    aggregate = df.add_aggregate("b")
+    assert df.aggregates == {"b": aggregate}
+    check_aggregate(aggregate, [4.0, 5.0, 6.0])
+
+    df.set_cell(11, "b", 50.0)
+    df.set_cell(13, "b", -1.0)
+    df.set_cell(14, "a", 7)
+    df.append_row(15, {"a": 8, "b": 9.0})
+    df.append_rows([16, 17], {"b": [2.5, 3.5]})
+    check_aggregate(aggregate, df.data[1])
+
+    df.set_row(10, {"b": 0.5})
+    df.set_column([10, 20], "b", [1.5, 2.0])
+    df.set_column(df.isin("b", [50.0, 9.0]), "b", 5.0)
+    df.set_location(0, {"b": 0.25})
+    df.set_locations([1, 2], "b", 7.5)
+    check_aggregate(aggregate, df.data[1])
+
+    df.delete_rows([11, 13])
+    df.delete_rows(df.equality("b", value=7.5))
+    check_aggregate(aggregate, df.data[1])
+
+    df.set_column(column="b", values=[float(x) for x in range(len(df))])
+    check_aggregate(aggregate, df.data[1])
+
+    df.rename_columns({"b": "c"})
+    assert df.aggregates == {"c": aggregate}
+    df.set_cell(10, "c", 100.0)
+    check_aggregate(aggregate, df.data[1])
+    df.columns = ["a", "d"]
+    assert df.aggregates == {"d": aggregate}
+
+    df.delete_all_rows()
+    check_aggregate(aggregate, [])
+
+    df.remove_aggregate("d")
+    assert df.aggregates == {}
+    with pytest.raises(ValueError):
+        df.remove_aggregate("d")
+    with pytest.raises(ValueError):
+        df.add_aggregate("bad")
+
+    # aggregates are not serialized
+    assert "aggregates" not in df.to_json()
+
+
+def test_dataframe_aggregates_not_numeric():
+    df = rc.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=[1, 2], sort=False)
+    aggregate = df.add_aggregate("a")
+
+    # a value that cannot be added to the aggregate raises before the DataFrame is changed
+    with pytest.raises(TypeError):
+        df.append_row(3, {"a": "x"})
+    with pytest.raises(TypeError):
+        df.append_rows([3, 4], {"a": [3, "x"]})
+    with pytest.raises(TypeError):
+        df.set_cell(1, "a", "y")
+    with pytest.raises(TypeError):
+        df.set_cell(3, "a", "y")
+    with pytest.raises(TypeError):
+        df.set([1, 3], "a", [5, "y"])
+    with pytest.raises(TypeError):
+        df.set(columns="a", values=[5, "y"])
+    assert df.index == [1, 2]
+    assert df.to_dict(index=False) == {"a": [1, 2], "b": ["x", "y"]}
+    check_aggregate(aggregate, [1, 2])
+
+    df.append_row(3, {"a": 3, "b": "z"})
+    df.set_cell(1, "a", 10)
+    check_aggregate(aggregate, [10, 2, 3])
+
+
+def test_dataframe_aggregates_sorted():
+    df = rc.DataFrame({"a": [1, 3, 5]}, index=[1, 3, 5], sort=True, dtypes={"a": "q"})
+    aggregate = df.add_aggregate("a")
+
+    # a new row without a value for the integer typed column raises and changes nothing
+    with pytest.raises(ValueError):
+        df.set_cell(4, "b", "x")
+    assert df.columns == ["a"]
+    check_aggregate(aggregate, df.data[0])
+
+    df.set([0, 2, 6], "a", [10, 20, 60])
+    df.set_cell(4, "a", 40)
+    df.append(rc.DataFrame({"a": [-5]}, index=[7], dtypes={"a": "q"}))
+    check_aggregate(aggregate, df.data[0])
+    assert aggregate.count == 8
+
+    # a value the integer typed column cannot hold raises before any value is set
+    with pytest.raises(TypeError):
+        df.set_cell(1, "a", "x")
+    with pytest.raises(TypeError):
+        df.set_column([1, 3], "a", [11, "x"])
+    with pytest.raises(TypeError):
+        df.set_location(0, {"a": "x"})
+    assert df.get_cell(1, "a") == 1
+    check_aggregate(aggregate, df.data[0])
+
+    df.delete_columns("a")
+    assert df.aggregates == {}
@@ -0,0 +1,86 @@
+import pickle
+from array import array
+from math import isnan
+
+import pytest
+
+import raccoon as rc
+from raccoon.arrow import from_arrow_array
+from raccoon.utils import assert_frame_equal
+
+pa = pytest.importorskip("pyarrow")
+
+
+def test_to_arrow():
+    df = rc.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", None, "z"], "px": [1.5, 2.5, 3.5]},
+        columns=["a", "b", "px"],
+        index=[10, 11, 12],
+        index_name="key",
+        dtypes={"px": "d"},
+    )
+    table = df.to_arrow()
+    assert table.column_names == ["key", "a", "b", "px"]
+    assert table.column("b").to_pylist() == ["x", None, "z"]
+    assert table.column("px").type == pa.float64()
+
+    # typed columns share memory
+    assert table.column("px").chunks[0].buffers()[1].address == df.data[2].buffer_info()[0]
+
+    table = df.to_arrow(index=False)
+    assert table.column_names == ["a", "b", "px"]
+
+
+def test_from_arrow():
+    df = rc.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", None, "z"], "px": [1.5, 2.5, 3.5], "qty": [1, 2, 3]},
+        columns=["a", "b", "px", "qty"],
+        index=[10, 11, 12],
+        dtypes={"px": "d", "qty": "i"},
+        sort=False,
+    )
+    actual = rc.DataFrame.from_arrow(df.to_arrow())
+    assert_frame_equal(actual, df)
+    assert actual.dtypes == {"px": "d", "qty": "i"}
+    assert isinstance(actual.data[2], array)
+
+    actual = rc.DataFrame.from_arrow(df.to_arrow(index=False))
+    assert actual.index == [0, 1, 2]
+
+    # plain Arrow table
+    table = pa.table({"key": ["x", "y"], "value": [1.0, None]})
+    actual = rc.DataFrame.from_arrow(table, index_col="key")
+    assert actual.index == ["x", "y"]
+    assert actual.columns == ["value"]
+    assert actual.data == [[1.0, None]]
+    assert isnan(from_arrow_array(table.column("value"), "d")[1])
+    with pytest.raises(ValueError):  # integer columns cannot have missing values
+        from_arrow_array(pa.array([1, None], pa.int64()), "q")
+    actual = rc.DataFrame.from_arrow(table)
+    assert actual.columns == ["key", "value"]
+
+
+def test_arrow_metadata():
+    df = rc.DataFrame(
+        {("a", 1): [1.5, 2.5], ("b", 2): ["x", "y"]},
+        columns=[("a", 1), ("b", 2)],
+        index=[10, 11],
+        index_name=("key", 0),
+        dtypes={("a", 1): "d"},
+    )
+    table = df.to_arrow()
+    actual = rc.DataFrame.from_arrow(table)
+    assert_frame_equal(actual, df)
+    assert actual.dtypes == {("a", 1): "d"}
+
+    # the metadata is JSON and metadata that cannot be read or does not match the table raises
+    pickled = pickle.dumps({"meta_data": {"columns": ["x"]}, "index": False})
+    for metadata in [pickled, b"{}", b'{"index": false, "columns": ["a"]}']:
+        with pytest.raises(ValueError):
+            rc.DataFrame.from_arrow(table.replace_schema_metadata({b"raccoon": metadata}))
+    bad_dtype = table.schema.metadata[b"raccoon"].replace(b'"d"', b'"x"')
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_arrow(table.replace_schema_metadata({b"raccoon": bad_dtype}))
+
+    with pytest.raises(TypeError):
+        rc.DataFrame({"a": [1]}, index_name=object()).to_arrow()
@@ -0,0 +1,190 @@
+import pytest
+
+import raccoon as rc
+from raccoon.blocked_list import BlockedList
+from raccoon.utils import assert_frame_equal
+
+
+def test_blocked_list():
+    with pytest.raises(ValueError):
+        BlockedList(block_size=1)
+
+    actual = BlockedList(range(10), block_size=3)
+    assert len(actual) == 10
+    assert [len(x) for x in actual.blocks] == [3, 3, 3, 1]
+    assert actual == list(range(10))
+    assert actual[0] == 0
+    assert actual[4] == 4
+    assert actual[-1] == 9
+    assert actual[2:8] == [2, 3, 4, 5, 6, 7]
+    assert actual[::3] == [0, 3, 6, 9]
+    assert actual[8:2] == []
+    assert list(reversed(actual)) == list(range(9, -1, -1))
+    assert 7 in actual
+    assert 11 not in actual
+    assert actual.index(7) == 7
+    assert actual.count(7) == 1
+
+    with pytest.raises(IndexError):
+        _ = actual[10]
+    with pytest.raises(ValueError):
+        actual.index(11)
+
+    actual[5] = 55
+    assert actual[5] == 55
+    actual[5:7] = [5, 6, 6.5]
+    assert actual == [0, 1, 2, 3, 4, 5, 6, 6.5, 7, 8, 9]
+
+    copy = actual.copy()
+    assert copy == actual
+    assert copy is not actual
+    assert copy.block_size == 3
+
+
+def test_blocked_list_insert_delete():
+    expected = list(range(0, 100, 10))
+    actual = BlockedList(expected, block_size=2)
+
+    # inserts in the middle split the blocks when they grow too large
+    for value in [15, 16, 17, 18, 19, 45, -5, 95, 200]:
+        loc = sum(x < value for x in expected)
+        expected.insert(loc, value)
+        actual.insert(loc, value)
+        assert actual == expected
+    assert all(len(x) <= 4 for x in actual.blocks)
+    assert sum(len(x) for x in actual.blocks) == len(actual)
+    assert [actual[i] for i in range(len(actual))] == expected
+
+    actual.insert(-1, 99)
+    expected.insert(-1, 99)
+    assert actual == expected
+
+    # deletes remove empty blocks and join small neighbours
+    for loc in [0, 5, -1, 3, 3, 3, 3]:
+        del expected[loc]
+        del actual[loc]
+        assert actual == expected
+    assert all(x for x in actual.blocks)
+    assert [actual[i] for i in range(len(actual))] == expected
+
+    del actual[1:4]
+    del expected[1:4]
+    assert actual == expected
+
+    actual.append(1000)
+    actual.extend([1001, 1002])
+    expected.extend([1000, 1001, 1002])
+    assert actual == expected
+    assert actual[-3] == 1000
+
+    del actual[:]
+    assert actual == []
+    assert len(actual) == 0
+
+
+def test_blocked_list_block_size():
+    # the block size is the square root of the length unless fixed
+    actual = BlockedList(range(10000))
+    assert actual.block_size is None
+    assert [len(x) for x in actual.blocks] == [100] * 100
+    assert BlockedList(range(10)).blocks == [list(range(10))]
+
+    # mixed inserts, deletes and reads stay in step with a list
+    expected = list(range(10000))
+    for k in range(2000):
+        loc = (k * 7919) % len(expected)
+        if k % 3:
+            expected.insert(loc, -k)
+            actual.insert(loc, -k)
+        else:
+            del expected[loc]
+            del actual[loc]
+        assert actual[loc] == expected[loc]
+        if k % 2:
+            actual.append(k)
+            expected.append(k)
+    assert actual == expected
+    assert [actual[i] for i in range(0, len(actual), 7)] == expected[::7]
+    assert all(len(x) <= 2 * 100 for x in actual.blocks)
+
+
+def test_storage():
+    with pytest.raises(ValueError):
+        rc.DataFrame({"a": [1, 2, 3]}, storage="bad")
+
+    df = rc.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, columns=["a", "b"], storage="blocked")
+    assert df.storage == "blocked"
+    assert isinstance(df.index, BlockedList)
+    assert all(isinstance(x, BlockedList) for x in df.data)
+
+    df.set_column(column="c", values=[7, 8, 9])
+    assert isinstance(df.data[2], BlockedList)
+
+    assert rc.DataFrame().storage == "list"
+
+
+def test_blocked_sorted_inserts():
+    expected = rc.DataFrame({"a": [], "b": []}, columns=["a", "b"], sort=True)
+    actual = rc.DataFrame({"a": [], "b": []}, columns=["a", "b"], sort=True, storage="blocked")
+
+    for i in [5, 1, 9, 3, 7, 2, 8, 4, 6, 0]:
+        expected.set(i, "a", i * 10)
+        actual.set(i, "a", i * 10)
+        expected.set(i, "b", str(i))
+        actual.set(i, "b", str(i))
+
+    assert actual.index == list(range(10))
+    assert actual.to_dict() == expected.to_dict()
+
+    # bulk insert in the middle
+    actual.set([2.5, 4.5, 20], "a", [25, 45, 200])
+    expected.set([2.5, 4.5, 20], "a", [25, 45, 200])
+    assert actual.to_dict() == expected.to_dict()
+
+    actual.append_row(30, {"a": 300})
+    expected.append_row(30, {"a": 300})
+    assert actual.get(4.5, "a") == 45
+
+    actual.delete_rows([0, 4.5, 8])
+    expected.delete_rows([0, 4.5, 8])
+    assert actual.to_dict() == expected.to_dict()
+
+    # results keep the storage type
+    rows = actual.get([1, 2, 2.5])
+    assert rows.storage == "blocked"
+    assert isinstance(rows.index, BlockedList)
+    assert_frame_equal(actual.get_slice(2, 5), expected.get_slice(2, 5))
+
+    # the index can be used to select
+    assert actual.get(actual.index, "a", as_list=True) == expected.get_entire_column("a", as_list=True)
+
+
+def test_blocked_functions():
+    expected = rc.DataFrame({"a": [3, 1, 2], "b": [6, 4, 5]}, index=["x", "y", "z"], columns=["a", "b"])
+    actual = rc.DataFrame(
+        {"a": [3, 1, 2], "b": [6, 4, 5]}, index=["x", "y", "z"], columns=["a", "b"], storage="blocked"
+    )
+
+    assert list(actual.iterrows()) == list(expected.iterrows())
+    assert list(actual.itertuples()) == list(expected.itertuples())
+    assert list(actual.itertuples(index=False)) == list(expected.itertuples(index=False))
+    assert str(actual) == str(expected)
+
+    json_string = actual.to_json()
+    round_trip = rc.DataFrame.from_json(json_string)
+    assert round_trip.storage == "blocked"
+    assert round_trip.to_dict() == actual.to_dict()
+
+    actual.sort_columns("a")
+    expected.sort_columns("a")
+    assert isinstance(actual.index, BlockedList)
+    assert actual.to_dict() == expected.to_dict()
+
+    actual.reset_index()
+    expected.reset_index()
+    assert actual.to_dict() == expected.to_dict()
+    assert isinstance(actual.data[0], BlockedList)
+
+    series = rc.ViewSeries.from_dataframe(actual, "a")
+    assert series.index is actual.index
+    assert series.data is actual.data[actual.columns.index("a")]
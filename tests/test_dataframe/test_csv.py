@@ -0,0 +1,143 @@
+from array import array
+from datetime import date
+from math import isnan
+
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def write_file(path, text):
+    with open(path, "w", newline="") as file:
+        file.write(text)
+
+
+def test_read_csv(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_file(path, "a,b,c\n1,2.5,x\n2,,y\n3,4.5,\n")
+
+    actual = rc.DataFrame.read_csv(path)
+    expected = rc.DataFrame(
+        {"a": ["1", "2", "3"], "b": ["2.5", "", "4.5"], "c": ["x", "y", ""]}, columns=["a", "b", "c"]
+    )
+    assert_frame_equal(actual, expected)
+    assert actual.sort is True
+
+    actual = rc.DataFrame.read_csv(path, dtypes={"a": "q", "b": "d"}, converters={"c": str.upper})
+    assert actual.dtypes == {"a": "q", "b": "d"}
+    assert actual.data[0] == array("q", [1, 2, 3])
+    assert isinstance(actual.data[1], array) and isnan(actual.data[1][1])
+    assert actual.data[2] == ["X", "Y", None]
+    with pytest.raises(ValueError):  # integer columns cannot have missing values
+        rc.DataFrame.read_csv(path, dtypes={"b": "q"})
+
+    # index column by name or position
+    actual = rc.DataFrame.read_csv(path, index_col="c")
+    assert actual.index == ["x", "y", ""]
+    assert actual.index_name == "c"
+    assert actual.columns == ["a", "b"]
+    assert actual.sort is False
+    actual = rc.DataFrame.read_csv(path, index_col=0, converters={"a": int}, sort=True)
+    assert actual.index == [1, 2, 3]
+    assert actual.index_name == "a"
+    assert actual.sort is True
+
+    # short rows are filled with empty fields, long rows are an error
+    write_file(path, "a,b\n1\n")
+    assert rc.DataFrame.read_csv(path).data == [["1"], [""]]
+    write_file(path, "a,b\n1,2,3\n")
+    with pytest.raises(ValueError):
+        rc.DataFrame.read_csv(path)
+
+
+def test_read_csv_sort(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_file(path, "day,value\n2020-01-03,3\n2020-01-01,1\n2020-01-02,2\n")
+    actual = rc.DataFrame.read_csv(
+        path, index_col="day", dtypes={"value": "i"}, converters={"day": date.fromisoformat}, sort=True
+    )
+    assert actual.index == [date(2020, 1, 1), date(2020, 1, 2), date(2020, 1, 3)]
+    assert list(actual.data[0]) == [1, 2, 3]
+
+    # a typecode for the index column converts the index values and is not kept as a dtype
+    write_file(path, "t,a\n3,1.5\n1,2.5\n")
+    actual = rc.DataFrame.read_csv(path, index_col="t", dtypes={"t": "q", "a": "d"}, sort=True)
+    assert actual.index == [1, 3]
+    assert isinstance(actual.index, list)
+    assert actual.dtypes == {"a": "d"}
+    actual.set_column(column="t", values=["x", "y"])
+    assert actual.get_entire_column("t", as_list=True) == ["x", "y"]
+
+    # duplicate index
+    write_file(path, "key,value\na,1\na,2\n")
+    with pytest.raises(ValueError):
+        rc.DataFrame.read_csv(path, index_col="key")
+
+
+def test_read_csv_chunks(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_file(path, "a,b\n" + "".join("%s,%s\n" % (i, i * 10) for i in range(10)))
+
+    chunks = list(rc.DataFrame.read_csv(path, chunksize=4, dtypes={"a": "q", "b": "q"}))
+    assert [len(x) for x in chunks] == [4, 4, 2]
+    assert chunks[1].index == [4, 5, 6, 7]
+    assert list(chunks[2].data[1]) == [80, 90]
+
+    # the whole file as one DataFrame
+    actual = rc.DataFrame.read_csv(path, dtypes={"a": "q"}, storage="blocked")
+    expected = rc.DataFrame(
+        {"a": list(range(10)), "b": [str(i * 10) for i in range(10)]}, columns=["a", "b"], dtypes={"a": "q"}
+    )
+    assert_frame_equal(actual, expected)
+    assert actual.storage == "blocked"
+
+
+def test_read_csv_empty(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_file(path, "")
+    actual = rc.DataFrame.read_csv(path)
+    assert len(actual) == 0 and actual.columns == []
+
+    write_file(path, "a,b\n")
+    actual = rc.DataFrame.read_csv(path, index_col="a")
+    assert len(actual) == 0
+    assert actual.columns == ["b"]
+    assert actual.index_name == "a"
+    assert list(rc.DataFrame.read_csv(path, chunksize=10))[0].columns == ["a", "b"]
+
+    # blank lines are skipped
+    write_file(path, "\na,b\n1,2\n\n3,4\n\n")
+    actual = rc.DataFrame.read_csv(path)
+    assert actual.to_dict(index=False) == {"a": ["1", "3"], "b": ["2", "4"]}
+    assert len(list(rc.DataFrame.read_csv(path, chunksize=1))) == 2
+
+
+def test_read_csv_duplicate_header(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_file(path, "a,b,a\n1,2,3\n")
+    with pytest.raises(ValueError):
+        rc.DataFrame.read_csv(path)
+
+
+def test_to_csv(tmp_path):
+    path = str(tmp_path / "data.csv")
+    df = rc.DataFrame(
+        {"a": [1, 2, 3], "b": [1.5, None, 3.5], "c": ["x", "y, z", 'q"uote']},
+        columns=["a", "b", "c"],
+        index=[10, 11, 12],
+        index_name="key",
+        dtypes={"a": "q"},
+    )
+    df.to_csv(path)
+    with open(path, newline="") as file:
+        assert file.read().splitlines() == ["key,a,b,c", "10,1,1.5,x", '11,2,,"y, z"', '12,3,3.5,"q""uote"']
+
+    actual = rc.DataFrame.read_csv(
+        path, index_col="key", dtypes={"a": "q"}, converters={"key": int, "b": float}, sort=False
+    )
+    assert_frame_equal(actual, df)
+
+    df.to_csv(path, index=False, delimiter="|")
+    with open(path, newline="") as file:
+        assert file.readline() == "a|b|c\r\n"
@@ -171,6 +171,35 @@ def test_rename_columns():
         df.rename_columns({'a2': 'a', 'bad': 'nogo'})
 
 
+def test_column_lookup():
+    # column lookups remain correct as columns are added, renamed, re-ordered and deleted
+    df = rc.DataFrame({'a': [1, 2], 'b': [3, 4], 'c': [5, 6]}, columns=['a', 'b', 'c'])
+    assert df.get(1, 'c') == 6
+
+    df.set(0, 'd', 7)
+    df.append_row(2, {'a': 8, 'e': 9})
+    assert df.columns == ['a', 'b', 'c', 'd', 'e']
+    assert df.get(0, 'd') == 7
+    assert df.get(2, 'e') == 9
+
+    df.rename_columns({'a': 'z'})
+    assert df.get([0, 1, 2], 'z', as_list=True) == [1, 2, 8]
+    with pytest.raises(ValueError):
+        df.get_cell(0, 'a')
+
+    df.delete_columns(['b', 'd'])
+    assert df.columns == ['z', 'c', 'e']
+    assert df.get_location(2, 'e') == 9
+    assert df.get_location(1, as_dict=True) == {'z': 2, 'c': 6, 'e': None, 'index': 1}
+
+    df.columns = ['x', 'y', 'w']
+    assert df.get(2, 'w') == 9
+    assert df.isin('x', [1, 8]) == [True, False, True]
+
+    df.set_location(0, {'y': 50})
+    assert df.get_entire_column('y', as_list=True) == [50, 6, None]
+
+
 def test_print():
     df = rc.DataFrame({'a': [1, 2, 3], 'b': [1.0, 2.55, 3.1], 'c': ['first', 'second', None]}, columns=['b', 'c', 'a'],
                       index=['row1', 'row2', 'row3'])
@@ -419,3 +448,33 @@ def test_reset_index():
     df.reset_index(drop=True)
     expected = rc.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], }, columns=['a', 'b'], sort=False)
     assert_frame_equal(df, expected)
+
+
+def test_math_value():
+    df = rc.DataFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]}, columns=['a', 'b'])
+
+    assert df.add('a', value=10) == [11, 12, 13, 14]
+    assert df.subtract('b', value=1, indexes=[1, 3]) == [5, 7]
+    assert df.multiply('a', value=2.5) == [2.5, 5.0, 7.5, 10.0]
+    assert df.divide('b', value=2, indexes=[False, True, False, True]) == [3.0, 4.0]
+
+    with pytest.raises(ZeroDivisionError):
+        df.divide('a', value=0)
+
+
+def test_compare():
+    df = rc.DataFrame({'a': [1, 5, 3, 4, 2], 'b': ['x', 'y', 'z', 'w', 'v']}, columns=['a', 'b'])
+
+    assert df.gt('a', value=3) == [False, True, False, True, False]
+    assert df.lt('a', value=3) == [True, False, False, False, True]
+    assert df.gt('a', [1, 2, 3], 3) == [True, False, True]
+    assert df.lt('b', value='x') == [False, False, False, True, True]
+
+    assert df.between('a', low=2, high=4) == [False, False, True, True, True]
+    assert df.between('a', low=3) == [False, True, True, True, False]
+    assert df.between('a', high=3) == [True, False, True, False, True]
+    assert df.between('a') == [True] * 5
+    assert df.between('a', [True, True, False, False, True], 2, 4) == [False, False, True]
+
+    df.set(indexes=df.between('a', low=2, high=4), columns='b', values='mid')
+    assert df['b'].data == [['x', 'y', 'mid', 'mid', 'mid']]
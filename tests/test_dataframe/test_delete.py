@@ -104,3 +104,36 @@ def test_delete_columns():
     # insert some data back in, fresh columns and index
     df[1, "e"] = 77
     assert df.data == [[77]]
+
+
+def test_delete_rows_index_lookup():
+    # lookups on an unsorted DataFrame remain correct as rows are appended and deleted
+    df = rc.DataFrame({"a": [1, 2, 3, 4]}, index=["w", "x", "y", "z"], sort=False)
+    assert df.get("y", "a") == 3
+
+    df.append_row("v", {"a": 5})
+    df.append_rows(["t", "u"], {"a": [6, 7]})
+    df["s", "a"] = 8
+    assert df.get(["v", "t", "u", "s"], "a", as_list=True) == [5, 6, 7, 8]
+
+    df.delete_rows(["x", "t"])
+    assert df.index == ["w", "y", "z", "v", "u", "s"]
+    assert [df.get(x, "a") for x in df.index] == [1, 3, 4, 5, 7, 8]
+    with pytest.raises(ValueError):
+        df.get_cell("x", "a")
+
+    df.delete_rows([False, True, False, False, False, True])
+    assert [df.get(x, "a") for x in df.index] == [1, 4, 5, 7]
+
+    df.sort_columns("a", reverse=True)
+    assert df.index == ["u", "v", "z", "w"]
+    assert [df.get(x, "a") for x in df.index] == [7, 5, 4, 1]
+    assert df.select_index("w", result="value") == ["w"]
+
+    df.reset_index(drop=True)
+    assert df.get(0, "a") == 7
+    df.delete_all_rows()
+    with pytest.raises(ValueError):
+        df.get_cell(0, "a")
+    df.set_cell("new", "a", 9)
+    assert df.get("new", "a") == 9
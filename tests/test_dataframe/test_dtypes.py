@@ -0,0 +1,179 @@
+from array import array
+from math import isnan
+
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def test_dtypes():
+    with pytest.raises(ValueError):
+        rc.DataFrame({"a": [1, 2, 3]}, dtypes={"a": "x"})
+
+    df = rc.DataFrame(
+        {"px": [1.5, 2.5, 3.5], "qty": [10, 20, 30], "name": ["a", "b", "c"]},
+        columns=["px", "qty", "name"],
+        dtypes={"px": "d", "qty": "q"},
+    )
+    assert df.dtypes == {"px": "d", "qty": "q"}
+    assert isinstance(df.data[0], array) and df.data[0].typecode == "d"
+    assert isinstance(df.data[1], array) and df.data[1].typecode == "q"
+    assert isinstance(df.data[2], list)
+    assert list(df.get_entire_column("px", as_list=True)) == [1.5, 2.5, 3.5]
+
+    # buffer protocol
+    assert memoryview(df.data[1]).tolist() == [10, 20, 30]
+
+    # wrong type for the column
+    with pytest.raises(TypeError):
+        df.set(1, "qty", "bad")
+
+    assert rc.DataFrame({"a": [1]}).dtypes == {}
+
+
+def test_dtypes_missing_values():
+    df = rc.DataFrame({"px": [1.5], "qty": [10]}, columns=["px", "qty"], dtypes={"px": "d", "qty": "q", "new": "i"})
+
+    # integer columns cannot have missing values, so new rows need a value for them
+    with pytest.raises(ValueError):
+        df.append_row(1, {"px": 2.5})
+    with pytest.raises(ValueError):
+        df.set(1, "px", 2.5)
+    with pytest.raises(ValueError):
+        df.append_rows([1, 2], {"qty": [20]})
+    with pytest.raises(ValueError):
+        rc.DataFrame({"a": [1, 2], "b": [3]}, dtypes={"b": "q"})
+    assert df.index == [0]
+    assert all(len(x) == 1 for x in df.data)
+
+    # float columns are NaN
+    df.append_row(1, {"qty": 20})
+    assert isnan(df.get(1, "px"))
+    df.set(2, "qty", 30)
+    assert isnan(df.get(2, "px"))
+
+    df.set_column(column="new", values=5)
+    assert df.data[2].typecode == "i"
+    assert list(df.data[2]) == [5, 5, 5]
+
+    # a new row and a new list column
+    with pytest.raises(ValueError):
+        df.set(3, "other", "x")
+    assert df.columns == ["px", "qty", "new"]
+    df.set_row(3, {"qty": 40, "new": 6})
+    df.set(3, "other", "x")
+    assert isinstance(df.data[3], list)
+    assert df.get(1, "other") is None
+
+    df.append_rows([4, 5], {"qty": [50, 60], "new": [7, 8]})
+    assert list(df.data[1]) == [10, 20, 30, 40, 50, 60]
+    assert all(isnan(x) for x in df.get([4, 5], "px", as_list=True))
+    assert all(isinstance(x, array) for x in df.data[:3])
+
+    # a value a typed column cannot hold raises with the DataFrame unchanged
+    with pytest.raises(TypeError):
+        df.append_rows([6, 7], {"qty": [None, 70], "new": [1, 2]})
+    with pytest.raises(TypeError):
+        df.append_row(6, {"qty": 2.5, "new": 1})
+    with pytest.raises(TypeError):
+        df.set_row(6, {"qty": 70, "new": "x"})
+    assert len(df) == 6
+    assert all(len(x) == 6 for x in df.data)
+    df.validate_integrity()
+
+    # new columns are added only once the row is made
+    with pytest.raises(TypeError):
+        df.append_row(6, {"qty": "x", "new": 9, "b": 5})
+    with pytest.raises(TypeError):
+        df.append_rows([6, 7], {"qty": [70, "x"], "new": [9, 10], "b": [5, 6]})
+    with pytest.raises(ValueError):
+        df.append_row(6, {"px": 1.0, "qty": 70, "b": 5})
+    assert df.columns == ["px", "qty", "new", "other"]
+    df.append_row(6, {"qty": 70, "new": 9, "b": 5})
+    df.append_rows([7], {"qty": [80], "new": [10], "c": [1.5]})
+    assert df.columns == ["px", "qty", "new", "other", "b", "c"]
+    assert df.get(6, "c") is None
+    assert df.get([6, 7], "b", as_list=True) == [5, None]
+    df.validate_integrity()
+
+
+def test_dtypes_sorted_inserts():
+    df = rc.DataFrame(
+        {"a": [1.0, 3.0, 5.0], "b": [1, 3, 5]},
+        columns=["a", "b"],
+        index=[1, 3, 5],
+        sort=True,
+        dtypes={"a": "d", "b": "q"},
+    )
+
+    df.set(4, "b", 4)
+    df.set([0, 2, 6], "b", [0, 2, 6])
+    df.set([0, 2, 6], "a", [0.0, 2.0, 6.0])
+    with pytest.raises(ValueError):
+        df.set([7, 8], "a", [7.0, 8.0])
+    assert df.index == [0, 1, 2, 3, 4, 5, 6]
+    assert list(df.data[1]) == [0, 1, 2, 3, 4, 5, 6]
+    assert df.get([0, 1, 2, 3, 5, 6], "a", as_list=True) == [0.0, 1.0, 2.0, 3.0, 5.0, 6.0]
+    assert isnan(df.get(4, "a"))
+    assert isinstance(df.data[0], array) and isinstance(df.data[1], array)
+
+    df.delete_rows([0, 4])
+    assert list(df.data[1]) == [1, 2, 3, 5, 6]
+
+    df.sort_columns("b", reverse=True)
+    assert df.index == [6, 5, 3, 2, 1]
+    assert df.data[1].typecode == "q"
+
+
+def test_dtypes_functions():
+    df = rc.DataFrame({"a": [1.0, 2.0], "b": [3, 4]}, columns=["a", "b"], index=["x", "y"], dtypes={"b": "q"})
+
+    # results keep the dtypes
+    actual = df.get(["y"], ["a", "b"])
+    assert actual.dtypes == {"b": "q"}
+    assert isinstance(actual.data[1], array)
+
+    # results of a selection of the columns only have the dtypes of those columns, so a column added later is a list
+    sorted_df = rc.DataFrame({"a": [1.0, 2.0], "b": [3, 4]}, columns=["a", "b"], dtypes={"b": "q"})
+    for actual in [
+        df.get(["y"], ["a"]),
+        df.get(["x", "y"], "a"),
+        df.get_entire_column("a"),
+        df.view(columns=["a"]).to_frame(),
+        sorted_df.get_slice(0, 1, ["a"]),
+        df.get_location(0, ["a"]),
+        df.get_location(-1, ["a"]),
+    ]:
+        assert actual.dtypes == {}
+        actual.set_column(column="b", values="z")
+        assert actual.get_entire_column("b", as_list=True) == ["z"] * len(actual)
+    actual = df.get_entire_column("b")
+    assert actual.dtypes == {"b": "q"}
+    assert actual.data[0] == array("q", [3, 4])
+    assert actual.data[0] is not df.data[1]
+
+    # json round trip
+    round_trip = rc.DataFrame.from_json(df.to_json())
+    assert_frame_equal(round_trip, df)
+    assert isinstance(round_trip.data[1], array)
+
+    assert "b" in str(df)
+    assert list(df.itertuples()) == [("x", 1.0, 3), ("y", 2.0, 4)]
+
+    df.rename_columns({"b": "c"})
+    assert df.dtypes == {"c": "q"}
+    df.columns = ["d", "e"]
+    assert df.dtypes == {"e": "q"}
+    df.set(["z"], "e", [5])
+    assert isinstance(df.data[1], array)
+    df.delete_columns("e")
+    assert df.dtypes == {}
+
+
+def test_dtypes_blocked():
+    df = rc.DataFrame({"a": [1.0, 2.0], "b": [3, 4]}, columns=["a", "b"], dtypes={"a": "d"}, storage="blocked")
+    assert isinstance(df.data[0], array)
+    assert isinstance(df.data[1], rc.blocked_list.BlockedList)
+    df.set(5, "b", 5)
+    assert list(df.data[0])[:2] == [1.0, 2.0]
@@ -646,3 +646,29 @@ def test_tail():
     assert_frame_equal(df.tail(2), rc.DataFrame({1: [1, 2], 2: [4, 5]}, columns=[1, 2], index=[1, 2], sort=False))
     assert_frame_equal(df.tail(3), rc.DataFrame({1: [0, 1, 2], 2: [3, 4, 5]}, columns=[1, 2], sort=False))
     assert_frame_equal(df.tail(999), rc.DataFrame({1: [0, 1, 2], 2: [3, 4, 5]}, columns=[1, 2], sort=False))
+
+
+def test_get_results_are_copies():
+    df = rc.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, columns=["a", "b"], index=[10, 11, 12], sort=True)
+
+    results = [
+        df.get_rows([True, True, True], "a"),
+        df.get_matrix([10, 11, 12], ["a", "b"]),
+        df.get_slice(10, 12),
+        df.head(3),
+        df.tail(3),
+        df.get_location(0, ["a"]),
+    ]
+    for result in results:
+        result.set_cell(10, "a", 100)
+        result.append_row(13, {"a": 7})
+    assert df.get_entire_column("a", as_list=True) == [1, 2, 3]
+    assert df.index == [10, 11, 12]
+
+    # results of lists of index values are in index order for sorted DataFrames and cannot have duplicates
+    assert df.get_matrix([12, 10], ["b"]).index == [10, 12]
+    assert df.get_rows([12, 10], "b").data == [[4, 6]]
+    with pytest.raises(ValueError):
+        df.get_matrix([10, 10], ["a"])
+    with pytest.raises(ValueError):
+        df.get_rows([10, 10], "a")
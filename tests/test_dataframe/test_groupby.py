@@ -0,0 +1,115 @@
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def make_frame(sort=False):
+    return rc.DataFrame(
+        {
+            "sym": ["b", "a", "b", "c", "a", "b"],
+            "side": ["buy", "buy", "sell", "buy", "sell", "buy"],
+            "qty": [10, 20, 30, 40, None, 60],
+            "px": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        },
+        columns=["sym", "side", "qty", "px"],
+        sort=sort,
+    )
+
+
+def test_agg():
+    df = make_frame()
+    actual = df.groupby("sym").agg({"qty": "sum", "px": ["min", "max", "mean"], "*": "count"})
+    expected = rc.DataFrame(
+        {
+            "qty": [20, 100, 40],
+            ("px", "min"): [2.0, 1.0, 4.0],
+            ("px", "max"): [5.0, 6.0, 4.0],
+            ("px", "mean"): [3.5, 10 / 3, 4.0],
+            "count": [2, 3, 1],
+        },
+        columns=["qty", ("px", "min"), ("px", "max"), ("px", "mean"), "count"],
+        index=["a", "b", "c"],
+        index_name="sym",
+        sort=True,
+    )
+    assert_frame_equal(actual, expected)
+
+    # None values are not included by the built-in reducers
+    actual = df.groupby("sym").agg({"qty": ["count", "first", "last", "min"]})
+    assert actual.get_entire_column(("qty", "count"), as_list=True) == [1, 3, 1]
+    assert actual.get_entire_column(("qty", "first"), as_list=True) == [20, 10, 40]
+    assert actual.get_entire_column(("qty", "last"), as_list=True) == [20, 60, 40]
+    assert df.groupby("side").agg({"qty": "min"}).to_dict() == {"side": ["buy", "sell"], "qty": [10, 30]}
+
+    # groups in order of first appearance
+    actual = df.groupby("sym", sort=False).agg({"*": "count"})
+    assert actual.index == ["b", "a", "c"]
+    assert actual.sort is False
+
+
+def test_multiple_keys():
+    df = make_frame()
+    actual = df.groupby(["sym", "side"]).agg({"px": "sum"})
+    assert actual.index_name == ("sym", "side")
+    assert actual.index == [("a", "buy"), ("a", "sell"), ("b", "buy"), ("b", "sell"), ("c", "buy")]
+    assert actual.get_entire_column("px", as_list=True) == [2.0, 5.0, 7.0, 3.0, 4.0]
+
+
+def test_custom_reducers():
+    df = make_frame()
+
+    def spread(values):
+        return max(values) - min(values)
+
+    actual = df.groupby("sym").agg({"px": [spread, "max"], "qty": len})
+    assert actual.columns == [("px", "spread"), ("px", "max"), "qty"]
+    assert actual.get_entire_column(("px", "spread"), as_list=True) == [3.0, 5.0, 0.0]
+    assert actual.get_entire_column("qty", as_list=True) == [2, 3, 1]
+
+
+def test_sorted_keys():
+    # sorted frame with the key values in order so the groups are slices
+    df = rc.DataFrame(
+        {"day": [1, 1, 2, 2, 2, 3], "qty": [1, 2, 3, 4, 5, 6]},
+        columns=["day", "qty"],
+        index=[10, 11, 12, 13, 14, 15],
+        sort=True,
+        dtypes={"qty": "q"},
+    )
+    actual = df.groupby("day").agg({"qty": ["sum", "first"], "*": "count"})
+    assert actual.index == [1, 2, 3]
+    assert actual.to_dict(index=False) == {("qty", "sum"): [3, 12, 6], ("qty", "first"): [1, 3, 6], "count": [2, 3, 1]}
+
+    # same result as the hash grouping
+    unsorted = rc.DataFrame(df.to_dict(index=False), columns=["day", "qty"], sort=False)
+    assert_frame_equal(unsorted.groupby("day").agg({"qty": ["sum", "first"], "*": "count"}), actual)
+
+    # None keys cannot be compared, so they are grouped by hashing in the order they first appear
+    df = rc.DataFrame({"day": [1, 1, None, 2, None], "qty": [1, 2, 3, 4, 5]}, columns=["day", "qty"], sort=True)
+    actual = df.groupby("day").agg({"qty": "sum"})
+    assert actual.index == [1, None, 2]
+    assert actual.to_dict(index=False) == {"qty": [3, 8, 4]}
+    assert not actual.sort
+    assert df.groupby("day", sort=False).agg({"qty": "sum"}).index == [1, None, 2]
+
+    # empty
+    actual = df.get_slice(100, 200).groupby("day").agg({"qty": "sum"})
+    assert len(actual) == 0
+    assert actual.columns == ["qty"]
+
+
+def test_errors():
+    df = make_frame()
+    with pytest.raises(ValueError):
+        df.groupby("bad")
+    with pytest.raises(ValueError):
+        df.groupby([])
+    with pytest.raises(ValueError):
+        df.groupby("sym").agg({"bad": "sum"})
+    with pytest.raises(ValueError):
+        df.groupby("sym").agg({"qty": "median"})
+    with pytest.raises(ValueError):
+        df.groupby("sym").agg({"*": "sum"})
+    with pytest.raises(TypeError):
+        df.groupby("sym").agg({"qty": [1]})
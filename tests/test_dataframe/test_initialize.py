@@ -1,6 +1,7 @@
 import pytest
 
 import raccoon as rc
+from raccoon.utils import assert_frame_equal
 
 
 def test_default_empty_init():
@@ -175,3 +176,42 @@ def test_bad_initialization():
     # bad data type
     with pytest.raises(TypeError):
         rc.DataFrame(data=[1, 2, 3]) # type: ignore
+
+
+def test_from_columns():
+    a = [1, 2, 3]
+    index = ["x", "y", "z"]
+    actual = rc.DataFrame.from_columns([a, [4.5, 5.5, 6.5]], ["a", "b"], index, index_name="key")
+    expected = rc.DataFrame(
+        {"a": [1, 2, 3], "b": [4.5, 5.5, 6.5]}, columns=["a", "b"], index=["x", "y", "z"], index_name="key", sort=False
+    )
+    assert_frame_equal(actual, expected)
+    # lists in the right container are not copied
+    assert actual.data[0] is a
+    assert actual.index is index
+
+    # default index, dtypes and blocked storage
+    actual = rc.DataFrame.from_columns([[1, 2], [3, 4]], ["a", "b"], storage="blocked", dtypes={"b": "q"})
+    expected = rc.DataFrame({"a": [1, 2], "b": [3, 4]}, columns=["a", "b"], storage="blocked", dtypes={"b": "q"})
+    assert_frame_equal(actual, expected)
+
+    # validate sorts the index
+    actual = rc.DataFrame.from_columns([[3, 1, 2]], ["a"], [30, 10, 20], sort=True)
+    assert actual.index == [10, 20, 30]
+    assert actual.data == [[1, 2, 3]]
+
+    # without validate the inputs are trusted
+    actual = rc.DataFrame.from_columns([[3, 1, 2]], ["a"], [30, 10, 20], sort=False, validate=False)
+    assert actual.index == [30, 10, 20]
+    assert actual.get(10, "a") == 1
+
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_columns([[1, 2], [3]], ["a", "b"])
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_columns([[1, 2]], ["a"], [1, 1])
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_columns([[1, 2]], ["a", "a"])
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_columns([[1, 2]], ["a", "b"])
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_columns([[1, 2]], ["a"], dtypes={"a": "x"})
@@ -0,0 +1,92 @@
+import ctypes
+from datetime import datetime, timezone
+
+import pytest
+
+import raccoon as rc
+from raccoon.interchange import ColumnNullType, DtypeKind
+
+
+def read_buffer(buffer, ctype, count):
+    return list((ctype * count).from_address(buffer.ptr))
+
+
+def test_interchange():
+    df = rc.DataFrame(
+        {"a": [1, 2, 3], "b": [1.5, None, 2.5], "c": ["x", None, "zé"], "d": [True, False, True], "q": [4, 5, 6]},
+        columns=["a", "b", "c", "d", "q"],
+        index=["r1", "r2", "r3"],
+        dtypes={"q": "q"},
+    )
+    frame = df.__dataframe__()
+    assert frame.num_rows() == 3
+    assert frame.num_columns() == 5
+    assert frame.num_chunks() == 1
+    assert frame.column_names() == ["a", "b", "c", "d", "q"]
+    assert frame.metadata == {"raccoon.index": ["r1", "r2", "r3"], "raccoon.index_name": "index"}
+
+    # list of ints
+    column = frame.get_column(0)
+    assert column.size() == 3
+    assert column.dtype == (DtypeKind.INT, 64, "l", "=")
+    assert column.describe_null == (ColumnNullType.NON_NULLABLE, None)
+    buffer, dtype = column.get_buffers()["data"]
+    assert read_buffer(buffer, ctypes.c_int64, 3) == [1, 2, 3]
+
+    # floats with None use a byte mask
+    column = frame.get_column_by_name("b")
+    assert column.describe_null == (ColumnNullType.USE_BYTEMASK, 0)
+    assert column.null_count == 1
+    buffers = column.get_buffers()
+    assert read_buffer(buffers["validity"][0], ctypes.c_uint8, 3) == [1, 0, 1]
+    assert read_buffer(buffers["data"][0], ctypes.c_double, 3) == [1.5, 0.0, 2.5]
+
+    # strings
+    buffers = frame.get_column_by_name("c").get_buffers()
+    assert frame.get_column_by_name("c").dtype[0] == DtypeKind.STRING
+    assert read_buffer(buffers["offsets"][0], ctypes.c_int64, 4) == [0, 1, 1, 4]
+    assert bytes(read_buffer(buffers["data"][0], ctypes.c_uint8, 4)).decode() == "xzé"
+
+    assert frame.get_column(3).dtype == (DtypeKind.BOOL, 8, "b", "=")
+
+    # typed column is exported without a copy
+    column = frame.get_column_by_name("q")
+    buffer = column.get_buffers()["data"][0]
+    assert buffer.ptr == df.data[4].buffer_info()[0]
+    assert buffer.bufsize == 24
+    df.set("r2", "q", 50)
+    assert read_buffer(buffer, ctypes.c_int64, 3) == [4, 50, 6]
+
+    assert frame.select_columns([4, 0]).column_names() == ["q", "a"]
+    assert frame.select_columns_by_name(["d"]).column_names() == ["d"]
+    assert len(list(frame.get_chunks())) == 1
+
+
+def test_interchange_errors():
+    df = rc.DataFrame({"a": [1, "x"], "b": [1.5, 2.5]}, columns=["a", "b"], dtypes={"b": "d"})
+    frame = df.__dataframe__()
+    with pytest.raises(TypeError):
+        frame.get_column(0)
+    assert frame.get_column(1).describe_null == (ColumnNullType.USE_NAN, None)
+
+    frame = df.__dataframe__(allow_copy=False)
+    with pytest.raises(RuntimeError):
+        frame.get_column(0)
+    assert frame.get_column(1).size() == 2
+
+
+def test_interchange_datetime():
+    df = rc.DataFrame(
+        {
+            "naive": [datetime(1970, 1, 1, 0, 0, 1), None],
+            "utc": [datetime(1970, 1, 2, tzinfo=timezone.utc), datetime(1970, 1, 1, tzinfo=timezone.utc)],
+        },
+        columns=["naive", "utc"],
+    )
+    frame = df.__dataframe__()
+    column = frame.get_column(0)
+    assert column.dtype == (DtypeKind.DATETIME, 64, "tsu:", "=")
+    assert read_buffer(column.get_buffers()["data"][0], ctypes.c_int64, 2) == [1000000, 0]
+    column = frame.get_column(1)
+    assert column.dtype[2] == "tsu:UTC"
+    assert read_buffer(column.get_buffers()["data"][0], ctypes.c_int64, 2) == [86400000000, 0]
@@ -0,0 +1,147 @@
+from array import array
+
+import pytest
+
+import raccoon as rc
+from raccoon.join import hash_join, merge_join
+from raccoon.utils import assert_frame_equal
+
+
+def make_frames(sort):
+    left = rc.DataFrame({"a": [1, 2, 3, 4]}, index=[10, 11, 12, 13], sort=sort)
+    right = rc.DataFrame(
+        {"b": [5.5, 6.5, 7.5], "c": ["x", "y", "z"]}, columns=["b", "c"], index=[14, 11, 13], sort=sort
+    )
+    return left, right
+
+
+@pytest.mark.parametrize("sort", [True, False])
+def test_join_index(sort):
+    left, right = make_frames(sort)
+
+    actual = left.join(right)
+    expected = rc.DataFrame(
+        {"a": [2, 4], "b": [6.5, 7.5], "c": ["y", "z"]}, columns=["a", "b", "c"], index=[11, 13], sort=sort
+    )
+    assert_frame_equal(actual, expected)
+
+    actual = left.join(right, how="left", other_columns=["c"])
+    expected = rc.DataFrame(
+        {"a": [1, 2, 3, 4], "c": [None, "y", None, "z"]}, columns=["a", "c"], index=[10, 11, 12, 13], sort=sort
+    )
+    assert_frame_equal(actual, expected)
+
+    actual = left.join(right, how="outer")
+    assert actual.index == [10, 11, 12, 13, 14]
+    assert actual.to_dict(index=False) == {
+        "a": [1, 2, 3, 4, None],
+        "b": [None, 6.5, None, 7.5, 5.5],
+        "c": [None, "y", None, "z", "x"],
+    }
+    assert actual.sort is sort
+
+    assert_frame_equal(left.join(right, how="semi"), left.get_matrix([11, 13], ["a"]))
+    assert_frame_equal(left.join(right, how="anti"), left.get_matrix([10, 12], ["a"]))
+
+    # the other way round
+    actual = right.join(left, how="left", columns=["c"])
+    assert actual.index == ([11, 13, 14] if sort else [14, 11, 13])
+    assert actual.get_entire_column("a", as_list=True) == ([2, 4, None] if sort else [None, 2, 4])
+
+
+def test_join_columns():
+    trades = rc.DataFrame(
+        {"sym": ["a", "b", "a", "c"], "qty": [1, 2, 3, 4]}, columns=["sym", "qty"], index=[5, 6, 7, 8], sort=True
+    )
+    info = rc.DataFrame(
+        {"sym": ["a", "b", "b", "d"], "qty": [10, 20, 21, 40], "desc": ["A", "B", "B2", "D"]},
+        columns=["sym", "qty", "desc"],
+        sort=False,
+    )
+
+    actual = trades.join(info, on="sym")
+    expected = rc.DataFrame(
+        {
+            "sym": ["a", "b", "b", "a"],
+            "qty": [1, 2, 2, 3],
+            "qty_other": [10, 20, 21, 10],
+            "desc": ["A", "B", "B2", "A"],
+        },
+        columns=["sym", "qty", "qty_other", "desc"],
+    )
+    assert_frame_equal(actual, expected)
+
+    actual = trades.join(info, on="sym", how="outer", columns=["qty"], other_columns=["desc"], rsuffix="_r")
+    assert actual.columns == ["sym", "qty", "desc"]
+    assert actual.to_dict(index=False) == {
+        "sym": ["a", "b", "b", "a", "c", "d"],
+        "qty": [1, 2, 2, 3, 4, None],
+        "desc": ["A", "B", "B2", "A", None, "D"],
+    }
+
+    assert trades.join(info, on="sym", how="semi").index == [5, 6, 7]
+    assert trades.join(info, on="sym", how="anti").index == [8]
+
+    # multiple key columns
+    actual = trades.join(info, on=["sym", "qty"], how="left")
+    assert actual.get_entire_column("desc", as_list=True) == [None, None, None, None]
+    info.set_cell(0, "qty", 3)
+    actual = trades.join(info, on=["sym", "qty"])
+    assert actual.to_dict(index=False) == {"sym": ["a"], "qty": [3], "desc": ["A"]}
+
+
+def test_join_typed():
+    left = rc.DataFrame({"a": [1, 2, 3]}, index=[1, 2, 3], dtypes={"a": "q"}, storage="blocked")
+    right = rc.DataFrame({"b": [1.5, 2.5]}, index=[2, 4], dtypes={"b": "d"})
+    actual = left.join(right, how="inner")
+    assert actual.dtypes == {"a": "q", "b": "d"}
+    assert actual.storage == "blocked"
+    assert actual.data == [array("q", [2]), array("d", [1.5])]
+
+    # an integer typed column with missing values becomes a list column
+    actual = left.join(right, how="outer")
+    assert actual.dtypes == {"b": "d"}
+    assert actual.data[0] == [1, 2, 3, None]
+    assert actual.get_entire_column("b", as_list=True)[1::2] == array("d", [1.5, 2.5])
+    assert left.dtypes == {"a": "q"}
+
+    # the same index on both sides
+    right = rc.DataFrame({"b": [4, 5, 6]}, index=[1, 2, 3])
+    assert_frame_equal(
+        left.join(right),
+        rc.DataFrame(
+            {"a": [1, 2, 3], "b": [4, 5, 6]}, columns=["a", "b"], index=[1, 2, 3], dtypes={"a": "q"}, storage="blocked"
+        ),
+    )
+    assert len(left.join(right, how="anti")) == 0
+
+    # the key column keeps its dtype when it is not in columns
+    left = rc.DataFrame({"k": [1, 2], "a": [3, 4]}, dtypes={"k": "q"})
+    right = rc.DataFrame({"k": [2, 3], "b": [5, 6]}, dtypes={"k": "q"})
+    actual = left.join(right, on="k", how="outer", columns=["a"])
+    assert actual.columns == ["k", "a", "b"]
+    assert actual.dtypes == {"k": "q"}
+    assert actual.data == [array("q", [1, 2, 3]), [3, 4, None], [None, 5, 6]]
+
+
+def test_errors():
+    left, right = make_frames(True)
+    with pytest.raises(ValueError):
+        left.join(right, how="cross")
+    with pytest.raises(ValueError):
+        left.join(right, on="a")
+    with pytest.raises(ValueError):
+        left.join(right, other_columns=["bad"])
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer", "semi", "anti"])
+def test_merge_matches_hash(how):
+    left = [1, 2, 2, 4, 6, 6, 9]
+    right = [0, 2, 2, 3, 6, 7, 9, 10]
+    merged = merge_join(left, right, how)
+    hashed = hash_join(left, right, how)
+    if merged[1] is None:
+        assert merged == hashed
+    else:
+        pairs = sorted(zip(*merged), key=str)
+        assert pairs == sorted(zip(*hashed), key=str)
@@ -0,0 +1,124 @@
+import os
+from array import array
+
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def test_journal(tmp_path):
+    path = str(tmp_path / "frame.journal")
+    df = rc.DataFrame({"a": [1, 2], "b": ["x", "y"]}, columns=["a", "b"], index=[1, 2], sort=True)
+    journal = df.attach_journal(path, sync_every=3)
+    assert df.journal is journal
+    assert journal.generation == 1
+    assert os.path.exists(path + ".checkpoint")
+
+    with pytest.raises(ValueError):
+        df.attach_journal(path)
+
+    df.set_cell(3, "a", 5)
+    df.set_row(1, {"b": "z"})
+    df.set_column([2, 4], "c", [7.5, 8.5])
+    df.set([True, False, True, False], "a", 0)
+    df.append_row(10, {"a": 9})
+    df.append_rows([11, 12], {"b": ["p", "q"]})
+    df.delete_rows([2])
+    df.set_location(0, {"a": -1})
+    df.rename_columns({"c": "cc"})
+    df.append(rc.DataFrame({"a": [20]}, index=[20]))
+    df.delete_columns("cc")
+    journal.sync()
+
+    assert_frame_equal(rc.DataFrame.replay(path), df)
+    assert journal.generation == 1
+
+    df.delete_all_rows()
+    journal.sync()
+    assert_frame_equal(rc.DataFrame.replay(path), df)
+
+    df.detach_journal()
+    assert df.journal is None
+    assert journal.closed
+    with pytest.raises(ValueError):
+        df.detach_journal()
+
+    # changes after the detach are not recorded
+    df.set_cell(1, "a", 1)
+    assert len(rc.DataFrame.replay(path)) == 0
+
+
+def test_journal_checkpoint(tmp_path):
+    path = str(tmp_path / "frame.journal")
+    df = rc.DataFrame({"a": [3, 1, 2]}, index=["c", "a", "b"], sort=False)
+    journal = df.attach_journal(path)
+    df.set_cell("d", "a", 4)
+    size = journal.size
+
+    # changes to the whole index take a checkpoint and start a new log
+    df.sort_index()
+    assert journal.generation == 2
+    assert journal.size < size
+    df.set_cell("e", "a", 5)
+    df.index_name = "letter"
+    assert journal.generation == 3
+    df.set_cell("e", "a", 6)
+    journal.sync()
+    assert_frame_equal(rc.DataFrame.replay(path), df)
+
+    # a checkpoint is taken when the log grows past checkpoint_bytes
+    df.detach_journal()
+    journal = df.attach_journal(path, checkpoint_bytes=200)
+    for i in range(20):
+        df.set_cell("e", "a", i)
+    assert journal.generation > 1
+    assert journal.size < 200
+    journal.sync()
+    assert rc.DataFrame.replay(path).get("e", "a") == 19
+    df.detach_journal()
+
+
+def test_journal_recovery(tmp_path):
+    path = str(tmp_path / "frame.journal")
+    df = rc.DataFrame({"a": [1, 2]}, columns=["a"], sort=True)
+    df.attach_journal(path, sync_every=1)
+    df.append_row(2, {"a": 3})
+    df.append_row(3, {"a": 4})
+    df.journal.close()
+
+    # a partly written record at the end is ignored and cut off when the journal is attached again
+    size = os.path.getsize(path)
+    with open(path, "ab") as file:
+        file.write(b"\x10\x00\x00\x00\x00\x00\x00\x00partial")
+    actual = rc.DataFrame.replay(path, attach=True)
+    assert_frame_equal(actual, df)
+    assert os.path.getsize(path) == size
+
+    actual.append_row(4, {"a": 5})
+    actual.detach_journal()
+    assert rc.DataFrame.replay(path).get_entire_column("a", as_list=True) == [1, 2, 3, 4, 5]
+
+    # a log left from an older generation by a crash during a checkpoint is skipped
+    with open(path, "rb") as file:
+        old_log = file.read()
+    df = rc.DataFrame.replay(path, attach=True)
+    df.sort_index()
+    df.journal.close()
+    with open(path, "wb") as file:
+        file.write(old_log)
+    assert rc.DataFrame.replay(path).get_entire_column("a", as_list=True) == [1, 2, 3, 4, 5]
+
+    with pytest.raises(ValueError):
+        rc.DataFrame({"a": [1]}).attach_journal(path, sync_every=0)
+
+
+def test_journal_append_typed(tmp_path):
+    path = str(tmp_path / "frame.journal")
+    df = rc.DataFrame({"a": [1], "b": [2]}, columns=["a", "b"], index=[0], sort=True, dtypes={"a": "q", "b": "q"})
+    df.attach_journal(path)
+    df.append(rc.DataFrame({"b": [6, 4], "a": [5, 3]}, columns=["b", "a"], index=[2, 1]))
+    df.journal.sync()
+    assert df.to_dict(index=False) == {"a": array("q", [1, 3, 5]), "b": array("q", [2, 4, 6])}
+    assert_frame_equal(rc.DataFrame.replay(path), df)
+    df.detach_journal()
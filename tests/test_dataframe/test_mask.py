@@ -0,0 +1,82 @@
+import pytest
+
+import raccoon as rc
+from raccoon.mask import is_mask
+from raccoon.utils import assert_frame_equal
+
+
+def test_mask():
+    mask = rc.Mask([True, False, True])
+    assert mask == [True, False, True]
+    assert isinstance(mask, list)
+    assert repr(mask) == "Mask([True, False, True])"
+
+    other = rc.Mask([True, True, False])
+    assert (mask & other) == [True, False, False]
+    assert (mask | other) == [True, True, True]
+    assert ~mask == [False, True, False]
+    assert isinstance(mask & other, rc.Mask)
+    assert isinstance(mask | [False, False, False], rc.Mask)
+    assert isinstance(~mask, rc.Mask)
+
+    with pytest.raises(ValueError):
+        _ = mask & [True]
+
+
+def test_is_mask():
+    assert is_mask(rc.Mask([True, False]))
+    assert is_mask(rc.Mask())
+    assert is_mask([True, False])
+    assert not is_mask([])
+    assert not is_mask([True, 1])
+    assert not is_mask([1, True])
+
+
+def test_mask_results():
+    df = rc.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "x", "y"]}, index=[10, 11, 12, 13], columns=["a", "b"])
+
+    for mask in [
+        df.select_index(11),
+        df.isin("b", ["x"]),
+        df.equality("b", value="y"),
+        df.gt("a", value=2),
+        df.lt("a", value=2),
+        df.between("a", low=2, high=3),
+    ]:
+        assert isinstance(mask, rc.Mask)
+
+    mask = df.gt("a", value=1) & df.equality("b", value="y")
+    assert mask == [False, True, False, True]
+
+    assert_frame_equal(
+        df.get(mask), rc.DataFrame({"a": [2, 4], "b": ["y", "y"]}, index=[11, 13], columns=["a", "b"], sort=False)
+    )
+    assert df.get(mask, "a", as_list=True) == [2, 4]
+    assert df.get(~mask, ["a"]).index == [10, 12]
+
+    df.set(mask, "a", 0)
+    assert df.data[0] == [1, 0, 3, 0]
+
+    with pytest.raises(ValueError):
+        df.get(rc.Mask([True]), "a")
+
+    df.delete_rows(df.isin("b", ["x"]))
+    assert df.index == [11, 13]
+
+
+def test_series_mask_results():
+    srs = rc.Series([1, 2, 3], index=["a", "b", "c"])
+
+    assert isinstance(srs.select_index("b"), rc.Mask)
+    assert isinstance(srs.isin([1]), rc.Mask)
+    assert isinstance(srs.equality(value=2), rc.Mask)
+
+    mask = ~srs.isin([2])
+    assert srs.get(mask, as_list=True) == [1, 3]
+    srs.set(mask, 0)
+    assert srs.data == [0, 2, 0]
+    srs.delete(mask)
+    assert srs.index == ["b"]
+
+    view = rc.ViewSeries([1, 2, 3], index=["a", "b", "c"])
+    assert view.value(rc.Mask([False, True, True])) == [2, 3]
@@ -0,0 +1,90 @@
+import operator
+from array import array
+from math import isnan
+
+import pytest
+
+import raccoon as rc
+from raccoon import math_utils
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    monkeypatch.setattr(math_utils, "np", None)
+
+
+def make_df():
+    return rc.DataFrame(
+        {
+            "px": [1.5, -2.25, 3.0, float("nan"), 0.1],
+            "qty": [10, -20, 30, 2**40, 7],
+            "small": [1, 2, 3, 4, 5],
+            "big": [2**62, 1, 2, 3, 2**53 + 1],
+            "list": [1.5, -2.25, 3.0, float("nan"), 0.1],
+        },
+        columns=["px", "qty", "small", "big", "list"],
+        dtypes={"px": "d", "qty": "q", "small": "B", "big": "q"},
+    )
+
+
+def results(df):
+    res = []
+    for func in ["add", "subtract", "multiply", "divide"]:
+        for left, right in [("px", "qty"), ("qty", "small"), ("big", "big"), ("big", "px"), ("list", "small")]:
+            res.append(getattr(df, func)(left, right))
+            res.append(getattr(df, func)(left, right, [1, 3]))
+        for left, value in [("px", 2), ("qty", 3), ("qty", 2.5), ("big", 2**62), ("big", 0.5), ("list", 3)]:
+            res.append(getattr(df, func)(left, value=value))
+    for func in ["gt", "lt"]:
+        for column, value in [("px", 1.5), ("qty", 10), ("qty", 10.5), ("big", 2**53), ("big", 2.0**53), ("list", 1)]:
+            res.append(getattr(df, func)(column, value=value))
+    for column, low, high in [("px", 0, 3), ("qty", -20, 2**40), ("big", 1.5, 2.0**53), ("list", 0.1, 1.5)]:
+        res.append(df.between(column, low=low, high=high))
+        res.append(df.between(column, [0, 1, 4], low=low))
+    return res
+
+
+def same(a, b):
+    if isinstance(a, float) and isinstance(b, float) and isnan(a) and isnan(b):
+        return True
+    return type(a) is type(b) and a == b
+
+
+def check_same(expected, actual):
+    assert len(expected) == len(actual)
+    for exp, act in zip(expected, actual):
+        assert isinstance(act, list)
+        assert len(exp) == len(act)
+        assert all(same(x, y) for x, y in zip(exp, act))
+
+
+def test_pure_python(no_numpy):
+    df = make_df()
+    assert df.add("small", "qty") == [11, -18, 33, 2**40 + 4, 12]
+    assert df.multiply("big", "big")[0] == 2**124
+    assert df.gt("big", value=2.0**53) == [True, False, False, False, True]
+
+    with pytest.raises(ZeroDivisionError):
+        df.divide("px", value=0.0)
+
+
+def test_numpy_identical(monkeypatch):
+    pytest.importorskip("numpy")
+    df = make_df()
+    actual = results(df)
+    monkeypatch.setattr(math_utils, "np", None)
+    expected = results(df)
+    check_same(expected, actual)
+
+
+def test_numpy_used():
+    pytest.importorskip("numpy")
+    values = array("d", [1.0, 2.0, 3.0])
+    assert math_utils._numpy_op(operator.add, values, values, scalar=False) == [2.0, 4.0, 6.0]
+    assert math_utils._numpy_op(operator.gt, values, 2, scalar=True) == [False, False, True]
+    assert math_utils._numpy_op(operator.truediv, values, 0, scalar=True) is None
+    assert math_utils._numpy_op(operator.add, [1.0, 2.0, 3.0], 1, scalar=True) is None
+    assert math_utils._numpy_op(operator.mul, array("q", [2**40]), array("q", [2**40]), scalar=False) is None
+
+    with pytest.raises(ZeroDivisionError):
+        math_utils.scalar_op(operator.truediv, values, 0)
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import raccoon as rc
+from raccoon.join import asof_join
+
+
+def make_frames():
+    trades = rc.DataFrame(
+        {"sym": ["a", "b", "a", "b", "a"], "qty": [1, 2, 3, 4, 5]},
+        columns=["sym", "qty"],
+        index=[2, 5, 6, 9, 12],
+        sort=True,
+    )
+    quotes = rc.DataFrame(
+        {"sym": ["a", "b", "a", "b"], "px": [10.0, 20.0, 11.0, 21.0]},
+        columns=["sym", "px"],
+        index=[1, 4, 6, 10],
+        sort=True,
+        dtypes={"px": "d"},
+    )
+    return trades, quotes
+
+
+def test_merge_asof():
+    trades, quotes = make_frames()
+
+    actual = trades.merge_asof(quotes)
+    assert actual.index == [2, 5, 6, 9, 12]
+    assert actual.columns == ["sym", "qty", "sym_other", "px"]
+    assert actual.get_entire_column("sym_other", as_list=True) == ["a", "b", "a", "a", "b"]
+    assert list(actual.get_entire_column("px", as_list=True)) == [10.0, 20.0, 11.0, 11.0, 21.0]
+    assert actual.dtypes == {"px": "d"}
+    assert actual.sort is True
+
+    actual = trades.merge_asof(quotes, direction="forward", other_columns=["px"])
+    assert actual.columns == ["sym", "qty", "px"]
+    assert str(list(actual.get_entire_column("px", as_list=True))) == "[20.0, 11.0, 11.0, 21.0, nan]"
+
+    actual = trades.merge_asof(quotes, direction="nearest", other_columns=["px"])
+    assert list(actual.get_entire_column("px", as_list=True)) == [10.0, 20.0, 11.0, 21.0, 21.0]
+
+    # tolerance
+    actual = trades.merge_asof(quotes, tolerance=1, other_columns=["px"])
+    assert str(list(actual.get_entire_column("px", as_list=True))) == "[10.0, 20.0, 11.0, nan, nan]"
+
+
+def test_by():
+    trades, quotes = make_frames()
+    actual = trades.merge_asof(quotes, by="sym")
+    assert actual.columns == ["sym", "qty", "px"]
+    assert list(actual.get_entire_column("px", as_list=True)) == [10.0, 20.0, 11.0, 20.0, 11.0]
+
+    quotes.set_cell(0, "sym", "c")
+    actual = trades.merge_asof(quotes, by=["sym"], direction="forward", other_columns=["px"])
+    assert str(list(actual.get_entire_column("px", as_list=True))) == "[11.0, 21.0, 11.0, 21.0, nan]"
+
+
+def test_datetime():
+    start = datetime(2024, 1, 1, 9, 30)
+    trades = rc.DataFrame({"qty": [1, 2]}, index=[start + timedelta(seconds=x) for x in (5, 65)], sort=True)
+    quotes = rc.DataFrame({"px": [1.0, 2.0]}, index=[start, start + timedelta(seconds=60)], sort=True)
+    actual = trades.merge_asof(quotes, tolerance=timedelta(seconds=3))
+    assert actual.get_entire_column("px", as_list=True) == [None, None]
+    actual = trades.merge_asof(quotes, tolerance=timedelta(seconds=5))
+    assert actual.get_entire_column("px", as_list=True) == [1.0, 2.0]
+
+
+def test_errors():
+    trades, quotes = make_frames()
+    with pytest.raises(ValueError):
+        trades.merge_asof(quotes, direction="sideways")
+    with pytest.raises(ValueError):
+        trades.merge_asof(quotes, other_columns=["bad"])
+    quotes.sort = False
+    with pytest.raises(RuntimeError):
+        trades.merge_asof(quotes)
+
+
+def test_asof_join():
+    left = [0, 1, 3, 3, 7, 10]
+    right = [1, 2, 2, 5, 8]
+    assert asof_join(left, right) == [None, 0, 2, 2, 3, 4]
+    assert asof_join(left, right, "forward") == [0, 0, 3, 3, 4, None]
+    assert asof_join(left, right, "nearest") == [0, 0, 2, 2, 4, 4]
+    assert asof_join(left, right, "nearest", tolerance=1) == [0, 0, 2, 2, 4, None]
+    assert asof_join([], right) == []
+    assert asof_join(left, []) == [None] * 6
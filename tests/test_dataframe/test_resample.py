@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import raccoon as rc
+from raccoon.resample import bucket_start, to_freq
+from raccoon.utils import assert_frame_equal
+
+
+def make_ticks():
+    start = datetime(2024, 1, 2, 9, 30)
+    seconds = [0.1, 0.5, 0.9, 1.2, 3.0, 3.5]
+    return rc.DataFrame(
+        {"px": [10.0, 12.0, 9.0, 11.0, 13.0, 12.5], "qty": [1, 2, 3, 4, 5, 6]},
+        columns=["px", "qty"],
+        index=[start + timedelta(seconds=x) for x in seconds],
+        index_name="time",
+        sort=True,
+    )
+
+
+def test_resample():
+    df = make_ticks()
+    start = datetime(2024, 1, 2, 9, 30)
+    actual = df.resample("1s", {"px": "ohlc", "qty": "sum", "*": "count"})
+    expected = rc.DataFrame(
+        {
+            ("px", "open"): [10.0, 11.0, 13.0],
+            ("px", "high"): [12.0, 11.0, 13.0],
+            ("px", "low"): [9.0, 11.0, 12.5],
+            ("px", "close"): [9.0, 11.0, 12.5],
+            "qty": [6, 4, 11],
+            "count": [3, 1, 2],
+        },
+        columns=[("px", "open"), ("px", "high"), ("px", "low"), ("px", "close"), "qty", "count"],
+        index=[start, start + timedelta(seconds=1), start + timedelta(seconds=3)],
+        index_name="time",
+        sort=True,
+    )
+    assert_frame_equal(actual, expected)
+
+    actual = df.resample(timedelta(seconds=2), {"px": ["first", "last", "max"], "qty": "min"})
+    assert actual.index == [start, start + timedelta(seconds=2)]
+    assert actual.to_dict(index=False) == {
+        ("px", "first"): [10.0, 13.0],
+        ("px", "last"): [11.0, 12.5],
+        ("px", "max"): [12.0, 13.0],
+        "qty": [1, 5],
+    }
+
+
+def test_int_index():
+    df = rc.DataFrame({"a": [1, 2, 3, 4, 5]}, index=[100, 105, 110, 119, 250], sort=True, dtypes={"a": "q"})
+    actual = df.resample(10, {"a": ["sum", "count"]})
+    assert actual.index == [100, 110, 250]
+    assert actual.to_dict(index=False) == {("a", "sum"): [3, 7, 5], ("a", "count"): [2, 2, 1]}
+    assert len(rc.DataFrame(columns=["a"], sort=True).resample(10, {"a": "sum"})) == 0
+
+
+def test_resampler():
+    df = make_ticks()
+    start = datetime(2024, 1, 2, 9, 30)
+    resampler = df.resampler("1s", {"px": "ohlc", "*": "count"})
+    bars = resampler.update()
+    assert len(bars) == 3
+
+    # new rows in the last bucket and in new buckets
+    df.append_row(start + timedelta(seconds=3.9), {"px": 14.0, "qty": 7})
+    df.append_row(start + timedelta(seconds=5), {"px": 8.0, "qty": 8})
+    assert resampler.update() is bars
+    assert_frame_equal(bars, df.resample("1s", {"px": "ohlc", "*": "count"}))
+    assert bars.get_entire_column("count", as_list=True) == [3, 1, 3, 1]
+    assert resampler.update() is bars
+
+    # a column replaced by set_column() is followed
+    df.set_column(column="px", values=[x * 2 for x in df.get_entire_column("px", as_list=True)])
+    df.append_row(start + timedelta(seconds=5.5), {"px": 1.0, "qty": 9})
+    assert resampler.update() is bars
+    last = bars.get_location(-1, as_dict=True)
+    assert last == df.resample("1s", {"px": "ohlc", "*": "count"}).get_location(-1, as_dict=True)
+    assert last[("px", "open")] == 16.0 and last[("px", "close")] == 1.0
+
+    # the data is restarted
+    df.delete_all_rows()
+    df.append_row(start, {"px": 1.0, "qty": 1})
+    assert resampler.update().to_dict(index=False) == {
+        ("px", "open"): [1.0],
+        ("px", "high"): [1.0],
+        ("px", "low"): [1.0],
+        ("px", "close"): [1.0],
+        "count": [1],
+    }
+
+
+def test_freq():
+    assert to_freq("5min") == timedelta(minutes=5)
+    assert to_freq("ms") == timedelta(milliseconds=1)
+    assert to_freq(" 2h ") == timedelta(hours=2)
+    assert to_freq(5) == 5
+    with pytest.raises(ValueError):
+        to_freq("5 weeks")
+    with pytest.raises(ValueError):
+        to_freq(0)
+    with pytest.raises(ValueError):
+        to_freq(timedelta(0))
+
+    assert bucket_start(datetime(2024, 1, 2, 9, 31, 7), timedelta(minutes=5)) == datetime(2024, 1, 2, 9, 30)
+    assert bucket_start(-3, 10) == -10
+
+
+def test_errors():
+    df = make_ticks()
+    with pytest.raises(ValueError):
+        df.resample("1s", {"bad": "sum"})
+    df.sort = False
+    with pytest.raises(RuntimeError):
+        df.resample("1s", {"px": "last"})
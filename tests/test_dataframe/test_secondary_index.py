@@ -0,0 +1,184 @@
+import random
+from math import nan
+
+import pytest
+
+import raccoon as rc
+from raccoon.secondary_index import KINDS, HashIndex, SecondaryIndex, SortedIndex
+from raccoon.utils import assert_frame_equal
+
+
+def assert_index(df, column, values):
+    for value in values:
+        expected = [x == value for x in df.get_entire_column(column, as_list=True)]
+        assert list(df.equality(column, value=value)) == expected
+        assert df.where(column, value, as_view=True).rows == [i for i, x in enumerate(expected) if x]
+
+
+@pytest.mark.parametrize("kind", ["hash", "sorted"])
+def test_create_index(kind):
+    df = rc.DataFrame({"sym": ["a", "b", "a", "c"], "qty": [1, 2, 3, 4]}, columns=["sym", "qty"], sort=False)
+    df.create_index("sym", kind=kind)
+    assert df.secondary_indexes == {"sym": kind}
+    assert_index(df, "sym", ["a", "b", "c", "d", 1])
+
+    assert list(df.isin("sym", ["a", "c", "x"])) == [True, False, True, True]
+    assert_frame_equal(
+        df.where("sym", "a"),
+        rc.DataFrame({"sym": ["a", "a"], "qty": [1, 3]}, columns=["sym", "qty"], index=[0, 2], sort=False),
+    )
+
+    # cells set, rows appended and changes that move rows
+    df.set_cell(1, "sym", "a")
+    df.set_row(0, {"sym": "c"})
+    df.set_location(-1, {"sym": "d"})
+    assert_index(df, "sym", ["a", "b", "c", "d"])
+    df.set_column([2, 3], "sym", ["b", "b"])
+    df.set_column([True, False, False, False], "sym", ["e"])
+    assert_index(df, "sym", ["a", "b", "e"])
+    df.append_row(10, {"sym": "a", "qty": 5})
+    df.append_rows([11, 12], {"sym": ["e", "f"], "qty": [6, 7]})
+    df.set_cell(13, "qty", 8)
+    assert_index(df, "sym", ["a", "b", "e", "f", None])
+    df.delete_rows([0, 3])
+    assert_index(df, "sym", ["a", "b", "e", "f", None])
+    df.sort_columns("qty", reverse=True)
+    assert_index(df, "sym", ["a", "b", "e", "f", None])
+    df.set_column(column="sym", values=["z"] * len(df))
+    assert_index(df, "sym", ["z", "a"])
+
+    # rename and delete columns
+    df.rename_columns({"sym": "symbol"})
+    assert df.secondary_indexes == {"symbol": kind}
+    df.columns = ["s", "q"]
+    assert df.secondary_indexes == {"s": kind}
+    df.delete_columns("s")
+    assert df.secondary_indexes == {}
+
+
+def test_sorted_dataframe():
+    df = rc.DataFrame({"sym": ["a", "b", "c"]}, index=[2, 4, 6], sort=True)
+    df.create_index("sym", kind="sorted")
+    df.set_cell(3, "sym", "b")
+    df.set_column([1, 5, 7], "sym", ["c", "a", "a"])
+    assert df.index == [1, 2, 3, 4, 5, 6, 7]
+    assert_index(df, "sym", ["a", "b", "c", None])
+    df.append_row(8, {"sym": "b"})
+    assert_index(df, "sym", ["a", "b", "c", None])
+
+    assert list(df.between("sym", None, "b", "c")) == [
+        x in ("b", "c") for x in df.get_entire_column("sym", as_list=True)
+    ]
+    assert list(df.between("sym", None, high="a")) == [x == "a" for x in df.get_entire_column("sym", as_list=True)]
+
+
+def test_errors():
+    df = rc.DataFrame({"a": [1, 2]})
+    with pytest.raises(ValueError):
+        df.create_index("a", kind="tree")
+    with pytest.raises(ValueError):
+        df.create_index("b")
+    with pytest.raises(ValueError):
+        df.drop_index("a")
+    df.create_index("a")
+    df.drop_index("a")
+    assert df.secondary_indexes == {}
+
+    # hash indexes need hashable values
+    df = rc.DataFrame({"a": [[1], [2]]})
+    with pytest.raises(TypeError):
+        df.create_index("a")
+
+    # values that cannot be compared are not in a sorted index
+    df = rc.DataFrame({"a": [1, 2]})
+    df.create_index("a", kind="sorted")
+    assert list(df.equality("a", value="x")) == [False, False]
+    assert list(df.isin("a", ["x", 2])) == [False, True]
+
+    # a value the typed column cannot hold leaves the index matching the data
+    df = rc.DataFrame({"a": [1, 2]}, dtypes={"a": "q"})
+    df.create_index("a")
+    with pytest.raises(TypeError):
+        df.set_cell(0, "a", "x")
+    with pytest.raises(TypeError):
+        df.set_row(1, {"a": 1.5})
+    assert_index(df, "a", [1, 2, "x", 1.5])
+
+
+def test_where_without_index():
+    df = rc.DataFrame({"a": [1, 2, 1], "b": [4, 5, 6]}, columns=["a", "b"])
+    assert df.where("a", 1).to_dict(index=False) == {"a": [1, 1], "b": [4, 6]}
+    assert df.where("a", 3).index == []
+
+
+@pytest.mark.parametrize("kind", [HashIndex, SortedIndex])
+def test_index_classes(kind):
+    index = kind()
+    assert not index.built
+    index.add(0, "a")  # not built so ignored
+    index.build(["b", "a", "b", nan] if kind is HashIndex else ["b", "a", "b", None])
+    assert index.built
+    assert index.locations("b") == [0, 2]
+    assert index.locations_in(["a", "b", "x"]) == [0, 1, 2]
+    index.add(4, "a")
+    index.replace(0, "b", "a")
+    assert index.locations("a") == [0, 1, 4]
+    assert index.locations("b") == [2]
+
+    index.add(5, None)
+    assert index.locations(None) == ([3, 5] if kind is SortedIndex else [5])
+    index.replace(5, None, "b")
+    assert index.locations("b") == [2, 5]
+
+    # inserts and deletes shift the locations of the rows after them
+    index.insert([0, 2, 2], ["b", None, "c"])
+    assert index.locations("a") == [1, 2, 7]
+    assert index.locations("b") == [0, 5, 8]
+    assert index.locations("c") == [4]
+    assert index.locations(None) == ([3, 6] if kind is SortedIndex else [3])
+    index.delete([0, 2, 4])
+    assert index.locations("a") == [0, 4]
+    assert index.locations("b") == [2, 5]
+    assert index.locations("c") == []
+    assert index.locations(None) == ([1, 3] if kind is SortedIndex else [1])
+    assert index.built
+
+    with pytest.raises(TypeError):
+        SecondaryIndex()
+
+
+@pytest.mark.parametrize("kind", ["hash", "sorted"])
+def test_index_kept_on_insert_and_delete(kind):
+    df = rc.DataFrame({"sym": ["a", "b", "a", None]}, index=[2, 4, 6, 8], sort=True)
+    df.create_index("sym", kind=kind)
+    assert_index(df, "sym", ["a", "b", None])
+    df.set_cell(5, "sym", "b")
+    df.set_column([1, 3, 7, 9], "sym", ["c", "a", None, "b"])
+    df.append_row(10, {"sym": "c"})
+    df.delete_rows([2, 7])
+    df.delete_rows(df.equality("sym", value="c"))
+    assert df.index == [3, 4, 5, 6, 8, 9]
+    assert df.secondary_indexes == {"sym": kind}
+    assert df._secondary_indexes["sym"].built
+    assert_index(df, "sym", ["a", "b", "c", None])
+
+    # many inserts and deletes at random locations match an index built from the column
+    rng = random.Random(3)
+    for _ in range(50):
+        new = rng.sample(range(100), 3)
+        df.set_column([x for x in new if x not in df.index] or [0], "sym", rng.choice("abcd"))
+        df.delete_rows(rng.sample(df.index, 2))
+    assert df._secondary_indexes["sym"].built
+    expected = KINDS[kind]()
+    expected.build(df.get_entire_column("sym", as_list=True))
+    for value in ["a", "b", "c", "d", None]:
+        assert df._secondary_indexes["sym"].locations(value) == expected.locations(value)
+
+
+def test_hash_index_nan():
+    # NaN is not equal to itself so replacing it clears the index
+    index = HashIndex()
+    index.build([nan, 1.0])
+    index.replace(0, float("nan"), 2.0)
+    assert not index.built
+    assert index.locations(1.0) == []
@@ -0,0 +1,195 @@
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from math import isnan
+
+import pytest
+
+import raccoon as rc
+from raccoon.blocked_list import BlockedList
+from raccoon.serialize import MappedColumn
+from raccoon.utils import assert_frame_equal
+
+
+def test_bytes():
+    df = rc.DataFrame(
+        {
+            "int": [1, -2, 2**62],
+            "float": [1.5, None, -3.25],
+            "bool": [True, False, None],
+            "str": ["a", "", "héllo"],
+            "none": [None, None, None],
+            "object": [{"a": 1}, [1, 2], 3],
+        },
+        columns=["int", "float", "bool", "str", "none", "object"],
+        index=[4, 5, 6],
+        index_name="number",
+        sort=True,
+    )
+    actual = rc.DataFrame.from_bytes(df.to_bytes())
+    assert_frame_equal(df, actual)
+    assert [type(x) for x in actual.get_entire_column("bool", as_list=True)] == [bool, bool, type(None)]
+
+    # empty
+    df = rc.DataFrame()
+    assert_frame_equal(df, rc.DataFrame.from_bytes(df.to_bytes()))
+    df = rc.DataFrame(columns=["a", "b"], sort=False)
+    assert_frame_equal(df, rc.DataFrame.from_bytes(df.to_bytes()))
+
+    with pytest.raises(ValueError):
+        rc.DataFrame.from_bytes(b"not a raccoon file")
+
+
+def test_bytes_types():
+    tz = timezone(timedelta(hours=-5))
+    df = rc.DataFrame(
+        {
+            "naive": [datetime(2020, 1, 1, 9, 30, 0, 1), datetime(1900, 12, 31), None],
+            "aware": [datetime(2020, 1, 1, 9, 30, tzinfo=tz), None, datetime(1969, 7, 20, 20, 17, tzinfo=tz)],
+            "date": [date(2020, 1, 1), date(1, 1, 1), None],
+            "mixed_tz": [datetime(2020, 1, 1), datetime(2020, 1, 1, tzinfo=timezone.utc), None],
+            "nul": ["a\x00b", "c", None],
+            "big": [2**64, 1, 2],
+            "tuple": [(1, "a"), None, (3, "c")],
+        },
+        columns=["naive", "aware", "date", "mixed_tz", "nul", "big", "tuple"],
+    )
+    actual = rc.DataFrame.from_bytes(df.to_bytes())
+    assert_frame_equal(df, actual)
+    assert actual.get(2, "aware").utcoffset() == timedelta(hours=-5)
+
+
+def test_bytes_multi_index():
+    df = rc.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"]},
+        columns=["a", "b"],
+        index=[("a", 1, 2.5), ("a", 2, 3.5), ("b", 1, 1.5)],
+        index_name=("first", "second", "third"),
+        sort=False,
+    )
+    actual = rc.DataFrame.from_bytes(df.to_bytes())
+    assert_frame_equal(df, actual)
+    assert actual.index_name == ("first", "second", "third")
+    assert actual.get(("a", 2, 3.5), "b") == "y"
+
+
+def test_bytes_dtypes():
+    df = rc.DataFrame(
+        {"px": [1.5, 2.5, float("nan")], "qty": [10, 20, 30], "small": [1, 2, 3]},
+        columns=["px", "qty", "small"],
+        dtypes={"px": "d", "qty": "q", "small": "b"},
+        storage="blocked",
+    )
+    actual = rc.DataFrame.from_bytes(df.to_bytes())
+    assert actual.dtypes == {"px": "d", "qty": "q", "small": "b"}
+    assert actual.storage == "blocked"
+    assert isinstance(actual.index, BlockedList)
+    assert [isinstance(x, array) for x in actual.data] == [True, True, True]
+    assert actual.data[2].typecode == "b"
+    assert list(actual.data[1]) == [10, 20, 30]
+    assert isnan(actual.get(2, "px"))
+
+    # the loaded DataFrame works as normal
+    actual.append_row(3, {"px": 4.5, "qty": 40, "small": 4})
+    assert list(actual.get_entire_column("qty", as_list=True)) == [10, 20, 30, 40]
+
+
+def test_save_load(tmp_path):
+    df = rc.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}, columns=["a", "b"], index=[10, 11, 12])
+    path = str(tmp_path / "frame.rc")
+    df.save(path)
+    actual = rc.DataFrame.load(path)
+    assert_frame_equal(df, actual)
+
+
+def test_open_mmap(tmp_path):
+    df = rc.DataFrame(
+        {
+            "a": [1, 2, None, 4],
+            "b": ["w", "x", None, "zé"],
+            "c": [1.5, 2.5, 3.5, 4.5],
+            "d": [datetime(2020, 1, 1), datetime(2020, 1, 2), None, datetime(2020, 1, 4)],
+            "e": [{"a": 1}, None, [1], 2],
+        },
+        columns=["a", "b", "c", "d", "e"],
+        index=[10, 11, 12, 13],
+        sort=True,
+        dtypes={"c": "d"},
+    )
+    path = str(tmp_path / "frame.rc")
+    df.save(path)
+    actual = rc.DataFrame.open_mmap(path)
+    assert isinstance(actual.index, MappedColumn)
+    assert all(isinstance(x, MappedColumn) for x in actual.data)
+    assert actual.index == [10, 11, 12, 13]
+    assert actual.data == df.data
+    assert actual.sort is True
+
+    # getters
+    assert actual.get(13, "b") == "zé"
+    assert actual.get(12, "a") is None
+    assert_frame_equal(actual.get([10, 12], ["a", "d"]), df.get([10, 12], ["a", "d"]))
+    assert_frame_equal(actual.get_slice(11, 12), df.get_slice(11, 12))
+    assert_frame_equal(actual.get_location(-1), df.get_location(-1))
+    assert list(actual.iterrows()) == list(df.iterrows())
+    assert list(actual.itertuples()) == list(df.itertuples())
+
+    # read only
+    with pytest.raises(TypeError):
+        actual.set(10, "a", 5)
+    with pytest.raises(TypeError):
+        actual.append_row(14, {"a": 5})
+    with pytest.raises(TypeError):
+        actual.delete_rows([10])
+
+
+def test_open_mmap_unsorted(tmp_path):
+    df = rc.DataFrame(
+        {"a": list(range(10000)), "b": ["x%s" % i for i in range(10000)]},
+        columns=["a", "b"],
+        index=[("k", 9999 - i) for i in range(10000)],
+        sort=False,
+    )
+    path = str(tmp_path / "frame.rc")
+    df.save(path)
+    actual = rc.DataFrame.open_mmap(path)
+    assert actual.get(("k", 0), "b") == "x9999"
+    assert actual.data[1][-2:] == ["x9998", "x9999"]
+    assert actual.data[1][::5000] == ["x0", "x5000"]
+    assert list(actual.index)[:2] == [("k", 9999), ("k", 9998)]
+    with pytest.raises(IndexError):
+        actual.data[0][10000]
+
+    # read only, every method that changes the DataFrame raises before anything is changed
+    for method, args in [
+        ("append_row", (("k", -1), {"a": 1})),
+        ("append_rows", ([("k", -1)], {"a": [1]})),
+        ("delete_columns", ("b",)),
+        ("rename_columns", ({"b": "c"},)),
+        ("sort_index", ()),
+        ("sort_columns", ("a",)),
+        ("reset_index", ()),
+        ("delete_all_rows", ()),
+    ]:
+        with pytest.raises(TypeError):
+            getattr(actual, method)(*args)
+    with pytest.raises(TypeError):
+        actual.columns = ["c", "d"]
+    with pytest.raises(TypeError):
+        actual.index_name = "key"
+    assert actual.columns == ["a", "b"]
+    assert len(actual) == 10000
+    with pytest.raises(ValueError):
+        actual.get_cell(("k", -1), "a")
+
+    column = actual.get_entire_column("b", as_list=True)
+    assert isinstance(column, list)
+    assert column[:2] == ["x0", "x1"]
+
+    actual.close()
+    assert len(actual) == 0
+    with pytest.raises(TypeError):
+        actual.append_row(("k", -1), {"a": 1})
+    with rc.DataFrame.open_mmap(path) as frame:
+        assert frame.get(("k", 0), "a") == 9999
+    assert len(frame) == 0
+    assert frame._mmap.closed
@@ -499,6 +499,50 @@ def test_append_rows():
         actual.append_rows([16, 17], {"a": [14, 15, 999]})
 
 
+def test_append_duplicates_sorted():
+    actual = rc.DataFrame({"a": [1, 3, 5]}, index=[10, 12, 14], sort=True)
+
+    # duplicates in the middle and at the end of the index are found
+    with pytest.raises(IndexError):
+        actual.append_row(12, {"a": 9})
+    with pytest.raises(IndexError):
+        actual.append_row(14, {"a": 9})
+    with pytest.raises(IndexError):
+        actual.append_rows([15, 10], {"a": [8, 9]})
+
+    # duplicates inside the new indexes
+    with pytest.raises(IndexError):
+        actual.append_rows([20, 20], {"a": [8, 9]})
+
+    # nothing was changed by the failed appends
+    assert_frame_equal(actual, rc.DataFrame({"a": [1, 3, 5]}, index=[10, 12, 14], sort=True))
+
+    actual.append_row(16, {"a": 7})
+    actual.append_rows([18, 20], {"a": [9, 11]})
+    assert_frame_equal(actual, rc.DataFrame({"a": [1, 3, 5, 7, 9, 11]}, index=[10, 12, 14, 16, 18, 20], sort=True))
+
+    # once the index is out of order duplicates are still found
+    actual.append_row(13, {"a": 0})
+    with pytest.raises(IndexError):
+        actual.append_row(13, {"a": 0})
+    with pytest.raises(IndexError):
+        actual.append_row(20, {"a": 0})
+    actual.append_rows([30, 1], {"a": [0, 0]})
+    with pytest.raises(IndexError):
+        actual.append_rows([2, 1], {"a": [0, 0]})
+    assert actual.index == [10, 12, 14, 16, 18, 20, 13, 30, 1]
+    actual.sort_index()
+    assert actual.index == [1, 10, 12, 13, 14, 16, 18, 20, 30]
+    with pytest.raises(IndexError):
+        actual.append_row(13, {"a": 0})
+
+    # appending to an empty DataFrame
+    actual = rc.DataFrame(columns=["a"], sort=True)
+    actual.append_row(1, {"a": 1})
+    actual.append_rows([2, 3], {"a": [2, 3]})
+    assert actual.index == [1, 2, 3]
+
+
 def test_bar():
     df = rc.DataFrame(columns=["datetime", "open", "high", "low", "close", "volume"], sort=True)
     for x in range(10):
@@ -1,3 +1,6 @@
+import random
+from array import array
+
 import pytest
 
 import raccoon as rc
@@ -14,6 +17,21 @@ def test_sort_index():
         df, rc.DataFrame({"a": [2, 3, 1], "b": [5, 6, 4]}, columns=["a", "b"], index=[8, 9, 10], sort=False)
     )
 
+    # the index and columns are sorted in place
+    data = df.data
+    df.index = [3, 1, 2]
+    index = df.index
+    df.sort_index()
+    assert df.index is index
+    assert all(x is y for x, y in zip(df.data, data))
+    assert df.index == [1, 2, 3]
+    assert df.data == [[3, 1, 2], [6, 4, 5]]
+
+    # typed columns stay arrays
+    df = rc.DataFrame({"a": [1, 2, 3]}, index=[3, 1, 2], dtypes={"a": "q"}, sort=True)
+    assert df.index == [1, 2, 3]
+    assert df.data[0] == array("q", [2, 3, 1])
+
     # fails on mixed type columns
     df = rc.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, columns=["a", "b"], index=[10, "a", 9])
     with pytest.raises(TypeError):
@@ -43,10 +61,6 @@ def test_sort_multi_index():
 def test_sort_column():
     df = rc.DataFrame({"a": [2, 1, 3], "b": ["a", "c", "b"]}, columns=["a", "b"], index=[10, 8, 9])
 
-    # cannot sort multiple columns
-    with pytest.raises(TypeError):
-        df.sort_columns(["a", "b"])
-
     df.sort_columns("a")
     assert isinstance(df.index, list)
     assert_frame_equal(df, rc.DataFrame({"a": [1, 2, 3], "b": ["c", "a", "b"]}, columns=["a", "b"], index=[8, 10, 9]))
@@ -81,3 +95,66 @@ def test_sort_column_w_key():
     assert_frame_equal(
         df, rc.DataFrame({"a": [3, 1, 2, 4], "b": ["c", "a", "b", "d"]}, columns=["a", "b"], index=[10, 8, 9, 11])
     )
+
+
+def test_sort_multiple_columns():
+    df = rc.DataFrame(
+        {"sym": ["b", "a", "b", "a", "a"], "time": [2, 3, 1, 1, 3], "qty": [10, 20, 30, 40, 50]},
+        columns=["sym", "time", "qty"],
+        index=[0, 1, 2, 3, 4],
+        dtypes={"time": "q"},
+    )
+
+    # argsort does not move the data and equal rows keep their order
+    assert df.argsort(["sym", "time"]) == [3, 1, 4, 2, 0]
+    assert df.argsort("time") == [2, 3, 0, 1, 4]
+    assert df.argsort(["sym", "time"], ascending=[True, False]) == [1, 4, 3, 0, 2]
+    assert df.argsort(["sym", "time"], ascending=False) == [0, 2, 1, 4, 3]
+    assert df.index == [0, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        df.argsort(["sym", "time"], ascending=[True])
+    with pytest.raises(ValueError):
+        df.argsort("bad")
+
+    data = df.data
+    df.sort_columns(["sym", "time"])
+    assert df.index == [3, 1, 4, 2, 0]
+    assert df.get_entire_column("qty", as_list=True) == [40, 20, 50, 30, 10]
+    assert df.data[1] == array("q", [1, 3, 3, 1, 2])
+    assert all(x is y for x, y in zip(df.data, data))
+
+    df.sort_columns(["sym", "time"], ascending=[False, True])
+    assert df.index == [2, 0, 3, 1, 4]
+
+    # reverse flips each direction
+    df.sort_columns(["sym", "time"], ascending=[False, True], reverse=True)
+    assert df.index == [1, 4, 3, 0, 2]
+
+    # key applies to the values of each column
+    df.sort_columns(["qty"], key=lambda x: -x)
+    assert df.get_entire_column("qty", as_list=True) == [50, 40, 30, 20, 10]
+
+    # many rows, where the order has cycles of many lengths
+    rng = random.Random(11)
+    rows = [(rng.randrange(5), rng.random(), i) for i in range(500)]
+    df = rc.DataFrame(
+        {"a": [x[0] for x in rows], "b": [x[1] for x in rows], "c": [x[2] for x in rows]},
+        columns=["a", "b", "c"],
+        dtypes={"b": "d"},
+    )
+    data = df.data
+    df.sort_columns(["a", "b"], ascending=[True, False])
+    expected = sorted(rows, key=lambda x: (x[0], -x[1]))
+    assert df.index == [x[2] for x in expected]
+    assert df.to_dict(index=False) == {
+        "a": [x[0] for x in expected],
+        "b": array("d", [x[1] for x in expected]),
+        "c": [x[2] for x in expected],
+    }
+    assert all(x is y for x, y in zip(df.data, data))
+
+    # blocked storage
+    df = rc.DataFrame({"a": [2, 1, 2], "b": [3, 2, 1]}, columns=["a", "b"], storage="blocked")
+    df.sort_columns(["a", "b"])
+    assert list(df.index) == [1, 2, 0]
+    assert df.storage == "blocked"
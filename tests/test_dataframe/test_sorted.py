@@ -1,6 +1,17 @@
+import random
+from array import array
+
 import pytest
 
 import raccoon as rc
+from raccoon.blocked_list import BlockedList
+from raccoon.sort_utils import (
+    apply_permutation,
+    is_sorted,
+    merge_insert,
+    permutation_cycles,
+    sorted_insert_locations,
+)
 
 
 def test_sorted_exists():
@@ -33,3 +44,93 @@ def test_sorted_index():
 
     with pytest.raises(ValueError):
         rc.dataframe.sorted_index(a, 3)
+
+
+def test_is_sorted():
+    assert is_sorted([]) is True
+    assert is_sorted([1]) is True
+    assert is_sorted([1, 2, 2, 3]) is True
+    assert is_sorted([1, 3, 2]) is False
+    assert is_sorted(array("d", [1.0, 2.0])) is True
+    assert is_sorted(BlockedList([3, 1, 2], block_size=2)) is False
+
+
+def test_apply_permutation():
+    order = [2, 0, 1]
+    for values in ([30, 10, 20], array("q", [30, 10, 20]), BlockedList([30, 10, 20], block_size=2)):
+        container = values
+        apply_permutation(values, order)
+        assert list(values) == [20, 30, 10]
+        assert values is container
+        assert type(values) is type(container)
+
+    values = [5]
+    apply_permutation(values, [0])
+    assert values == [5]
+
+    # the values are moved along the cycles of the order
+    order = [3, 1, 0, 4, 2, 6, 5]
+    cycles = permutation_cycles(order)
+    assert cycles == [[0, 3, 4, 2], [5, 6]]
+    values = list("abcdefg")
+    apply_permutation(values, order, cycles)
+    assert values == [list("abcdefg")[i] for i in order]
+
+    order = list(range(1000))
+    random.Random(7).shuffle(order)
+    values = array("d", range(1000))
+    apply_permutation(values, order)
+    assert list(values) == order
+
+
+def test_sorted_insert_locations():
+    a = [1, 3, 5, 7]
+
+    assert sorted_insert_locations(a, []) == []
+    assert sorted_insert_locations(a, [0, 2, 4, 8, 9]) == [0, 1, 2, 4, 4]
+    assert sorted_insert_locations(a, [2, 2.5, 6]) == [1, 1, 3]
+    assert sorted_insert_locations([], [1, 2]) == [0, 0]
+
+
+def test_merge_insert():
+    a = [1, 3, 5, 7]
+    link = a
+
+    merge_insert(a, sorted_insert_locations(a, [0, 2, 4, 8, 9]), [0, 2, 4, 8, 9])
+    assert a == [0, 1, 2, 3, 4, 5, 7, 8, 9]
+    assert link is a
+
+    b = ["a", "b", "c"]
+    merge_insert(b, [0, 2, 2])
+    assert b == [None, "a", "b", None, None, "c"]
+
+    # all on the end
+    b = ["a", "b"]
+    merge_insert(b, [2, 2], ["c", "d"])
+    assert b == ["a", "b", "c", "d"]
+
+    # nothing to insert
+    merge_insert(b, [])
+    assert b == ["a", "b", "c", "d"]
+
+
+def test_bulk_insert_rows():
+    df = rc.DataFrame({"a": [1, 3, 5], "b": [10, 30, 50]}, index=[1, 3, 5], sort=True)
+    link = df.get_entire_column("b", as_list=True)
+
+    df.set_column([6, 0, 4, 2, 3], "a", [6, 0, 4, 2, 33])
+    assert df.index == [0, 1, 2, 3, 4, 5, 6]
+    assert df.get_entire_column("a", as_list=True) == [0, 1, 2, 33, 4, 5, 6]
+    assert df.get_entire_column("b", as_list=True) == [None, 10, None, 30, None, 50, None]
+    assert link is df.get_entire_column("b", as_list=True)
+
+    df.append(rc.DataFrame({"b": [15, 25], "c": ["x", "y"]}, index=[1.5, 2.5], sort=True))
+    assert df.index == [0, 1, 1.5, 2, 2.5, 3, 4, 5, 6]
+    assert df.get_entire_column("a", as_list=True) == [0, 1, None, 2, None, 33, 4, 5, 6]
+    assert df.get_entire_column("b", as_list=True) == [None, 10, 15, None, 25, 30, None, 50, None]
+    assert df.get_entire_column("c", as_list=True) == [None, None, "x", None, "y", None, None, None, None]
+
+    srs = rc.Series([1, 3], index=[1, 3], sort=True)
+    srs.set_rows([4, 0, 2, 2], [4, 0, 2, 22])
+    assert srs.index == [0, 1, 2, 3, 4]
+    assert srs.data == [0, 1, 22, 3, 4]
@@ -0,0 +1,131 @@
+from array import array
+
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_frame_equal
+
+
+def make_frame(**kwargs):
+    return rc.DataFrame(
+        {"a": [1, 2, 3, 4, 5], "b": [1.5, 2.5, 3.5, 4.5, 5.5], "c": ["v", "w", "x", "y", "z"]},
+        columns=["a", "b", "c"],
+        index=[10, 11, 12, 13, 14],
+        sort=True,
+        **kwargs,
+    )
+
+
+def test_view():
+    df = make_frame()
+    view = df.view(1, 4)
+    assert isinstance(view, rc.DataFrameView)
+    assert view.frame is df
+    assert view.rows == range(1, 4)
+    assert len(view) == 3
+    assert view.columns == ["a", "b", "c"]
+    assert view.index_name == "index"
+    assert view.sort is True
+    assert view.index == [11, 12, 13]
+    assert view.data == [[2, 3, 4], [2.5, 3.5, 4.5], ["w", "x", "y"]]
+    assert view.to_dict() == {"index": [11, 12, 13], "a": [2, 3, 4], "b": [2.5, 3.5, 4.5], "c": ["w", "x", "y"]}
+
+    # negative locations and columns
+    view = df.view(-2, columns=["c", "a"])
+    assert view.index == [13, 14]
+    assert view.data == [["y", "z"], [4, 5]]
+    assert view.to_dict(index=False) == {"c": ["y", "z"], "a": [4, 5]}
+
+    with pytest.raises(ValueError):
+        df.view(columns=["bad"])
+    with pytest.raises(TypeError):
+        rc.DataFrameView(df, rows=(1, 2))
+
+    # the view reads the parent, so changes to the values of the parent show in the view
+    view = df.view(0, 2)
+    df.set_cell(10, "a", 100)
+    assert view.get_entire_column("a") == [100, 2]
+
+
+def test_getters():
+    df = make_frame()
+    view = df.view(1)
+
+    assert view.get_location(0) == {"index": 11, "a": 2, "b": 2.5, "c": "w"}
+    assert view.get_location(-1, ["c"], index=False) == {"c": "z"}
+    assert view.get_location(1, "b") == 3.5
+    assert list(view.iterrows(index=False)) == [df.get_location(i, as_dict=True, index=False) for i in range(1, 5)]
+
+    assert view["a"] == [2, 3, 4, 5]
+    assert view[1:3].index == [12, 13]
+    assert view[["b"]].data == [[2.5, 3.5, 4.5, 5.5]]
+    assert view[::-1].index == [14, 13, 12, 11]
+    assert view[::-1].sort is False
+
+    assert view.head(2).index == [11, 12]
+    assert view.head(0).index == []
+    assert view.tail(3).index == [12, 13, 14]
+    assert view.tail(10).index == [11, 12, 13, 14]
+
+    assert view.get_slice(12, 13).index == [12, 13]
+    assert view.get_slice(stop_index=11).index == [11]
+    assert view.get_slice(0, 100).rows == range(1, 5)
+    with pytest.raises(RuntimeError):
+        view[::-1].get_slice(12, 13)
+
+
+def test_to_frame():
+    df = make_frame(dtypes={"a": "q"}, storage="blocked")
+    view = df.view(1, 3, columns=["a", "c"])
+    actual = view.to_frame()
+    expected = rc.DataFrame(
+        {"a": [2, 3], "c": ["w", "x"]},
+        columns=["a", "c"],
+        index=[11, 12],
+        sort=True,
+        storage="blocked",
+        dtypes={"a": "q"},
+    )
+    assert_frame_equal(actual, expected)
+    assert isinstance(actual.data[0], array)
+
+    # the copy does not change with the parent
+    df.set_cell(11, "a", 100)
+    assert actual.get(11, "a") == 2
+
+
+def test_as_view():
+    df = make_frame()
+
+    view = df.get_slice(11, 13, as_view=True)
+    assert view.rows == range(1, 4)
+    assert_frame_equal(view.to_frame(), df.get_slice(11, 13))
+    view = df.get_slice(12, columns=[True, False, True], as_view=True)
+    assert_frame_equal(view.to_frame(), df.get_slice(12, columns=["a", "c"]))
+
+    assert_frame_equal(df.head(2, as_view=True).to_frame(), df.head(2))
+    assert_frame_equal(df.tail(2, as_view=True).to_frame(), df.tail(2))
+    assert len(df.tail(0, as_view=True)) == 0
+
+    # lists of indexes are put in index order for sorted DataFrames
+    view = df.get_matrix([13, 11], ["b", "c"], as_view=True)
+    assert view.rows == [1, 3]
+    assert_frame_equal(view.to_frame(), df.get_matrix([13, 11], ["b", "c"]))
+    mask = [True, False, True, False, False]
+    assert_frame_equal(
+        df.get_matrix(mask, [False, True, True], as_view=True).to_frame(), df.get_matrix(mask, ["b", "c"])
+    )
+
+    view = df.get_rows([14, 10], "a", as_view=True)
+    assert view.columns == ["a"]
+    assert_frame_equal(view.to_frame(), df.get_rows([14, 10], "a"))
+
+    with pytest.raises(ValueError):
+        df.get_rows([True, False], "a", as_view=True)
+
+    # unsorted DataFrames keep the order of the list
+    df = rc.DataFrame({"a": [1, 2, 3]}, index=["c", "a", "b"], sort=False)
+    view = df.get_matrix(["b", "c"], ["a"], as_view=True)
+    assert view.index == ["b", "c"]
+    assert view.sort is False
+    assert_frame_equal(view.to_frame(), df.get_matrix(["b", "c"], ["a"]))
@@ -0,0 +1,54 @@
+import pytest
+
+import raccoon as rc
+from tests import check_aggregate
+
+
+def test_series_aggregate():
+    srs = rc.Series([4, 1, 7], index=["a", "b", "c"], sort=False)
+    assert srs.aggregate is None
+    aggregate = srs.add_aggregate()
+    assert srs.aggregate is aggregate
+    check_aggregate(aggregate, [4, 1, 7])
+
+    srs.set("b", 10)
+    srs.set("d", 2)
+    srs.set(["a", "e"], [-1, 3])
+    srs.set(srs.isin([3]), 30)
+    srs.set_location(0, 5)
+    srs.append_row("f", 8)
+    srs.append_rows(["g", "h"], [0, 9])
+    check_aggregate(aggregate, srs.data)
+
+    srs.delete(["b", "g"])
+    check_aggregate(aggregate, srs.data)
+    assert aggregate.max == 30
+
+    # a value that cannot be added to the aggregate raises before the Series is changed
+    index, data = srs.index, srs.data
+    with pytest.raises(TypeError):
+        srs.append_row("i", "x")
+    with pytest.raises(TypeError):
+        srs.append_rows(["i", "j"], [1, "x"])
+    with pytest.raises(TypeError):
+        srs.set("a", "x")
+    with pytest.raises(TypeError):
+        srs.set("i", "x")
+    with pytest.raises(TypeError):
+        srs.set(["a", "i"], [1, "x"])
+    assert srs.index == index
+    assert srs.data == data
+    check_aggregate(aggregate, srs.data)
+
+    srs.remove_aggregate()
+    assert srs.aggregate is None
+
+
+def test_series_aggregate_sorted():
+    srs = rc.Series([1, 3, 5], sort=True)
+    aggregate = srs.add_aggregate()
+
+    srs.set(10, 7)
+    srs.set([0.5, 1.5, 20], [8, 9, 10])
+    check_aggregate(aggregate, srs.data)
+    assert aggregate.mean == sum(x for x in srs.data if x is not None) / aggregate.count
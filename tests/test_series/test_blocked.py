@@ -0,0 +1,54 @@
+import pytest
+
+import raccoon as rc
+from raccoon.blocked_list import BlockedList
+from raccoon.utils import assert_series_equal
+
+
+def test_storage():
+    with pytest.raises(ValueError):
+        rc.Series([1, 2, 3], storage="bad")
+
+    srs = rc.Series([1, 2, 3], index=["a", "b", "c"], storage="blocked")
+    assert srs.storage == "blocked"
+    assert isinstance(srs.index, BlockedList)
+    assert isinstance(srs.data, BlockedList)
+
+    assert rc.Series().storage == "list"
+
+
+def test_blocked_sorted_inserts():
+    expected = rc.Series(sort=True)
+    actual = rc.Series(sort=True, storage="blocked")
+
+    for i in [5, 1, 9, 3, 7, 2, 8, 4, 6, 0]:
+        expected.set(i, i * 10)
+        actual.set(i, i * 10)
+
+    assert actual.index == list(range(10))
+    assert actual.data == expected.data
+
+    actual.set([2.5, 4.5, 20], [25, 45, 200])
+    expected.set([2.5, 4.5, 20], [25, 45, 200])
+    assert actual.to_dict() == expected.to_dict()
+
+    actual.append_row(30, 300)
+    expected.append_row(30, 300)
+    assert actual.get(4.5) == 45
+
+    actual.delete([0, 4.5, 8])
+    expected.delete([0, 4.5, 8])
+    assert actual.to_dict() == expected.to_dict()
+
+    # results keep the storage type
+    rows = actual.get([1, 2, 2.5])
+    assert rows.storage == "blocked"
+    assert_series_equal(actual.get_slice(2, 5), expected.get_slice(2, 5))
+
+    # the index can be used to select and set
+    actual.set(actual.index, 1)
+    assert actual.get(actual.index, as_list=True) == [1] * len(expected)
+
+    view = rc.ViewSeries.from_series(actual)
+    assert view.index is actual.index
+    assert view.data is actual.data
@@ -70,3 +70,23 @@ def test_delete_sort():
 
     srs.delete([True])
     assert_series_equal(srs, rc.Series(sort=False))
+
+
+def test_delete_index_lookup():
+    # lookups on an unsorted Series remain correct as rows are appended and deleted
+    srs = rc.Series([1, 2, 3, 4], index=["w", "x", "y", "z"], sort=False)
+    assert srs.get("y") == 3
+
+    srs.append_row("v", 5)
+    srs.append_rows(["t", "u"], [6, 7])
+    srs["s"] = 8
+    assert srs.get(["v", "t", "u", "s"], as_list=True) == [5, 6, 7, 8]
+
+    srs.delete(["x", "t"])
+    assert srs.index == ["w", "y", "z", "v", "u", "s"]
+    assert [srs.get(x) for x in srs.index] == [1, 3, 4, 5, 7, 8]
+    with pytest.raises(ValueError):
+        srs.get_cell("x")
+
+    srs.reset_index()
+    assert srs.get(5) == 8
@@ -0,0 +1,39 @@
+import pytest
+
+import raccoon as rc
+from raccoon.utils import assert_series_equal
+
+
+def test_resample():
+    srs = rc.Series([1.0, 3.0, 2.0, 5.0, 4.0], index=[0, 1, 2, 10, 11], data_name="px", sort=True)
+    actual = srs.resample(5)
+    assert_series_equal(actual, rc.Series([2.0, 4.0], index=[0, 10], data_name="px", sort=True))
+    assert srs.resample(5, "max").data == [3.0, 5.0]
+    assert srs.resample(5, len).data == [3, 2]
+
+    actual = srs.resample(10, "ohlc")
+    assert actual.columns == [("px", "open"), ("px", "high"), ("px", "low"), ("px", "close")]
+    assert actual.to_dict(index=False) == {
+        ("px", "open"): [1.0, 5.0],
+        ("px", "high"): [3.0, 5.0],
+        ("px", "low"): [1.0, 4.0],
+        ("px", "close"): [2.0, 4.0],
+    }
+    assert srs.resample(10, ["sum", "count"]).to_dict(index=False) == {
+        ("px", "sum"): [6.0, 9.0],
+        ("px", "count"): [3, 2],
+    }
+
+    srs.sort = False
+    with pytest.raises(RuntimeError):
+        srs.resample(5)
+
+
+def test_view_series():
+    df = rc.DataFrame({"px": [1.0, 2.0]}, index=[0, 1], sort=True)
+    srs = rc.ViewSeries.from_dataframe(df, "px")
+    resampler = srs.resampler(2, "sum")
+    assert resampler.update().get_entire_column("px", as_list=True) == [3.0]
+    df.append_row(2, {"px": 4.0})
+    df.append_row(3, {"px": 5.0})
+    assert resampler.update().get_entire_column("px", as_list=True) == [3.0, 9.0]
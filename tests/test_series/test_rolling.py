@@ -0,0 +1,78 @@
+from math import isclose, nan
+from statistics import stdev
+
+import pytest
+
+import raccoon as rc
+from raccoon.rolling import Rolling
+
+
+def check_rolling(rolling, values):
+    window = [x for x in values[-rolling.window :] if x is not None and x == x]
+    assert rolling.count == len(window)
+    assert rolling.values == window
+    assert isclose(rolling.sum, sum(window), abs_tol=1e-9)
+    assert rolling.mean == (None if not window else pytest.approx(sum(window) / len(window)))
+    assert rolling.min == (min(window) if window else None)
+    assert rolling.max == (max(window) if window else None)
+    if len(window) > 1:
+        assert isclose(rolling.std, stdev(window), abs_tol=1e-9)
+    else:
+        assert rolling.std is None
+
+
+def test_rolling():
+    with pytest.raises(ValueError):
+        Rolling([], 0)
+
+    values = []
+    rolling = Rolling(values, 3)
+    assert rolling.count == 0
+    assert rolling.sum == 0
+    assert rolling.mean is None
+    assert rolling.min is None
+    assert rolling.max is None
+    assert not rolling.is_full
+
+    for x in [5, 3, 8, 1, 1, 9, 2, 7, 7, 4, -3, 6]:
+        values.append(x)
+        check_rolling(rolling, values)
+    assert rolling.is_full
+
+    # many values between reads
+    values.extend([10.5, 2.25, 3.0, 11.0, -1.5])
+    check_rolling(rolling, values)
+
+    # None and NaN are missing values that take up a place in the window
+    for x in [None, 4, nan, None, None, 2.5, None]:
+        values.append(x)
+        check_rolling(rolling, values)
+    assert rolling.is_full
+
+    # a value that is not a number raises on every read and the values before it are only taken in once
+    values.extend([6, "x", 3])
+    with pytest.raises(TypeError):
+        rolling.sum
+    with pytest.raises(TypeError):
+        rolling.mean
+    values[-2] = 1
+    check_rolling(rolling, values)
+
+    # data that gets shorter restarts the window
+    del values[:]
+    values.extend([1, 2])
+    check_rolling(rolling, values)
+
+
+def test_view_series_rolling():
+    df = rc.DataFrame({"px": [100.0, 101.0]}, columns=["px"], sort=False)
+    view = rc.ViewSeries.from_dataframe(df, "px")
+    rolling = view.rolling(5)
+    check_rolling(rolling, [100.0, 101.0])
+
+    prices = [100.0, 101.0]
+    for i in range(2, 50):
+        px = 100 + (i * 7 % 11) - 5.5
+        df.append_row(i, {"px": px})
+        prices.append(px)
+        check_rolling(rolling, prices)
@@ -334,3 +334,33 @@ def test_append_rows():
 
     with pytest.raises(ValueError):
         actual.append_rows([1, 10], [100, 110, 120])
+
+
+def test_append_duplicates_sorted():
+    actual = rc.Series([1, 3, 5], index=[10, 12, 14], sort=True)
+
+    with pytest.raises(IndexError):
+        actual.append_row(12, 9)
+    with pytest.raises(IndexError):
+        actual.append_row(14, 9)
+    with pytest.raises(IndexError):
+        actual.append_rows([15, 10], [8, 9])
+    with pytest.raises(IndexError):
+        actual.append_rows([20, 20], [8, 9])
+    assert_series_equal(actual, rc.Series([1, 3, 5], index=[10, 12, 14], sort=True))
+
+    actual.append_row(16, 7)
+    actual.append_rows([18, 20], [9, 11])
+    assert_series_equal(actual, rc.Series([1, 3, 5, 7, 9, 11], index=[10, 12, 14, 16, 18, 20], sort=True))
+
+    # once the index is out of order duplicates are still found
+    actual.append_row(13, 0)
+    with pytest.raises(IndexError):
+        actual.append_row(13, 0)
+    actual.append_rows([30, 1], [0, 0])
+    with pytest.raises(IndexError):
+        actual.append_rows([20, 2], [0, 0])
+    actual.sort_index()
+    assert actual.index == [1, 10, 12, 13, 14, 16, 18, 20, 30]
+    with pytest.raises(IndexError):
+        actual.append_row(30, 0)
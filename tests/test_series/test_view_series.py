@@ -208,25 +208,23 @@ def test_from_df_view_breaks():
     assert srs.index is not df.index
     assert srs.data is df.get_entire_column("a", True)
 
-    # sorting index
-    df = rc.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[0, 1, 5], sort=True)
+    # sorting index is done in place so it does not break the view link
+    df = rc.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[5, 1, 0], sort=False)
     srs = rc.ViewSeries.from_dataframe(df, "a")
+    df.sort_index()
     assert srs.index is df.index
     assert srs.data is df.get_entire_column("a", True)
+    assert srs.index == [0, 1, 5]
+    assert srs.data == [3, 2, 1]
 
-    df.sort_index()
-    assert srs.index is not df.index
-    assert srs.data is not df.get_entire_column("a", True)
-
-    # sorting column
-    df = rc.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}, index=[0, 1, 5], sort=True)
+    # sorting column is done in place so it does not break the view link
+    df = rc.DataFrame({"a": [1, 2, 3], "b": [6, 5, 4]}, index=[0, 1, 5], sort=False)
     srs = rc.ViewSeries.from_dataframe(df, "a")
+    df.sort_columns("b")
     assert srs.index is df.index
     assert srs.data is df.get_entire_column("a", True)
-
-    df.sort_columns("b")
-    assert srs.index is not df.index
-    assert srs.data is not df.get_entire_column("a", True)
+    assert srs.index == [5, 1, 0]
+    assert srs.data == [3, 2, 1]
 
 
 def test_from_series_view():
@@ -293,15 +291,14 @@ def test_from_series_view_breaks():
     assert srs.index is not ins.index
     assert srs.data is ins.data
 
-    # sorting index
-    ins = rc.Series(data=[1, 2, 3], data_name="a", index=[0, 1, 5], sort=True)
+    # sorting index is done in place so it does not break the view link
+    ins = rc.Series(data=[1, 2, 3], data_name="a", index=[5, 1, 0], sort=False)
     srs = rc.ViewSeries.from_series(ins)
+    ins.sort_index()
     assert srs.index is ins.index
     assert srs.data is ins.data
-
-    ins.sort_index()
-    assert srs.index is not ins.index
-    assert srs.data is not ins.data
+    assert srs.index == [0, 1, 5]
+    assert srs.data == [3, 2, 1]
 
 
 def test_value():